@@ -5,19 +5,20 @@ Generates scores for multiple properties to support statistical validation
 """
 
 import argparse
-import csv
 import json
 import sys
 import random
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scoring.engine import calculate_score
 from features.feature_matrix import get_feature_matrix, get_default_features
+from features.batch_features import get_feature_matrix_batch, feature_records
+from scoring.result_sinks import open_result_sink, skip_completed
 
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
@@ -133,44 +134,158 @@ def generate_diverse_test_data(sample_size: int, template: str) -> List[Dict[str
     return properties
 
 
-def batch_score_properties(properties: List[Dict[str, Any]], template: str) -> List[Dict[str, Any]]:
-    """Score multiple properties and return results"""
-    results = []
+def load_parcel_features(apn_file: str) -> List[Dict[str, Any]]:
+    """Load real parcel features for every APN in a file (one APN per line)"""
+    with open(apn_file, 'r') as f:
+        apns = [line.strip() for line in f if line.strip()]
+    
+    print(f"Extracting features for {len(apns)} parcels...")
+    return feature_records(get_feature_matrix_batch(apns))
+
+
+def build_result_row(prop_features: Dict[str, Any], template: str, score_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a calculate_score result into a CSV output row"""
+    return {
+        'apn': prop_features['apn'],
+        'address': prop_features.get('site_address', 'N/A'),
+        'zoning': prop_features.get('zoning', 'N/A'),
+        'lot_size_sqft': prop_features.get('lot_size_sqft', 0),
+        'transit_score': prop_features.get('transit_score', 0),
+        'median_income': prop_features.get('median_income', 0),
+        'area_type': prop_features.get('area_type', 'unknown'),
+        'template': template,
+        'score': score_result['score'],
+        'zoning_component': score_result['component_scores'].get('zoning', 0),
+        'lot_size_component': score_result['component_scores'].get('lot_size', 0),
+        'transit_component': score_result['component_scores'].get('transit', 0),
+        'demographics_component': score_result['component_scores'].get('demographics', 0),
+        'market_component': score_result['component_scores'].get('market', 0)
+    }
+
+
+# Component score columns of a result row ('<name>_component')
+RESULT_COMPONENTS = ['zoning', 'lot_size', 'transit', 'demographics', 'market']
+
+
+def score_result_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the score and component scores parcel_scores stores from a result row"""
+    return {
+        'score': row['score'],
+        'component_scores': {name: row[f'{name}_component'] for name in RESULT_COMPONENTS}
+    }
+
+
+class ScoreDatabaseWriter:
+    """
+    Result sink wrapper that also stores every row's score in parcel_scores
+
+    Rows are forwarded to the wrapped sink unchanged and buffered for
+    DealGenieDatabase.store_scores_bulk, one transaction per flush_every rows.
+    Scores are stored before the sink flushes, so the sink's resume checkpoint
+    never moves past rows whose scores failed to store.
+    """
     
+    def __init__(self, sink, db_path: str, flush_every: int = 5000):
+        from db.database_manager import DealGenieDatabase
+        
+        self.sink = sink
+        self.db = DealGenieDatabase(db_path)
+        self.flush_every = flush_every
+        self.buffer: List[tuple] = []
+        self.rows_stored = 0
+        self.elapsed_seconds = 0.0
+        sink.before_flush = self.flush
+    
+    def write(self, row: Dict[str, Any]):
+        self._buffer([row])
+        self.sink.write(row)
+    
+    def write_many(self, rows: List[Dict[str, Any]]):
+        self._buffer(rows)
+        self.sink.write_many(rows)
+    
+    def _buffer(self, rows: List[Dict[str, Any]]):
+        self.buffer.extend((row['apn'], row['template'], score_result_from_row(row)) for row in rows)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Store buffered scores in one transaction (the buffer is kept if the write raises)"""
+        if self.buffer:
+            stats = self.db.store_scores_bulk(self.buffer)
+            self.rows_stored += stats['rows']
+            self.elapsed_seconds += stats['elapsed_seconds']
+            self.buffer = []
+    
+    @property
+    def rows_flushed(self) -> int:
+        return self.sink.rows_flushed
+    
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_stored / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+    
+    def __enter__(self):
+        self.sink.__enter__()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            try:
+                self.flush()
+            except Exception:
+                # Close the sink as failed so its checkpoint stays at the last stored rows
+                self.sink.__exit__(*sys.exc_info())
+                raise
+        else:
+            self.buffer = []  # Like the sink, drop rows past the last checkpoint
+        return self.sink.__exit__(exc_type, exc_value, traceback)
+
+
+def store_parcels(db_path: str, properties: List[Dict[str, Any]]):
+    """Store the parcels being scored so their scores satisfy the parcels foreign key"""
+    from db.database_manager import DealGenieDatabase
+    
+    stats = DealGenieDatabase(db_path).store_parcels_bulk((p['apn'], p) for p in properties)
+    print(f"Stored {stats['rows']:,} parcels in {db_path} ({stats['rows_per_second']:,.0f} rows/sec)")
+
+
+def iter_score_properties(
+    properties: List[Dict[str, Any]],
+    template: str,
+    score_cache=None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Score properties one at a time, yielding result rows as they are produced
+
+    Args:
+        properties: Parcel feature dictionaries
+        template: Scoring template
+        score_cache: Optional ScoreCache; unchanged parcels skip scoring
+    """
     print(f"Scoring {len(properties)} properties with {template} template...")
     
     for i, prop_features in enumerate(properties):
         try:
-            # Calculate score
-            score_result = calculate_score(prop_features, template)
+            # Calculate score (served from the score cache when inputs are unchanged)
+            if score_cache is not None:
+                score_result, _ = score_cache.calculate_score(prop_features, template)
+            else:
+                score_result = calculate_score(prop_features, template)
             
             # Create result record
-            result = {
-                'apn': prop_features['apn'],
-                'address': prop_features.get('site_address', 'N/A'),
-                'zoning': prop_features.get('zoning', 'N/A'),
-                'lot_size_sqft': prop_features.get('lot_size_sqft', 0),
-                'transit_score': prop_features.get('transit_score', 0),
-                'median_income': prop_features.get('median_income', 0),
-                'area_type': prop_features.get('area_type', 'unknown'),
-                'template': template,
-                'score': score_result['score'],
-                'zoning_component': score_result['component_scores'].get('zoning', 0),
-                'lot_size_component': score_result['component_scores'].get('lot_size', 0),
-                'transit_component': score_result['component_scores'].get('transit', 0),
-                'demographics_component': score_result['component_scores'].get('demographics', 0),
-                'market_component': score_result['component_scores'].get('market', 0)
-            }
-            
-            results.append(result)
+            yield build_result_row(prop_features, template, score_result)
             
             if (i + 1) % 20 == 0:
                 print(f"  Processed {i + 1}/{len(properties)} properties...")
                 
         except Exception as e:
             logger.error(f"Error scoring property {prop_features.get('apn', 'unknown')}: {e}")
-    
-    return results
+
+
+def batch_score_properties(properties: List[Dict[str, Any]], template: str) -> List[Dict[str, Any]]:
+    """Score multiple properties and return results"""
+    return list(iter_score_properties(properties, template))
 
 
 def main():
@@ -195,17 +310,42 @@ def main():
     parser.add_argument(
         '--output',
         required=True,
-        help='Output CSV file path'
+        help='Output file path (.csv, .jsonl or .parquet)'
+    )
+    parser.add_argument(
+        '--flush-every',
+        type=int,
+        default=5000,
+        help='Rows buffered before each durable flush'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted run from its last flushed APN'
     )
     parser.add_argument(
         '--use-db',
         action='store_true',
         help='Use actual database properties instead of generated test data'
     )
+    parser.add_argument(
+        '--apn-file',
+        help='Score real parcels listed in this file (one APN per line) instead of generated data'
+    )
+    parser.add_argument(
+        '--db',
+        help='Also store the parcels and their scores in this SQLite database'
+    )
+    parser.add_argument(
+        '--cache-db',
+        help='Reuse cached scores from this SQLite database when inputs are unchanged'
+    )
     
     args = parser.parse_args()
     
-    if args.use_db:
+    if args.apn_file:
+        properties = load_parcel_features(args.apn_file)
+    elif args.use_db:
         # TODO: Query actual properties from database
         print("Database mode not yet implemented, using generated test data")
         properties = generate_diverse_test_data(args.sample_size, args.template)
@@ -213,27 +353,49 @@ def main():
         # Generate test properties
         properties = generate_diverse_test_data(args.sample_size, args.template)
     
-    # Score all properties
-    results = batch_score_properties(properties, args.template)
+    # Stream results to the output sink (bounded memory, resumable)
+    sink = open_result_sink(args.output, flush_every=args.flush_every, resume=args.resume)
+    if sink.last_flushed_key is not None:
+        properties = list(skip_completed(properties, sink.last_flushed_key, key=lambda p: p['apn']))
+        print(f"Resuming after {sink.last_flushed_key} ({sink.rows_flushed} rows already written)")
     
-    # Write results to CSV
-    if results:
-        fieldnames = results[0].keys()
-        
-        with open(args.output, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-        
+    if args.db:
+        store_parcels(args.db, properties)
+        sink = ScoreDatabaseWriter(sink, args.db, flush_every=args.flush_every)
+    
+    scored = 0
+    score_sum = 0.0
+    score_min = float('inf')
+    score_max = float('-inf')
+    
+    score_cache = None
+    if args.cache_db:
+        from scoring.score_cache import ScoreCache
+        score_cache = ScoreCache(args.cache_db)
+    
+    with sink:
+        for result in iter_score_properties(properties, args.template, score_cache):
+            sink.write(result)
+            scored += 1
+            score_sum += result['score']
+            score_min = min(score_min, result['score'])
+            score_max = max(score_max, result['score'])
+    
+    if score_cache is not None:
+        print(f"Score cache hit rate: {score_cache.hit_rate():.1%}")
+        score_cache.close()
+    
+    if scored:
         print(f"\n✅ Batch scoring complete!")
         print(f"   - Template: {args.template}")
-        print(f"   - Properties scored: {len(results)}")
+        print(f"   - Properties scored: {scored}")
         print(f"   - Output file: {args.output}")
-        print(f"   - Score range: {min(r['score'] for r in results):.1f} - {max(r['score'] for r in results):.1f}")
+        if args.db:
+            print(f"   - Scores stored: {sink.rows_stored} ({sink.rows_per_second:,.0f} rows/sec)")
+        print(f"   - Score range: {score_min:.1f} - {score_max:.1f}")
         
         # Quick statistics
-        scores = [r['score'] for r in results]
-        avg_score = sum(scores) / len(scores)
+        avg_score = score_sum / scored
         print(f"   - Average score: {avg_score:.2f}")
     else:
         print("❌ No results generated")
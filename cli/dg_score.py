@@ -252,6 +252,10 @@ def main():
         '--output',
         help='Output file path (for HTML format)'
     )
+    score_parser.add_argument(
+        '--cache-db',
+        help='Reuse cached scores from this SQLite database when inputs are unchanged'
+    )
     
     args = parser.parse_args()
     
@@ -259,8 +263,14 @@ def main():
         # Get property features
         features = get_feature_matrix(args.apn)
         
-        # Calculate score
-        score_result = calculate_score(features, args.template)
+        # Calculate score (served from the score cache when inputs are unchanged)
+        if args.cache_db:
+            from scoring.score_cache import ScoreCache
+            score_cache = ScoreCache(args.cache_db)
+            score_result, _ = score_cache.calculate_score(dict(features, apn=args.apn), args.template)
+            score_cache.close()
+        else:
+            score_result = calculate_score(features, args.template)
         
         if args.format == 'json':
             # Output JSON
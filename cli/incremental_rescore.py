@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+DealGenie Incremental Rescoring Job
+
+Refreshes parcel_scores for only the parcels whose inputs changed since the last
+run. Each parcel feature row gets a content hash; the scoring configuration
+(constraints YAML, scoring_config.json, engine weights and sources, plus the
+template list) gets one run-wide hash. Both are stored per APN in
+parcel_score_state after a parcel is scored.
+
+Architecture Decision: Hash Comparison Over Timestamps
+- Assessor deltas rewrite files wholesale, so file mtimes say nothing about
+  which parcels changed; a row hash does
+- Row hashes are computed for a whole feature batch at once with
+  pandas.util.hash_pandas_object, so a no-op nightly run costs one read of the
+  parcel source plus a dictionary comparison
+- A config hash change marks every parcel stale, which is the only case that
+  still needs a full-county pass
+
+Rescored parcels (DealGenieDatabase.store_parcels_bulk), their scores (via
+store_scores_bulk, which also refreshes the top-K leaderboards) and state rows
+are written with executemany, one transaction per batch, so an interrupted run
+resumes from the last committed batch.
+
+Z-Score Statistics:
+- Each state row also records the values the parcel contributed to the
+  block_group_stats table (census geography + z-score features)
+- When the table has been built (scoring/block_group_stats.py build), changed
+  and removed parcels swap their recorded contribution for the current one and
+  the touched geographies are saved in the same transaction, so the table stays
+  current without a full rebuild
+- State rows written before contributions were recorded are left out of the
+  statistics until the next full build
+
+Usage:
+    python cli/incremental_rescore.py --db data/dealgenie.db --templates multifamily retail
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scoring.engine import calculate_template_scores
+from scoring.score_cache import scoring_config_fingerprint
+from scoring.block_group_stats import BlockGroupStatsTable, Z_SCORE_FEATURES
+from features.batch_features import iter_feature_matrix_batches, feature_records
+from features.csv_feature_matrix import DEFAULT_CSV_PATH
+from db.database_manager import DealGenieDatabase
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+ALL_TEMPLATES = ['multifamily', 'commercial', 'residential', 'industrial', 'retail', 'mixed_use', 'office']
+
+STATE_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS parcel_score_state (
+        apn VARCHAR(20) PRIMARY KEY,
+        feature_hash CHAR(16) NOT NULL,
+        config_hash CHAR(64) NOT NULL,
+        zscore_inputs TEXT,
+        scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+STATE_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO parcel_score_state (apn, feature_hash, config_hash, zscore_inputs, scored_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+
+# Bookkeeping columns that do not affect scores
+IGNORED_COLUMNS = {'found'}
+
+# Features a parcel contributes to the block_group_stats table
+ZSCORE_INPUTS = ['census_geoid', 'census_block_group'] + Z_SCORE_FEATURES
+
+# SQLite bound-parameter limit per IN (...) query
+STATE_QUERY_CHUNK = 500
+
+
+def run_config_hash(templates: List[str]) -> str:
+    """Hash of the scoring configuration and the set of templates being scored"""
+    digest = hashlib.sha256(scoring_config_fingerprint().encode('utf-8'))
+    digest.update(','.join(sorted(templates)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _stable_value(value: Any) -> Any:
+    """Hashable stand-in for a feature value (lists, dicts and sets as sorted JSON)"""
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value, key=str)
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def frame_feature_hashes(frame: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit content hash of every feature row, as 16-character hex strings
+
+    Columns are hashed in sorted order so the hash does not depend on how the
+    frame was assembled. Object columns (e.g. the list-valued
+    utility_deficiencies) are hashed through a stable JSON form, since
+    hash_pandas_object cannot hash lists or dicts.
+    """
+    columns = sorted(c for c in frame.columns if c not in IGNORED_COLUMNS)
+    hashable = frame[columns].copy()
+    for column in hashable.columns:
+        if hashable[column].dtype == object:
+            hashable[column] = hashable[column].map(_stable_value)
+    hashes = pd.util.hash_pandas_object(hashable, index=False).to_numpy(dtype=np.uint64)
+    return np.array([f"{value:016x}" for value in hashes.tolist()], dtype=object)
+
+
+def load_score_state(conn: sqlite3.Connection) -> Dict[str, Tuple[str, str]]:
+    """APN -> (feature_hash, config_hash) recorded by previous runs"""
+    conn.execute(STATE_TABLE_SQL)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(parcel_score_state)")}
+    if 'zscore_inputs' not in columns:
+        conn.execute("ALTER TABLE parcel_score_state ADD COLUMN zscore_inputs TEXT")
+        conn.commit()
+    return {apn: (feature_hash, config_hash) for apn, feature_hash, config_hash in
+            conn.execute("SELECT apn, feature_hash, config_hash FROM parcel_score_state")}
+
+
+def zscore_inputs(features: Dict[str, Any]) -> str:
+    """JSON of the values a parcel contributes to the z-score statistics"""
+    return json.dumps({key: features[key] for key in ZSCORE_INPUTS if features.get(key) is not None},
+                      sort_keys=True, default=str)
+
+
+def load_zscore_inputs(conn: sqlite3.Connection, apns: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Recorded z-score contributions of parcels that have state rows
+
+    APNs without a state row are absent; rows written before contributions
+    were recorded map to None.
+    """
+    recorded = {}
+    for i in range(0, len(apns), STATE_QUERY_CHUNK):
+        chunk = apns[i:i + STATE_QUERY_CHUNK]
+        rows = conn.execute(
+            f"SELECT apn, zscore_inputs FROM parcel_score_state WHERE apn IN ({','.join('?' * len(chunk))})",
+            chunk
+        )
+        recorded.update((apn, json.loads(inputs) if inputs else None) for apn, inputs in rows)
+    return recorded
+
+
+def update_zscore_stats(table: BlockGroupStatsTable, recorded: Dict[str, Optional[Dict[str, Any]]],
+                        current: Dict[str, Optional[Dict[str, Any]]]) -> int:
+    """
+    Swap each parcel's recorded contribution for its current one (None = removed)
+
+    Returns:
+        Number of parcels whose contribution was updated
+    """
+    updated = 0
+    for apn, features in current.items():
+        if apn in recorded and recorded[apn] is None:
+            continue  # Contribution unknown (state predates zscore_inputs); left to the next build
+        table.update_parcel(recorded.get(apn), features)
+        updated += 1
+    return updated
+
+
+def stale_mask(apns: np.ndarray, hashes: np.ndarray, state: Dict[str, Tuple[str, str]],
+               config_hash: str) -> np.ndarray:
+    """True for parcels that are new, changed, or last scored under another config"""
+    current = list(zip(hashes.tolist(), [config_hash] * len(hashes)))
+    return np.fromiter((state.get(apn) != entry for apn, entry in zip(apns.tolist(), current)),
+                       dtype=bool, count=len(apns))
+
+
+def incremental_rescore(
+    db_path: str,
+    templates: List[str],
+    frames: Optional[Iterable[pd.DataFrame]] = None,
+    csv_path: str = DEFAULT_CSV_PATH,
+    store_path: Optional[str] = None,
+    chunk_size: int = 50000,
+    full: bool = False,
+    dry_run: bool = False,
+    progress_every: int = 1
+) -> Dict[str, Any]:
+    """
+    Rescore parcels whose features or scoring configuration changed.
+
+    Args:
+        db_path: SQLite database holding parcel_scores
+        templates: Templates to score each stale parcel against
+        frames: Feature DataFrames to check (default: every parcel via iter_feature_matrix_batches)
+        csv_path: Merged parcel CSV when frames is not given
+        store_path: Optional columnar store path
+        chunk_size: Parcels read (and committed) per batch
+        full: Rescore every parcel regardless of stored hashes
+        dry_run: Only count stale parcels; write nothing
+        progress_every: Print progress every N batches
+
+    Returns:
+        Run statistics
+    """
+    start_time = time.time()
+    config_hash = run_config_hash(templates)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    state = load_score_state(conn)
+    db = DealGenieDatabase(db_path)
+    config_changed = any(entry[1] != config_hash for entry in state.values())
+
+    # Only maintain statistics that have been built; a partial table would mislead lookups
+    zscore_stats = BlockGroupStatsTable.load(db_path) if not dry_run else None
+    if zscore_stats is not None and not len(zscore_stats):
+        zscore_stats = None
+
+    if frames is None:
+        frames = iter_feature_matrix_batches(None, chunk_size, csv_path, store_path)
+
+    stats = {
+        'parcels': 0,
+        'stale': 0,
+        'rescored': 0,
+        'rows_written': 0,
+        'removed': 0,
+        'stats_updated': 0,
+        'config_changed': config_changed,
+        'config_hash': config_hash,
+    }
+    seen = set()
+
+    try:
+        for batch_number, frame in enumerate(frames, 1):
+            if frame.empty:
+                continue
+            apns = frame['apn'].astype(str).to_numpy()
+            hashes = frame_feature_hashes(frame)
+            stale = np.ones(len(frame), dtype=bool) if full else stale_mask(apns, hashes, state, config_hash)
+
+            stats['parcels'] += len(frame)
+            stats['stale'] += int(stale.sum())
+            seen.update(apns.tolist())
+
+            if stale.any() and not dry_run:
+                parcel_rows = []
+                score_rows = []
+                state_rows = []
+                contributions = {}
+                for apn, feature_hash, features in zip(apns[stale].tolist(), hashes[stale].tolist(),
+                                                       feature_records(frame.loc[stale])):
+                    for template, score_result in calculate_template_scores(features, templates).items():
+                        score_rows.append((apn, template, score_result))
+                    parcel_rows.append((apn, features))
+                    inputs = zscore_inputs(features)
+                    contributions[apn] = json.loads(inputs)
+                    state_rows.append((apn, feature_hash, config_hash, inputs))
+
+                with conn:
+                    # Parcels first: scores need the parcels row to reach the leaderboards
+                    db.store_parcels_bulk(parcel_rows, conn=conn)
+                    written = db.store_scores_bulk(score_rows, conn=conn)
+                    if zscore_stats is not None:
+                        recorded = load_zscore_inputs(conn, list(contributions))
+                        stats['stats_updated'] += update_zscore_stats(zscore_stats, recorded, contributions)
+                        zscore_stats.save(db_path, conn=conn)
+                    conn.executemany(STATE_UPSERT_SQL, state_rows)
+
+                stats['rescored'] += len(state_rows)
+                stats['rows_written'] += written['rows']
+
+            if batch_number % progress_every == 0:
+                print(f"  Checked {stats['parcels']:,} parcels, {stats['stale']:,} stale")
+
+        # Parcels that left the source no longer need state (their score history is kept)
+        removed = [apn for apn in state if apn not in seen]
+        stats['removed'] = len(removed)
+        if removed and not dry_run:
+            with conn:
+                if zscore_stats is not None:
+                    recorded = load_zscore_inputs(conn, removed)
+                    stats['stats_updated'] += update_zscore_stats(
+                        zscore_stats, recorded, {apn: None for apn in removed})
+                    zscore_stats.save(db_path, conn=conn)
+                conn.executemany("DELETE FROM parcel_score_state WHERE apn = ?", [(apn,) for apn in removed])
+    finally:
+        conn.close()
+
+    stats['elapsed_seconds'] = time.time() - start_time
+    return stats
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="DealGenie Incremental Rescoring",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument('--db', default='data/dealgenie.db', help='SQLite database holding parcel_scores')
+    parser.add_argument('--templates', nargs='+', choices=ALL_TEMPLATES, default=ALL_TEMPLATES,
+                        help='Templates to score each changed parcel against')
+    parser.add_argument('--csv', default=DEFAULT_CSV_PATH, help='Merged parcel CSV')
+    parser.add_argument('--store', help='Columnar store path (default: <csv>.features.arrow)')
+    parser.add_argument('--chunk-size', type=int, default=50000, help='Parcels per batch and transaction')
+    parser.add_argument('--full', action='store_true', help='Rescore every parcel')
+    parser.add_argument('--dry-run', action='store_true', help='Report stale parcels without scoring')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"❌ Database not found at {args.db}. Run: sqlite3 {args.db} < db/sqlite_schema.sql")
+        sys.exit(1)
+
+    print(f"Checking parcels for changes ({', '.join(args.templates)})...")
+    stats = incremental_rescore(args.db, args.templates, csv_path=args.csv, store_path=args.store,
+                                chunk_size=args.chunk_size, full=args.full, dry_run=args.dry_run)
+
+    print(f"\n✅ Incremental rescore {'dry run ' if args.dry_run else ''}complete!")
+    print(f"   - Parcels checked: {stats['parcels']:,}")
+    print(f"   - Config changed: {'yes' if stats['config_changed'] else 'no'}")
+    print(f"   - Stale parcels: {stats['stale']:,}")
+    print(f"   - Parcels rescored: {stats['rescored']:,} ({stats['rows_written']:,} score rows)")
+    print(f"   - Parcels removed from source: {stats['removed']:,}")
+    print(f"   - Z-score statistics updated for: {stats['stats_updated']:,} parcels")
+    print(f"   - Elapsed: {stats['elapsed_seconds']:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
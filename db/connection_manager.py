@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+SQLite Connection Manager for DealGenie
+
+Shares SQLite connections across the calls a thread makes instead of opening,
+configuring and closing one per query. Used by DealGenieDatabase and the week3
+FastAPI services.
+
+Architecture Decision: Cached Connections Behind close()
+- Each thread gets one connection per manager, created on first use with the
+  manager's PRAGMAs applied once (sqlite3 connections must not be used by two
+  threads at the same time)
+- Connections are PooledConnection objects whose close() only releases the
+  connection, so existing `try: ... finally: conn.close()` code reuses
+  connections unchanged. Checkouts nest: only the outermost release rolls back
+  anything uncommitted, so a helper that checks out and releases the thread's
+  connection inside a caller's open transaction leaves that transaction alone
+- A forked child discards the parent's connections and opens its own;
+  connections of exited threads are closed when the next one is opened
+- Read-only managers open `file:...?mode=ro` URIs and set query_only, so a
+  query service cannot take write locks on the database it serves
+
+AsyncSQLiteConnectionManager runs queries on a small thread pool whose threads
+each keep a cached connection, so `async def` endpoints never block the event
+loop on SQLite I/O.
+
+Usage:
+    manager = get_connection_manager("data/dealgenie.db", row_factory=sqlite3.Row)
+    conn = manager.connection()
+    try:
+        rows = conn.execute("SELECT ...").fetchall()
+    finally:
+        conn.close()  # Released for reuse, not closed
+
+    search_db = AsyncSQLiteConnectionManager("search_idx_parcel.db")
+    rows = await search_db.fetchall("SELECT ...", params)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Applied once per connection
+DEFAULT_PRAGMAS = {
+    'foreign_keys': 'ON',
+    'journal_mode': 'WAL',
+}
+
+READ_ONLY_PRAGMAS = {
+    'query_only': 'ON',
+}
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() releases it back to its manager"""
+
+    # Outstanding connection() checkouts on the owning thread
+    checkouts = 0
+
+    def checkout(self) -> 'PooledConnection':
+        """Record one more holder of the connection"""
+        self.checkouts += 1
+        return self
+
+    def close(self):
+        """
+        Release one checkout; the outermost release rolls back uncommitted changes
+
+        Inner releases leave an enclosing caller's transaction open.
+        """
+        self.checkouts = max(self.checkouts - 1, 0)
+        if self.checkouts == 0 and self.in_transaction:
+            self.rollback()
+
+    def close_connection(self):
+        """Really close the underlying connection"""
+        super().close()
+
+
+class SQLiteConnectionManager:
+    """Per-thread cached SQLite connections with PRAGMAs applied once"""
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        pragmas: Optional[Dict[str, Any]] = None,
+        row_factory: Optional[Callable] = None,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize connection manager
+
+        Args:
+            db_path: SQLite database file
+            read_only: Open connections with mode=ro URIs
+            pragmas: PRAGMAs applied to each new connection (added to the defaults)
+            row_factory: Row factory set on each new connection (e.g. sqlite3.Row)
+            timeout: Seconds to wait on a locked database
+        """
+        self.db_path = str(db_path)
+        self.read_only = read_only
+        self.pragmas = dict(READ_ONLY_PRAGMAS if read_only else DEFAULT_PRAGMAS)
+        self.pragmas.update(pragmas or {})
+        self.row_factory = row_factory
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, PooledConnection]] = []
+        self._pid = os.getpid()
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def _connect(self) -> PooledConnection:
+        if self.read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=self.timeout,
+                                   check_same_thread=False, factory=PooledConnection)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout,
+                                   check_same_thread=False, factory=PooledConnection)
+
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def connection(self) -> PooledConnection:
+        """This thread's connection, opened and configured on first use (release with close())"""
+        if os.getpid() != self._pid:
+            self._discard_inherited()
+
+        conn = getattr(self._local, 'conn', None)
+        with self._lock:
+            if conn is None:
+                self._close_orphans()
+                conn = self._connect()
+                self._local.conn = conn
+                self._connections.append((threading.current_thread(), conn))
+                self.connections_opened += 1
+            else:
+                self.connections_reused += 1
+        return conn.checkout()
+
+    @contextmanager
+    def transaction(self) -> Iterator[PooledConnection]:
+        """Yield this thread's connection; commit on success, roll back on error"""
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _discard_inherited(self):
+        # Connections must not cross fork(); abandon them without closing
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = []
+        self._pid = os.getpid()
+
+    def _close_orphans(self):
+        # Connections of threads that have exited can never be used again
+        alive = []
+        for thread, conn in self._connections:
+            if thread.is_alive():
+                alive.append((thread, conn))
+            else:
+                conn.close_connection()
+        self._connections = alive
+
+    def close(self):
+        """Close every connection this manager opened (threads reconnect on next use)"""
+        with self._lock:
+            for _, conn in self._connections:
+                try:
+                    conn.close_connection()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+            self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection counts"""
+        return {
+            'db_path': self.db_path,
+            'read_only': self.read_only,
+            'connections_open': len(self._connections),
+            'connections_opened': self.connections_opened,
+            'connections_reused': self.connections_reused,
+        }
+
+
+class AsyncSQLiteConnectionManager:
+    """Runs queries for asyncio code on worker threads with cached connections"""
+
+    def __init__(self, db_path: str, read_only: bool = True, max_workers: int = 4, **options):
+        """
+        Initialize async connection manager
+
+        Args:
+            db_path: SQLite database file
+            read_only: Open connections with mode=ro URIs (default for query services)
+            max_workers: Worker threads, i.e. concurrent queries and open connections
+            **options: Passed to SQLiteConnectionManager
+        """
+        self.manager = SQLiteConnectionManager(db_path, read_only=read_only, **options)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _call(self, fn: Callable, args: tuple) -> Any:
+        conn = self.manager.connection()
+        try:
+            return fn(conn, *args)
+        finally:
+            conn.close()
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """
+        Call fn(conn, *args) on a worker thread and await its result
+
+        Args:
+            fn: Function taking the worker's connection (plus args)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sqlite')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    async def fetchall(self, sql: str, params: Sequence = ()) -> List[Any]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetchone(self, sql: str, params: Sequence = ()) -> Optional[Any]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def execute(self, sql: str, params: Sequence = ()) -> int:
+        """Run a write statement in its own transaction; returns the affected row count"""
+        def write(conn: sqlite3.Connection) -> int:
+            with conn:
+                return conn.execute(sql, params).rowcount
+        return await self.run(write)
+
+    def close(self):
+        """Stop the worker threads and close their connections"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.manager.close()
+
+
+_managers: Dict[Tuple[str, bool, Optional[Callable]], SQLiteConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: str, read_only: bool = False,
+                           row_factory: Optional[Callable] = None, **options) -> SQLiteConnectionManager:
+    """
+    Process-wide manager for a database file
+
+    Managers are shared per (path, read_only, row_factory); other options only
+    apply when the manager is first created.
+    """
+    key = (os.path.abspath(db_path), read_only, row_factory)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = SQLiteConnectionManager(db_path, read_only=read_only, row_factory=row_factory, **options)
+            _managers[key] = manager
+        return manager
+
+
+def close_connection_managers():
+    """Close and forget every shared manager"""
+    with _managers_lock:
+        for manager in _managers.values():
+            manager.close()
+        _managers.clear()
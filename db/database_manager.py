@@ -9,13 +9,117 @@ import sqlite3
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Callable
 from pathlib import Path
 import sys
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+from db.connection_manager import get_connection_manager
+from features.feature_codec import encode_features, decode_features, is_legacy_encoding
+from db.score_leaderboard import ScoreLeaderboard, ALL, zoning_category
+
+SCORE_INSERT_SQL = '''
+    INSERT INTO parcel_scores 
+    (apn, template, overall_score, grade, location_score, infrastructure_score,
+     zoning_score, market_score, development_score, financial_score,
+     scoring_algorithm, explanation, recommendations, computation_time_ms,
+     feature_cache_hit, scored_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+
+
+def score_row_values(apn: str, template: str, score_result: Dict[str, Any],
+                     computation_time_ms: int = None, cache_hit: bool = False) -> tuple:
+    """Parameters for SCORE_INSERT_SQL from a calculate_score() result."""
+    # Determine grade from score
+    score = score_result.get('score', 0)
+    if score >= 8.0:
+        grade = 'A'
+    elif score >= 6.5:
+        grade = 'B'
+    elif score >= 5.0:
+        grade = 'C'
+    else:
+        grade = 'D'
+    
+    # Extract component scores
+    component_scores = score_result.get('component_scores', {})
+    
+    return (
+        apn, template, score,  grade,
+        component_scores.get('location', component_scores.get('demographics', 0)),
+        component_scores.get('infrastructure', component_scores.get('transit', 0)),
+        component_scores.get('zoning', 0),
+        component_scores.get('market', 0),
+        component_scores.get('development', component_scores.get('lot_size', 0)),
+        component_scores.get('financial', 0),
+        'DealGenie_v1.0',
+        score_result.get('explanation', ''),
+        json.dumps(score_result.get('recommendations', [])),
+        computation_time_ms,
+        1 if cache_hit else 0
+    )
+
+
+PARCEL_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO parcels 
+    (apn, address, city, zip_code, council_district, zoning, lot_size_sqft, assessed_value, 
+     centroid_lat, centroid_lon, data_source, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'CSV_Import', CURRENT_TIMESTAMP)
+'''
+
+
+def parcel_row_values(apn: str, features: Dict[str, Any]) -> tuple:
+    """Parameters for PARCEL_UPSERT_SQL from a get_feature_matrix() dictionary."""
+    return (
+        apn,
+        features.get('site_address', ''),
+        features.get('site_city', 'Los Angeles'),
+        features.get('site_zip', ''),
+        features.get('council_district'),
+        features.get('zoning') or None,  # NULL satisfies the zoning_codes foreign key
+        features.get('lot_size_sqft', 0),
+        features.get('assessed_land_value', 0),
+        # Add latitude/longitude if available from features
+        features.get('latitude'),
+        features.get('longitude'),
+    )
+
+
+# Zoning codes outside the seeded reference list are registered before parcels use them
+ZONING_CODE_INSERT_SQL = '''
+    INSERT OR IGNORE INTO zoning_codes (code, category) VALUES (?, ?)
+'''
+
+
+def zoning_code_values(codes: Iterable[Optional[str]]) -> List[tuple]:
+    """Parameters for ZONING_CODE_INSERT_SQL for each distinct non-empty code."""
+    return [(code, zoning_category(code)) for code in dict.fromkeys(codes) if code]
+
+
+FEATURE_CACHE_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO feature_cache
+    (apn, template, median_income, feature_vector, computed_at, expires_at, data_version)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?, '1.0')
+'''
+
+
+def feature_cache_row_values(apn: str, template: str, features: Dict[str, Any],
+                             demographics: Dict[str, Any] = None, expires_hours: int = 24) -> tuple:
+    """Parameters for FEATURE_CACHE_UPSERT_SQL."""
+    expires_at = datetime.now() + timedelta(hours=expires_hours)
+    
+    # Extract demographic data if provided
+    median_income = None
+    if demographics:
+        median_income = demographics.get('median_household_income')
+    
+    return (apn, template, median_income, encode_features(features), expires_at)
+
+
 class DealGenieDatabase:
     """
     Database manager for DealGenie SQLite database operations.
@@ -30,8 +134,12 @@ class DealGenieDatabase:
     def __init__(self, db_path: str = "data/dealgenie.db"):
         """Initialize database manager."""
         self.db_path = db_path
+        self.leaderboard = ScoreLeaderboard()
         if not self.ensure_database_exists():
             raise FileNotFoundError(f"Database not found at {self.db_path}. Run: sqlite3 data/dealgenie.db < db/sqlite_schema.sql")
+        # Shared per-thread connections; WAL + synchronous=NORMAL fsyncs only at checkpoints
+        self.connections = get_connection_manager(db_path, row_factory=sqlite3.Row,
+                                                  pragmas={'synchronous': 'NORMAL'})
     
     def ensure_database_exists(self) -> bool:
         """Ensure database exists and is properly initialized."""
@@ -42,17 +150,80 @@ class DealGenieDatabase:
         return True
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with proper configuration."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        """
+        Get this thread's database connection.
+        
+        The connection is cached with row_factory=sqlite3.Row, foreign keys and
+        WAL already configured; close() releases it for reuse. Checkouts nest,
+        so read methods called while the caller holds the connection do not
+        roll back its open transaction. Methods that write commit, so writes
+        inside a caller's transaction must go through the conn= parameters.
+        """
+        return self.connections.connection()
+    
+    def _bulk_write(self, sql: str, rows: Iterable[tuple], batch_size: int,
+                    conn: Optional[sqlite3.Connection] = None,
+                    before_batch: Optional[Callable[[sqlite3.Connection, List[tuple]], None]] = None,
+                    after_batch: Optional[Callable[[sqlite3.Connection, List[tuple]], None]] = None,
+                    label: str = 'rows') -> Dict[str, Any]:
+        """
+        Write rows with executemany in a single transaction on one connection.
         
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
+        Args:
+            sql: Parameterized statement (prepared once and reused by executemany)
+            rows: Parameter tuples (any iterable; consumed batch_size at a time)
+            batch_size: Rows per executemany call, bounding memory for generators
+            conn: Write on this connection inside the caller's transaction (no commit)
+            before_batch: Called with (conn, batch) before each batch is written
+            after_batch: Called with (conn, batch) after each batch is written
+            label: Name used in error messages
+            
+        Returns:
+            Write statistics (rows, elapsed_seconds, rows_per_second)
+            
+        Raises:
+            sqlite3.Error after rolling back (own connection) so callers never
+            mistake a failed write for an empty one
+        """
+        start_time = time.time()
+        written = 0
+        own_connection = conn is None
         
-        # Set journal mode for better performance
-        conn.execute("PRAGMA journal_mode = WAL")
+        try:
+            if own_connection:
+                conn = self.get_connection()
+                conn.execute("BEGIN")
+            
+            iterator = iter(rows)
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                if before_batch is not None:
+                    before_batch(conn, batch)
+                conn.executemany(sql, batch)
+                if after_batch is not None:
+                    after_batch(conn, batch)
+                written += len(batch)
+            
+            if own_connection:
+                conn.commit()
+                
+        except sqlite3.Error as e:
+            print(f"❌ Database error bulk storing {label}: {e}")
+            if own_connection and conn is not None:
+                conn.rollback()
+            raise
+        finally:
+            if own_connection and conn is not None:
+                conn.close()
         
-        return conn
+        elapsed = time.time() - start_time
+        return {
+            'rows': written,
+            'elapsed_seconds': elapsed,
+            'rows_per_second': written / elapsed if elapsed > 0 else 0.0
+        }
     
     # ==============================================================================
     # PARCEL DATA OPERATIONS
@@ -73,37 +244,13 @@ class DealGenieDatabase:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Extract relevant fields from features
-            parcel_data = {
-                'apn': apn,
-                'address': features.get('site_address', ''),
-                'city': features.get('site_city', 'Los Angeles'),
-                'zip_code': features.get('site_zip', ''),
-                'zoning': features.get('zoning', ''),
-                'lot_size_sqft': features.get('lot_size_sqft', 0),
-                'assessed_value': features.get('assessed_land_value', 0),
-                # Add latitude/longitude if available from features
-                'centroid_lat': features.get('latitude'),
-                'centroid_lon': features.get('longitude'),
-            }
-            
             # Insert or replace parcel data
-            cursor.execute('''
-                INSERT OR REPLACE INTO parcels 
-                (apn, address, city, zip_code, zoning, lot_size_sqft, assessed_value, 
-                 centroid_lat, centroid_lon, data_source, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'CSV_Import', CURRENT_TIMESTAMP)
-            ''', (
-                parcel_data['apn'],
-                parcel_data['address'],
-                parcel_data['city'],
-                parcel_data['zip_code'],
-                parcel_data['zoning'],
-                parcel_data['lot_size_sqft'],
-                parcel_data['assessed_value'],
-                parcel_data['centroid_lat'],
-                parcel_data['centroid_lon']
-            ))
+            values = parcel_row_values(apn, features)
+            cursor.executemany(ZONING_CODE_INSERT_SQL, zoning_code_values([values[5]]))
+            cursor.execute(PARCEL_UPSERT_SQL, values)
+            
+            # Move existing scores to the parcel's current leaderboards
+            self.leaderboard.refresh_parcels(conn, [apn])
             
             conn.commit()
             return True
@@ -114,6 +261,38 @@ class DealGenieDatabase:
         finally:
             conn.close()
     
+    def store_parcels_bulk(self, parcels: Iterable[Tuple[str, Dict[str, Any]]],
+                           batch_size: int = 5000, conn: sqlite3.Connection = None) -> Dict[str, Any]:
+        """
+        Store or update many parcels in one transaction.
+        
+        Each batch's existing scores are re-recorded on the top-K leaderboards
+        for the parcels' current zoning, ZIP and council district.
+        
+        Args:
+            parcels: (apn, features) pairs
+            batch_size: Rows per executemany call
+            conn: Optional connection whose open transaction the rows join
+            
+        Returns:
+            Write statistics (rows, elapsed_seconds, rows_per_second)
+            
+        Raises:
+            sqlite3.Error if the write fails (nothing is stored)
+        """
+        def register_zoning_codes(batch_conn: sqlite3.Connection, batch: List[tuple]):
+            batch_conn.executemany(ZONING_CODE_INSERT_SQL, zoning_code_values(row[5] for row in batch))
+        
+        def refresh_leaderboards(batch_conn: sqlite3.Connection, batch: List[tuple]):
+            # Existing scores follow zoning/ZIP/district changes and reach boards once the parcel exists
+            self.leaderboard.refresh_parcels(batch_conn, (row[0] for row in batch))
+        
+        return self._bulk_write(
+            PARCEL_UPSERT_SQL, (parcel_row_values(apn, features) for apn, features in parcels),
+            batch_size, conn, before_batch=register_zoning_codes, after_batch=refresh_leaderboards,
+            label='parcels'
+        )
+    
     def get_parcel(self, apn: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve parcel data by APN.
@@ -164,41 +343,11 @@ class DealGenieDatabase:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Determine grade from score
-            score = score_result.get('score', 0)
-            if score >= 8.0:
-                grade = 'A'
-            elif score >= 6.5:
-                grade = 'B'
-            elif score >= 5.0:
-                grade = 'C'
-            else:
-                grade = 'D'
-            
-            # Extract component scores
-            component_scores = score_result.get('component_scores', {})
+            values = score_row_values(apn, template, score_result, computation_time_ms, cache_hit)
+            cursor.execute(SCORE_INSERT_SQL, values)
             
-            cursor.execute('''
-                INSERT INTO parcel_scores 
-                (apn, template, overall_score, grade, location_score, infrastructure_score,
-                 zoning_score, market_score, development_score, financial_score,
-                 scoring_algorithm, explanation, recommendations, computation_time_ms,
-                 feature_cache_hit, scored_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                apn, template, score,  grade,
-                component_scores.get('location', component_scores.get('demographics', 0)),
-                component_scores.get('infrastructure', component_scores.get('transit', 0)),
-                component_scores.get('zoning', 0),
-                component_scores.get('market', 0),
-                component_scores.get('development', component_scores.get('lot_size', 0)),
-                component_scores.get('financial', 0),
-                'DealGenie_v1.0',
-                score_result.get('explanation', ''),
-                json.dumps(score_result.get('recommendations', [])),
-                computation_time_ms,
-                1 if cache_hit else 0
-            ))
+            # Refresh the top-K boards in the same transaction
+            self.leaderboard.record_scores(conn, [(apn, template, values[2])])
             
             conn.commit()
             return True
@@ -209,6 +358,86 @@ class DealGenieDatabase:
         finally:
             conn.close()
     
+    def store_scores_bulk(self, scores: Iterable[tuple], batch_size: int = 5000,
+                          conn: sqlite3.Connection = None) -> Dict[str, Any]:
+        """
+        Store many scoring results in one transaction.
+        
+        The top-K leaderboards are refreshed after each batch, inside the same
+        transaction.
+        
+        Args:
+            scores: (apn, template, score_result[, computation_time_ms[, cache_hit]]) tuples
+            batch_size: Rows per executemany call
+            conn: Optional connection whose open transaction the rows join
+            
+        Returns:
+            Write statistics (rows, elapsed_seconds, rows_per_second)
+            
+        Raises:
+            sqlite3.Error if the write fails (nothing is stored)
+        """
+        def refresh_leaderboards(batch_conn: sqlite3.Connection, batch: List[tuple]):
+            self.leaderboard.record_scores(batch_conn, [(row[0], row[1], row[2]) for row in batch])
+        
+        return self._bulk_write(
+            SCORE_INSERT_SQL, (score_row_values(*entry) for entry in scores),
+            batch_size, conn, after_batch=refresh_leaderboards, label='scores'
+        )
+    
+    def score_parcel(self, apn: str, template: str, features: Dict[str, Any],
+                     score_cache=None) -> Dict[str, Any]:
+        """
+        Score a parcel through the score cache and record the result.
+        
+        The cache hit/miss outcome is written to parcel_scores.feature_cache_hit.
+        
+        Args:
+            apn: Assessor Parcel Number
+            template: Development template
+            features: Feature dictionary from get_feature_matrix()
+            score_cache: ScoreCache instance (defaults to one backed by this database)
+            
+        Returns:
+            Result from calculate_score() (possibly served from cache)
+        """
+        if score_cache is None:
+            from scoring.score_cache import ScoreCache
+            if getattr(self, '_score_cache', None) is None:
+                self._score_cache = ScoreCache(self.db_path)
+            score_cache = self._score_cache
+        
+        start_time = time.time()
+        features = dict(features, apn=apn)
+        score_result, cache_hit = score_cache.calculate_score(features, template)
+        computation_time_ms = int((time.time() - start_time) * 1000)
+        
+        self.store_score(apn, template, score_result, computation_time_ms, cache_hit=cache_hit)
+        return score_result
+    
+    def get_cache_hit_statistics(self) -> Dict[str, Any]:
+        """Score cache hit/miss counts recorded in parcel_scores."""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT COALESCE(SUM(feature_cache_hit), 0) as hits,
+                       COUNT(*) - COALESCE(SUM(feature_cache_hit), 0) as misses
+                FROM parcel_scores
+            ''')
+            
+            row = dict(cursor.fetchone())
+            total = row['hits'] + row['misses']
+            row['hit_rate'] = round(row['hits'] / total, 3) if total else 0.0
+            return row
+            
+        except sqlite3.Error as e:
+            print(f"❌ Database error getting cache statistics: {e}")
+            return {}
+        finally:
+            conn.close()
+    
     def get_latest_score(self, apn: str, template: str = None) -> Optional[Dict[str, Any]]:
         """
         Get latest scoring result for an APN.
@@ -269,21 +498,8 @@ class DealGenieDatabase:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            expires_at = datetime.now() + timedelta(hours=expires_hours)
-            
-            # Extract demographic data if provided
-            median_income = None
-            if demographics:
-                median_income = demographics.get('median_household_income')
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO feature_cache
-                (apn, template, median_income, feature_vector, computed_at, expires_at, data_version)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?, '1.0')
-            ''', (
-                apn, template, median_income,
-                json.dumps(features),
-                expires_at
+            cursor.execute(FEATURE_CACHE_UPSERT_SQL, feature_cache_row_values(
+                apn, template, features, demographics, expires_hours
             ))
             
             conn.commit()
@@ -295,6 +511,31 @@ class DealGenieDatabase:
         finally:
             conn.close()
     
+    def cache_features_bulk(self, entries: Iterable[tuple], expires_hours: int = 24,
+                            batch_size: int = 5000, conn: sqlite3.Connection = None) -> Dict[str, Any]:
+        """
+        Cache computed features for many APNs in one transaction.
+        
+        Args:
+            entries: (apn, template, features[, demographics]) tuples
+            expires_hours: Cache expiration in hours
+            batch_size: Rows per executemany call
+            conn: Optional connection whose open transaction the rows join
+            
+        Returns:
+            Write statistics (rows, elapsed_seconds, rows_per_second)
+            
+        Raises:
+            sqlite3.Error if the write fails (nothing is stored)
+        """
+        def rows():
+            for apn, template, features, *demographics in entries:
+                yield feature_cache_row_values(apn, template, features,
+                                               demographics[0] if demographics else None, expires_hours)
+        
+        return self._bulk_write(FEATURE_CACHE_UPSERT_SQL, rows(), batch_size, conn,
+                                label='feature cache entries')
+    
     def get_cached_features(self, apn: str, template: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve cached features if not expired.
@@ -311,18 +552,23 @@ class DealGenieDatabase:
             cursor = conn.cursor()
             
             cursor.execute('''
-                SELECT feature_vector, computed_at, expires_at FROM feature_cache
+                SELECT id, feature_vector, computed_at, expires_at FROM feature_cache
                 WHERE apn = ? AND template = ? 
                 AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
                 ORDER BY computed_at DESC LIMIT 1
             ''', (apn, template))
             
             row = cursor.fetchone()
-            if row:
+            if row and row['feature_vector'] is not None:
                 try:
-                    return json.loads(row['feature_vector'])
-                except json.JSONDecodeError:
-                    print(f"⚠️  Invalid JSON in cached features for {apn}")
+                    features = decode_features(row['feature_vector'])
+                except ValueError:
+                    print(f"⚠️  Invalid cached feature vector for {apn}")
+                    return None
+                
+                if is_legacy_encoding(row['feature_vector']):
+                    self._reencode_cached_features(conn, row['id'], features)
+                return features
             
             return None
             
@@ -332,6 +578,17 @@ class DealGenieDatabase:
         finally:
             conn.close()
     
+    def _reencode_cached_features(self, conn: sqlite3.Connection, cache_id: int,
+                                  features: Dict[str, Any]):
+        """Rewrite a legacy JSON feature_cache row in the binary encoding."""
+        try:
+            conn.execute("UPDATE feature_cache SET feature_vector = ? WHERE id = ?",
+                         (encode_features(features), cache_id))
+            conn.commit()
+        except sqlite3.Error:
+            # Busy or read-only database: keep serving the JSON row, retry on a later read
+            conn.rollback()
+    
     # ==============================================================================
     # ANALYTICS AND REPORTING
     # ==============================================================================
@@ -394,21 +651,38 @@ class DealGenieDatabase:
         Returns:
             List of high-value opportunity records
         """
+        return self.get_top_opportunities(limit=limit, min_score=min_score)
+    
+    def get_top_opportunities(self, template: str = ALL, zoning_category: str = None,
+                              zip_code: str = None, council_district: str = None,
+                              limit: int = 50, min_score: float = None) -> List[Dict[str, Any]]:
+        """
+        Get the best-scoring parcels from a materialized leaderboard.
+        
+        At most one of zoning_category, zip_code and council_district may be given.
+        
+        Args:
+            template: Development template ('*' for all templates)
+            zoning_category: Category from db.score_leaderboard.zoning_category()
+            zip_code: ZIP code
+            council_district: Council district (e.g. 'CD 13')
+            limit: Maximum number of results
+            min_score: Optional minimum score
+            
+        Returns:
+            Latest score per (parcel, template), highest first
+        """
+        filters = {name: value for name, value in (('zoning_category', zoning_category),
+                                                   ('zip_code', zip_code),
+                                                   ('council_district', council_district))
+                   if value is not None}
+        if len(filters) > 1:
+            raise ValueError(f"Only one leaderboard dimension can be filtered at a time: {sorted(filters)}")
+        dimension, value = next(iter(filters.items()), ('all', ALL))
+        
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT p.apn, p.address, p.city, p.zoning, p.lot_size_sqft,
-                       ps.overall_score, ps.template, ps.explanation, ps.scored_at
-                FROM parcels p
-                INNER JOIN parcel_scores ps ON p.apn = ps.apn
-                WHERE ps.overall_score >= ?
-                ORDER BY ps.overall_score DESC
-                LIMIT ?
-            ''', (min_score, limit))
-            
-            return [dict(row) for row in cursor.fetchall()]
+            return self.leaderboard.top(conn, template, dimension, value, limit, min_score)
             
         except sqlite3.Error as e:
             print(f"❌ Database error getting opportunities: {e}")
@@ -416,6 +690,20 @@ class DealGenieDatabase:
         finally:
             conn.close()
     
+    def rebuild_leaderboards(self) -> bool:
+        """Recompute every leaderboard from parcel_scores (after bulk imports or deletes)."""
+        try:
+            conn = self.get_connection()
+            self.leaderboard.rebuild(conn)
+            conn.commit()
+            return True
+            
+        except sqlite3.Error as e:
+            print(f"❌ Database error rebuilding leaderboards: {e}")
+            return False
+        finally:
+            conn.close()
+    
     # ==============================================================================
     # MAINTENANCE OPERATIONS
     # ==============================================================================
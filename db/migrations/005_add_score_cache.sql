@@ -0,0 +1,21 @@
+-- DealGenie Score Cache Migration
+-- Migration: 005_add_score_cache.sql
+-- Description: Persistent tier of the score result cache (scoring/score_cache.py)
+
+BEGIN TRANSACTION;
+
+-- ==============================================================================
+-- SCORE CACHE TABLE
+-- ==============================================================================
+-- Latest scoring result per APN/template, valid while both fingerprints match
+CREATE TABLE IF NOT EXISTS score_cache (
+    apn VARCHAR(20) NOT NULL,
+    template VARCHAR(50) NOT NULL,
+    feature_hash CHAR(64) NOT NULL,   -- SHA-256 of canonical feature JSON
+    config_hash CHAR(64) NOT NULL,    -- SHA-256 of weights, YAML constraints, engine sources
+    result_json TEXT NOT NULL,        -- JSON as text
+    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apn, template)
+);
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- DealGenie Block Group Statistics Migration
+-- Migration: 006_add_block_group_stats.sql
+-- Description: Full-universe z-score statistics per census geography (scoring/block_group_stats.py)
+
+BEGIN TRANSACTION;
+
+-- ==============================================================================
+-- BLOCK GROUP STATISTICS TABLE
+-- ==============================================================================
+-- Sufficient statistics (count, sum, sum of squares) per geography and feature;
+-- additive, so changed parcels update their geography in place
+CREATE TABLE IF NOT EXISTS block_group_stats (
+    geo_level VARCHAR(20) NOT NULL,   -- block_group or tract
+    geoid VARCHAR(12) NOT NULL,       -- 12-digit block group / 11-digit tract GEOID
+    feature VARCHAR(50) NOT NULL,
+    value_count REAL NOT NULL,
+    value_sum REAL NOT NULL,
+    value_sum_sq REAL NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (geo_level, geoid, feature)
+);
+
+COMMIT;
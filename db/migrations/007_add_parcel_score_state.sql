@@ -0,0 +1,18 @@
+-- DealGenie Incremental Rescoring Migration
+-- Migration: 007_add_parcel_score_state.sql
+-- Description: Per-parcel input hashes used by cli/incremental_rescore.py
+
+BEGIN TRANSACTION;
+
+-- ==============================================================================
+-- PARCEL SCORE STATE TABLE
+-- ==============================================================================
+-- Feature row hash and scoring config hash each parcel was last scored with
+CREATE TABLE IF NOT EXISTS parcel_score_state (
+    apn VARCHAR(20) PRIMARY KEY,
+    feature_hash CHAR(16) NOT NULL,   -- 64-bit feature row hash (hex)
+    config_hash CHAR(64) NOT NULL,    -- SHA-256 of scoring config + template list
+    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
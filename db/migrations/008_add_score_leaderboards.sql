@@ -0,0 +1,37 @@
+-- DealGenie Score Leaderboards Migration
+-- Migration: 008_add_score_leaderboards.sql
+-- Description: Council district on parcels and materialized top-K score leaderboards
+
+BEGIN TRANSACTION;
+
+-- LA City Council district, used as a leaderboard dimension
+ALTER TABLE parcels ADD COLUMN council_district VARCHAR(20);
+
+-- ==============================================================================
+-- SCORE LEADERBOARD TABLES
+-- ==============================================================================
+-- Top entries per (template or '*', dimension, value), maintained as scores are written
+CREATE TABLE IF NOT EXISTS score_leaderboard (
+    board_template VARCHAR(50) NOT NULL,   -- Template, or '*' for all templates
+    dimension VARCHAR(30) NOT NULL,        -- all, zoning_category, zip_code, council_district
+    dimension_value VARCHAR(50) NOT NULL,  -- '*' for the 'all' dimension
+    apn VARCHAR(20) NOT NULL,
+    template VARCHAR(50) NOT NULL,
+    overall_score REAL NOT NULL,           -- Latest score for (apn, template)
+    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (board_template, dimension, dimension_value, apn, template)
+);
+
+CREATE INDEX IF NOT EXISTS idx_score_leaderboard_rank
+    ON score_leaderboard(board_template, dimension, dimension_value, overall_score DESC);
+
+-- Highest score ever trimmed from each board; entries above it are exactly ranked
+CREATE TABLE IF NOT EXISTS score_leaderboard_floor (
+    board_template VARCHAR(50) NOT NULL,
+    dimension VARCHAR(30) NOT NULL,
+    dimension_value VARCHAR(50) NOT NULL,
+    floor_score REAL NOT NULL,
+    PRIMARY KEY (board_template, dimension, dimension_value)
+);
+
+COMMIT;
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Top-K Opportunity Leaderboards for DealGenie
+
+Materialized per-template leaderboards over parcel_scores so "best 50
+multifamily sites in CD 13" is an indexed range read instead of a scan and
+sort of every score row.
+
+Architecture Decision: Bounded Boards With a Floor
+- A board is (template, dimension, value); dimensions are the whole county,
+  zoning category, ZIP code and council district. Template '*' ranks across
+  all templates.
+- Each board keeps the latest score of at most `capacity` (apn, template)
+  entries. Entries pushed out are remembered only through the board's floor:
+  the highest score ever trimmed from it.
+- Entries scoring above the floor are exactly ranked. A read that would need
+  entries at or below the floor rebuilds that one board from parcel_scores
+  first, so results always equal the scan-and-sort query.
+- store_score and the bulk rescoring path call record_scores inside their own
+  transaction, so boards are refreshed as score rows land. Recording a score
+  also removes that (apn, template) from boards for dimensions the parcel no
+  longer has.
+- Parcel upserts call refresh_parcels, which re-records the parcels' latest
+  scores: a zoning, ZIP or council district change moves the entries to the
+  new boards, and scores written before their parcels row are backfilled.
+"""
+
+import sqlite3
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+ALL = '*'
+
+DIMENSIONS = ['all', 'zoning_category', 'zip_code', 'council_district']
+
+LEADERBOARD_TABLES_SQL = '''
+    CREATE TABLE IF NOT EXISTS score_leaderboard (
+        board_template VARCHAR(50) NOT NULL,
+        dimension VARCHAR(30) NOT NULL,
+        dimension_value VARCHAR(50) NOT NULL,
+        apn VARCHAR(20) NOT NULL,
+        template VARCHAR(50) NOT NULL,
+        overall_score REAL NOT NULL,
+        scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (board_template, dimension, dimension_value, apn, template)
+    );
+    CREATE INDEX IF NOT EXISTS idx_score_leaderboard_rank
+        ON score_leaderboard(board_template, dimension, dimension_value, overall_score DESC);
+    CREATE TABLE IF NOT EXISTS score_leaderboard_floor (
+        board_template VARCHAR(50) NOT NULL,
+        dimension VARCHAR(30) NOT NULL,
+        dimension_value VARCHAR(50) NOT NULL,
+        floor_score REAL NOT NULL,
+        PRIMARY KEY (board_template, dimension, dimension_value)
+    );
+'''
+
+# Floors only ever rise until the board is rebuilt
+FLOOR_UPSERT_SQL = '''
+    INSERT INTO score_leaderboard_floor (board_template, dimension, dimension_value, floor_score)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(board_template, dimension, dimension_value)
+    DO UPDATE SET floor_score = MAX(floor_score, excluded.floor_score)
+'''
+
+Board = Tuple[str, str, str]
+
+
+# Fallback for codes missing from zoning_codes; checked in order and substring
+# matched like scoring.zoning_lookup.zoning_rule_score, using zoning_codes.category names
+ZONING_CATEGORIES = [
+    ('mixed', ['RAS3', 'RAS4', 'CM', 'MR1', 'MR2']),
+    ('industrial', ['M1', 'M2', 'M3']),
+    ('commercial', ['C1', 'C2', 'C4', 'C5', 'CR']),
+    ('residential', ['R1', 'R2', 'R3', 'R4', 'R5', 'RD', 'RE', 'RS', 'RA']),
+    ('public', ['PF', 'OS']),
+    ('agricultural', ['A1', 'A2']),
+]
+
+
+def zoning_category(zoning: Optional[str]) -> Optional[str]:
+    """Broad category of a zoning code not listed in zoning_codes ('other' when nothing matches)"""
+    if not zoning:
+        return None
+    zoning = str(zoning).upper()
+    for category, zones in ZONING_CATEGORIES:
+        if any(zone in zoning for zone in zones):
+            return category
+    return 'other'
+
+
+class ScoreLeaderboard:
+    """Maintains and serves top-K score boards in the DealGenie SQLite database"""
+
+    def __init__(self, capacity: int = 200):
+        """
+        Args:
+            capacity: Entries retained per board (reads up to this limit avoid rebuilds)
+        """
+        self.capacity = capacity
+
+    # -- Setup --------------------------------------------------------------
+
+    def ensure_tables(self, conn: sqlite3.Connection):
+        """Create the leaderboard tables (statement by statement, so an open transaction is kept)"""
+        for statement in LEADERBOARD_TABLES_SQL.split(';'):
+            if statement.strip():
+                conn.execute(statement)
+
+    def _council_column(self, conn: sqlite3.Connection) -> str:
+        # Databases created before migration 008 have no council_district column
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(parcels)")}
+        return 'p.council_district' if 'council_district' in columns else 'NULL'
+
+    # -- Dimensions ---------------------------------------------------------
+
+    def parcel_dimensions(self, conn: sqlite3.Connection, apns: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """APN -> {dimension: value} for APNs present in the parcels table"""
+        apns = list(dict.fromkeys(apns))
+        dimensions = {}
+        council = self._council_column(conn)
+        for start in range(0, len(apns), 500):
+            chunk = apns[start:start + 500]
+            rows = conn.execute(
+                f"SELECT p.apn, p.zoning, zc.category, p.zip_code, {council} FROM parcels p "
+                f"LEFT JOIN zoning_codes zc ON zc.code = p.zoning "
+                f"WHERE p.apn IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            for apn, zoning, category, zip_code, council_district in rows:
+                dimensions[apn] = {
+                    'zoning_category': category or zoning_category(zoning),
+                    'zip_code': zip_code or None,
+                    'council_district': str(council_district) if council_district else None,
+                }
+        return dimensions
+
+    def _boards_for(self, template: str, dimensions: Dict[str, Optional[str]]) -> List[Board]:
+        boards = []
+        for board_template in (template, ALL):
+            boards.append((board_template, 'all', ALL))
+            for dimension in DIMENSIONS[1:]:
+                value = dimensions.get(dimension)
+                if value:
+                    boards.append((board_template, dimension, value))
+        return boards
+
+    # -- Incremental maintenance --------------------------------------------
+
+    def record_scores(self, conn: sqlite3.Connection, scores: Iterable[Tuple[str, str, float]]):
+        """
+        Apply newly written scores to every affected board.
+
+        Runs on the caller's connection and inside its transaction.
+
+        Args:
+            conn: Open connection that just wrote the parcel_scores rows
+            scores: (apn, template, overall_score) tuples, in write order
+        """
+        scores = list(scores)
+        if not scores:
+            return
+        self.ensure_tables(conn)
+        dimensions = self.parcel_dimensions(conn, (apn for apn, _, _ in scores))
+
+        # board -> {(apn, template): score}; later writes of the same key win
+        updates: Dict[Board, Dict[Tuple[str, str], float]] = defaultdict(dict)
+        for apn, template, score in scores:
+            if apn not in dimensions or score is None:
+                continue  # Boards only rank scored parcels present in the parcels table
+            for board in self._boards_for(template, dimensions[apn]):
+                updates[board][(apn, template)] = score
+
+        moved = self._moved_entries(conn, updates)
+        upserts, deletes, floors = [], list(moved), []
+        moved = set(moved)
+        for board, board_updates in updates.items():
+            current = {(apn, template): score for apn, template, score in conn.execute(
+                "SELECT apn, template, overall_score FROM score_leaderboard "
+                "WHERE board_template = ? AND dimension = ? AND dimension_value = ?", board)
+                if board + (apn, template) not in moved}
+            merged = {**current, **board_updates}
+
+            # Merge in memory so only entries that enter, change or leave the board are written
+            kept = merged
+            if len(merged) > self.capacity:
+                ranked = sorted(merged.items(), key=lambda item: item[1], reverse=True)
+                kept = dict(ranked[:self.capacity])
+                floors.append(board + (ranked[self.capacity][1],))
+
+            upserts.extend(board + key + (score,) for key, score in board_updates.items() if key in kept)
+            deletes.extend(board + key for key in current if key not in kept)
+
+        conn.executemany('''
+            DELETE FROM score_leaderboard
+            WHERE board_template = ? AND dimension = ? AND dimension_value = ? AND apn = ? AND template = ?
+        ''', deletes)
+        conn.executemany('''
+            INSERT OR REPLACE INTO score_leaderboard
+            (board_template, dimension, dimension_value, apn, template, overall_score, scored_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', upserts)
+        conn.executemany(FLOOR_UPSERT_SQL, floors)
+
+    def _moved_entries(self, conn: sqlite3.Connection,
+                       updates: Dict[Board, Dict[Tuple[str, str], float]]) -> List[tuple]:
+        """Existing entries of the updated (apn, template) keys on boards they no longer belong to"""
+        current_boards: Dict[Tuple[str, str], set] = defaultdict(set)
+        for board, board_updates in updates.items():
+            for key in board_updates:
+                current_boards[key].add(board)
+
+        apns = list({apn for apn, _ in current_boards})
+        moved = []
+        for start in range(0, len(apns), 500):
+            chunk = apns[start:start + 500]
+            for row in conn.execute(
+                f"SELECT board_template, dimension, dimension_value, apn, template FROM score_leaderboard "
+                f"WHERE apn IN ({','.join('?' * len(chunk))})", chunk
+            ):
+                key = (row[3], row[4])
+                if key in current_boards and tuple(row[:3]) not in current_boards[key]:
+                    moved.append(tuple(row))
+        return moved
+
+    def refresh_parcels(self, conn: sqlite3.Connection, apns: Iterable[str]):
+        """
+        Re-record the latest scores of parcels whose parcels rows were just written.
+
+        Runs on the caller's connection and inside its transaction.
+        """
+        apns = list(dict.fromkeys(apns))
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'parcel_scores'").fetchone()
+        if not apns or not exists:
+            return
+
+        rows = []
+        for start in range(0, len(apns), 500):
+            chunk = apns[start:start + 500]
+            rows.extend(tuple(row) for row in conn.execute(
+                f"SELECT ps.apn, ps.template, ps.overall_score FROM parcel_scores ps "
+                f"WHERE ps.id IN (SELECT MAX(id) FROM parcel_scores "
+                f"WHERE apn IN ({','.join('?' * len(chunk))}) GROUP BY apn, template)", chunk))
+        self.record_scores(conn, rows)
+
+    def _trim(self, conn: sqlite3.Connection, board: Board):
+        """Drop entries beyond capacity and raise the board's floor to cover them"""
+        trimmed_max = conn.execute('''
+            SELECT MAX(overall_score) FROM (
+                SELECT overall_score FROM score_leaderboard
+                WHERE board_template = ? AND dimension = ? AND dimension_value = ?
+                ORDER BY overall_score DESC LIMIT -1 OFFSET ?
+            )
+        ''', board + (self.capacity,)).fetchone()[0]
+        if trimmed_max is None:
+            return
+
+        conn.execute('''
+            DELETE FROM score_leaderboard WHERE rowid IN (
+                SELECT rowid FROM score_leaderboard
+                WHERE board_template = ? AND dimension = ? AND dimension_value = ?
+                ORDER BY overall_score DESC LIMIT -1 OFFSET ?
+            )
+        ''', board + (self.capacity,))
+        conn.execute(FLOOR_UPSERT_SQL, board + (trimmed_max,))
+
+    def rebuild(self, conn: sqlite3.Connection, board: Optional[Board] = None):
+        """
+        Recompute one board (or every board) from the latest score per (apn, template)
+        """
+        self.ensure_tables(conn)
+        latest = '''
+            SELECT ps.apn, ps.template, ps.overall_score
+            FROM parcel_scores ps
+            JOIN (SELECT MAX(id) AS id FROM parcel_scores GROUP BY apn, template) latest ON ps.id = latest.id
+            WHERE ps.overall_score IS NOT NULL
+        '''
+
+        if board is None:
+            conn.execute("DELETE FROM score_leaderboard")
+            conn.execute("DELETE FROM score_leaderboard_floor")
+            rows = conn.execute(latest).fetchall()
+            self.record_scores(conn, rows)
+            return
+
+        board_template, dimension, value = board
+        conn.execute("DELETE FROM score_leaderboard WHERE board_template = ? AND dimension = ? "
+                     "AND dimension_value = ?", board)
+        conn.execute("DELETE FROM score_leaderboard_floor WHERE board_template = ? AND dimension = ? "
+                     "AND dimension_value = ?", board)
+
+        rows = [tuple(row) for row in conn.execute(
+            latest + (" AND ps.template = ?" if board_template != ALL else ""),
+            (board_template,) if board_template != ALL else ())]
+        dimensions = self.parcel_dimensions(conn, (apn for apn, _, _ in rows))
+        rows = [row for row in rows if row[0] in dimensions
+                and (dimension == 'all' or dimensions[row[0]].get(dimension) == value)]
+
+        conn.executemany('''
+            INSERT INTO score_leaderboard
+            (board_template, dimension, dimension_value, apn, template, overall_score, scored_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', [board + row for row in rows])
+        self._trim(conn, board)
+
+    # -- Reads --------------------------------------------------------------
+
+    def top(
+        self,
+        conn: sqlite3.Connection,
+        template: str = ALL,
+        dimension: str = 'all',
+        value: str = ALL,
+        limit: int = 50,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Best entries of one board, joined with parcel details
+
+        Args:
+            conn: Database connection
+            template: Template, or '*' across all templates
+            dimension: 'all', 'zoning_category', 'zip_code' or 'council_district'
+            value: Dimension value ('*' for 'all')
+            limit: Maximum entries
+            min_score: Optional minimum score
+
+        Returns:
+            Rows ordered by score (highest first)
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown leaderboard dimension: {dimension}")
+        self.ensure_tables(conn)
+        board = (template, dimension, str(value))
+        threshold = min_score if min_score is not None else float('-inf')
+
+        floor = self._floor(conn, board)
+        if limit > self.capacity and floor is not None:
+            return self._read_uncapped(conn, board, limit, threshold)
+
+        rows = self._read(conn, board, limit, threshold)
+        if not self._is_exact(floor, rows, limit, threshold):
+            # Commit our own rebuild, but never a transaction the caller already had open
+            caller_transaction = conn.in_transaction
+            self.rebuild(conn, board)
+            if not caller_transaction:
+                conn.commit()
+            rows = self._read(conn, board, limit, threshold)
+        return rows
+
+    def _read(self, conn: sqlite3.Connection, board: Board, limit: int, threshold: float) -> List[Dict[str, Any]]:
+        cursor = conn.execute('''
+            SELECT lb.apn, p.address, p.city, p.zoning, p.lot_size_sqft,
+                   lb.overall_score, lb.template,
+                   (SELECT ps.explanation FROM parcel_scores ps WHERE ps.apn = lb.apn AND ps.template = lb.template
+                    ORDER BY ps.id DESC LIMIT 1) AS explanation,
+                   lb.scored_at
+            FROM score_leaderboard lb
+            INNER JOIN parcels p ON p.apn = lb.apn
+            WHERE lb.board_template = ? AND lb.dimension = ? AND lb.dimension_value = ?
+              AND lb.overall_score >= ?
+            ORDER BY lb.overall_score DESC
+            LIMIT ?
+        ''', board + (threshold, limit))
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _floor(self, conn: sqlite3.Connection, board: Board) -> Optional[float]:
+        row = conn.execute(
+            "SELECT floor_score FROM score_leaderboard_floor "
+            "WHERE board_template = ? AND dimension = ? AND dimension_value = ?", board
+        ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _is_exact(floor: Optional[float], rows: List[Dict[str, Any]], limit: int, threshold: float) -> bool:
+        """Whether rows equal what a full scan would return (only entries above the floor are complete)"""
+        if floor is None:
+            return True  # Nothing was ever trimmed: the board holds every entry
+        if rows and rows[-1]['overall_score'] <= floor:
+            return False
+        return len(rows) == limit or threshold > floor
+
+    def _read_uncapped(self, conn: sqlite3.Connection, board: Board, limit: int,
+                       threshold: float) -> List[Dict[str, Any]]:
+        """Scan-and-sort fallback for limits larger than the board capacity"""
+        board_template, dimension, value = board
+        cursor = conn.execute(f'''
+            SELECT p.apn, p.address, p.city, p.zoning, p.lot_size_sqft,
+                   ps.overall_score, ps.template, ps.explanation, ps.scored_at
+            FROM parcel_scores ps
+            JOIN (SELECT MAX(id) AS id FROM parcel_scores GROUP BY apn, template) latest ON ps.id = latest.id
+            INNER JOIN parcels p ON p.apn = ps.apn
+            WHERE ps.overall_score >= ? {"AND ps.template = ?" if board_template != ALL else ""}
+            ORDER BY ps.overall_score DESC
+        ''', (threshold, board_template) if board_template != ALL else (threshold,))
+        columns = [description[0] for description in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if dimension != 'all':
+            dimensions = self.parcel_dimensions(conn, (row['apn'] for row in rows))
+            rows = [row for row in rows if dimensions.get(row['apn'], {}).get(dimension) == value]
+        return rows[:limit]
@@ -3,6 +3,11 @@
 -- Converted from PostGIS design to work without PostgreSQL dependencies
 
 -- Drop existing tables if they exist (for clean setup)
+DROP TABLE IF EXISTS score_leaderboard_floor;
+DROP TABLE IF EXISTS score_leaderboard;
+DROP TABLE IF EXISTS parcel_score_state;
+DROP TABLE IF EXISTS block_group_stats;
+DROP TABLE IF EXISTS score_cache;
 DROP TABLE IF EXISTS parcel_scores;
 DROP TABLE IF EXISTS feature_cache;
 DROP TABLE IF EXISTS parcels;
@@ -44,6 +49,7 @@ CREATE TABLE parcels (
     address TEXT,
     city VARCHAR(100),
     zip_code VARCHAR(10),
+    council_district VARCHAR(20),  -- LA City Council district
     
     -- Zoning and land use
     zoning VARCHAR(20),
@@ -136,7 +142,7 @@ CREATE TABLE feature_cache (
     permit_history TEXT,       -- JSON as text
     
     -- Raw feature vector (for ML model input)
-    feature_vector TEXT, -- JSON as text
+    feature_vector BLOB, -- Binary feature vector (features/feature_codec.py); legacy rows hold JSON text
     
     -- Cache metadata
     computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -208,6 +214,75 @@ CREATE INDEX idx_parcel_scores_scored_at ON parcel_scores(scored_at DESC);
 CREATE INDEX idx_parcel_scores_apn_template ON parcel_scores(apn, template);
 CREATE INDEX idx_parcel_scores_template_score ON parcel_scores(template, overall_score DESC);
 
+-- ==============================================================================
+-- SCORE CACHE TABLE
+-- ==============================================================================
+-- Latest scoring result per APN/template, reused while the feature vector and
+-- scoring configuration fingerprints are unchanged (see scoring/score_cache.py)
+CREATE TABLE score_cache (
+    apn VARCHAR(20) NOT NULL,
+    template VARCHAR(50) NOT NULL,
+    feature_hash CHAR(64) NOT NULL,   -- SHA-256 of canonical feature JSON
+    config_hash CHAR(64) NOT NULL,    -- SHA-256 of weights, YAML constraints, engine sources
+    result_json TEXT NOT NULL,        -- JSON as text
+    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apn, template)
+);
+
+-- ==============================================================================
+-- BLOCK GROUP STATISTICS TABLE
+-- ==============================================================================
+-- Full-universe z-score sufficient statistics per census geography and feature
+-- (see scoring/block_group_stats.py)
+CREATE TABLE block_group_stats (
+    geo_level VARCHAR(20) NOT NULL,   -- block_group or tract
+    geoid VARCHAR(12) NOT NULL,
+    feature VARCHAR(50) NOT NULL,
+    value_count REAL NOT NULL,
+    value_sum REAL NOT NULL,
+    value_sum_sq REAL NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (geo_level, geoid, feature)
+);
+
+-- ==============================================================================
+-- PARCEL SCORE STATE TABLE
+-- ==============================================================================
+-- Input hashes each parcel was last scored with (see cli/incremental_rescore.py)
+CREATE TABLE parcel_score_state (
+    apn VARCHAR(20) PRIMARY KEY,
+    feature_hash CHAR(16) NOT NULL,   -- 64-bit feature row hash (hex)
+    config_hash CHAR(64) NOT NULL,    -- SHA-256 of scoring config + template list
+    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==============================================================================
+-- SCORE LEADERBOARDS (db/score_leaderboard.py)
+-- ==============================================================================
+-- Top entries per (template or '*', dimension, value), maintained as scores are written
+CREATE TABLE score_leaderboard (
+    board_template VARCHAR(50) NOT NULL,   -- Template, or '*' for all templates
+    dimension VARCHAR(30) NOT NULL,        -- all, zoning_category, zip_code, council_district
+    dimension_value VARCHAR(50) NOT NULL,  -- '*' for the 'all' dimension
+    apn VARCHAR(20) NOT NULL,
+    template VARCHAR(50) NOT NULL,
+    overall_score REAL NOT NULL,           -- Latest score for (apn, template)
+    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (board_template, dimension, dimension_value, apn, template)
+);
+
+CREATE INDEX idx_score_leaderboard_rank
+    ON score_leaderboard(board_template, dimension, dimension_value, overall_score DESC);
+
+-- Highest score ever trimmed from each board; entries above it are exactly ranked
+CREATE TABLE score_leaderboard_floor (
+    board_template VARCHAR(50) NOT NULL,
+    dimension VARCHAR(30) NOT NULL,
+    dimension_value VARCHAR(50) NOT NULL,
+    floor_score REAL NOT NULL,
+    PRIMARY KEY (board_template, dimension, dimension_value)
+);
+
 -- ==============================================================================
 -- DATA VIEWS FOR COMMON QUERIES
 -- ==============================================================================
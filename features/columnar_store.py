@@ -0,0 +1,258 @@
+"""
+DealGenie Columnar Parcel Store
+
+One-time conversion of the 210-column merged parcel CSV into a typed Arrow IPC
+file holding only the fields CSVFeatureMatrix.get_feature_matrix reads, already
+parsed into numeric/boolean columns. The IPC file is memory-mapped on load, so
+startup does not parse text and the process no longer pulls the whole CSV
+through the page cache.
+
+Architecture Decision: Arrow IPC over Parquet
+- Uncompressed Arrow IPC can be memory-mapped and sliced zero-copy per APN
+- Parquet would need page decompression on every random access
+- Conversion reuses CSVFeatureMatrix.extract_base_features so values are identical
+
+Usage:
+    python features/columnar_store.py build --csv scraper/la_parcels_complete_merged.csv
+"""
+
+import csv
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from features.csv_feature_matrix import CSVFeatureMatrix
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+# Base feature columns produced by CSVFeatureMatrix.extract_base_features
+BASE_FEATURE_SCHEMA = [
+    ('apn', 'string'),
+    ('site_address', 'string'),
+    ('site_city', 'string'),
+    ('site_zip', 'string'),
+    ('zoning', 'string'),
+    ('lot_size_sqft', 'float64'),
+    ('building_sqft', 'float64'),
+    ('year_built', 'int32'),
+    ('number_of_units', 'int32'),
+    ('assessed_value', 'float64'),
+    ('last_sale_amount', 'float64'),
+    ('census_geoid', 'string'),
+    ('council_district', 'string'),
+    ('neighborhood_council', 'string'),
+    ('historic_preservation', 'bool_'),
+    ('hillside_area', 'bool_'),
+    ('coastal_zone', 'bool_'),
+    ('flood_zone', 'bool_'),
+    ('fire_hazard_zone', 'bool_'),
+    ('methane_hazard', 'bool_'),
+    ('airport_hazard', 'bool_'),
+    ('oil_well_adjacency', 'bool_'),
+    ('liquefaction', 'bool_'),
+    ('landslide', 'bool_'),
+]
+
+
+def default_store_path(csv_path: str) -> str:
+    """Return the conventional Arrow store path next to a parcel CSV."""
+    return f"{os.path.splitext(csv_path)[0]}.features.arrow"
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is required for the columnar parcel store. Install with: pip install pyarrow")
+
+
+def _arrow_schema(csv_signature: Dict[str, int]) -> 'pa.Schema':
+    """Build the Arrow schema, embedding the source CSV signature as metadata."""
+    fields = [pa.field(name, getattr(pa, type_name)()) for name, type_name in BASE_FEATURE_SCHEMA]
+    metadata = {
+        b'dealgenie_store_version': str(STORE_VERSION).encode(),
+        b'dealgenie_csv_signature': json.dumps(csv_signature).encode(),
+    }
+    return pa.schema(fields, metadata=metadata)
+
+
+def build_columnar_store(csv_path: str, store_path: Optional[str] = None,
+                         batch_rows: int = 50000) -> str:
+    """
+    Convert the merged parcel CSV into a typed Arrow IPC feature store.
+
+    Args:
+        csv_path: Path to la_parcels_complete_merged.csv
+        store_path: Output path (defaults to <csv>.features.arrow)
+        batch_rows: Rows per record batch (bounds conversion memory)
+
+    Returns:
+        Path of the written store
+    """
+    _require_pyarrow()
+    store_path = store_path or default_store_path(csv_path)
+
+    matrix = CSVFeatureMatrix(csv_path)
+    if not matrix.headers:
+        raise FileNotFoundError(f"CSV file not found or empty: {csv_path}")
+
+    schema = _arrow_schema(matrix._csv_signature())
+    column_names = [name for name, _ in BASE_FEATURE_SCHEMA]
+    seen = set()
+    total = 0
+
+    def flush(columns: Dict[str, List[Any]], writer):
+        batch = pa.record_batch([columns[name] for name in column_names], schema=schema)
+        writer.write_batch(batch)
+
+    tmp_path = f"{store_path}.tmp"
+    with open(csv_path, 'r', encoding='utf-8') as f, \
+         pa.OSFile(tmp_path, 'wb') as sink, \
+         pa.ipc.new_file(sink, schema) as writer:
+        reader = csv.reader(f)
+        next(reader)  # Skip headers
+
+        columns = {name: [] for name in column_names}
+        for row in reader:
+            if not row or not row[0] or row[0] in seen:
+                continue  # First occurrence wins, matching the linear CSV scan
+            seen.add(row[0])
+
+            base = matrix.extract_base_features(row[0], row)
+            for name in column_names:
+                columns[name].append(base[name])
+            total += 1
+
+            if len(columns['apn']) >= batch_rows:
+                flush(columns, writer)
+                columns = {name: [] for name in column_names}
+                logger.info(f"Converted {total:,} parcels")
+
+        if columns['apn']:
+            flush(columns, writer)
+
+    os.replace(tmp_path, store_path)
+    logger.info(f"Wrote columnar store with {total:,} parcels to {store_path}")
+    return store_path
+
+
+class ColumnarFeatureMatrix(CSVFeatureMatrix):
+    """
+    Feature matrix served from the memory-mapped Arrow parcel store.
+
+    Returns the same feature dictionaries as CSVFeatureMatrix; only the source
+    of the base fields changes. Derived metrics, transit, demographics and risk
+    defaults come from the shared CSVFeatureMatrix.add_derived_features.
+    """
+
+    def __init__(self, store_path: str, csv_path: Optional[str] = None):
+        _require_pyarrow()
+        # CSV headers are only needed for raw-row access, so they are read on first use
+        super().__init__(csv_path, load_headers=False)
+        self.store_path = store_path
+
+        source = pa.memory_map(store_path, 'r')
+        self.table = pa.ipc.open_file(source).read_all()
+        self.schema_metadata = self.table.schema.metadata or {}
+        self.row_index = {apn: i for i, apn in enumerate(self.table.column('apn').to_pylist())}
+        logger.info(f"Memory-mapped columnar store {store_path} with {len(self.row_index):,} parcels")
+
+    @property
+    def csv_signature(self) -> Optional[Dict[str, int]]:
+        """Signature of the CSV the store was built from."""
+        raw = self.schema_metadata.get(b'dealgenie_csv_signature')
+        return json.loads(raw) if raw else None
+
+    def is_current(self) -> bool:
+        """True if the store matches the current CSV (or no CSV is present)."""
+        if not self.csv_path or not os.path.exists(self.csv_path):
+            return True
+        return self.csv_signature == self._csv_signature()
+
+    def find_apn_data(self, apn: str) -> Optional[list]:
+        """Raw CSV row for an APN via the inherited byte-offset index (None without a CSV)."""
+        if self.csv_path and not self.headers:
+            self._load_headers()
+        return super().find_apn_data(apn)
+
+    def get_base_features(self, apn: str) -> Optional[Dict[str, Any]]:
+        """Return the stored base fields for an APN, or None if absent."""
+        row = self.row_index.get(str(apn))
+        if row is None:
+            return None
+        return self.table.slice(row, 1).to_pylist()[0]
+
+    def get_feature_matrix(self, apn: str) -> Dict[str, Any]:
+        """Get comprehensive feature matrix for an APN from the columnar store."""
+        features = self.get_base_features(apn)
+
+        if features is None:
+            logger.warning(f"APN {apn} not found in columnar store, using defaults")
+            return self._get_default_features(apn)
+
+        features['apn'] = apn
+        self.add_derived_features(features)
+        return features
+
+
+def open_feature_store(csv_path: str, store_path: Optional[str] = None) -> Optional[ColumnarFeatureMatrix]:
+    """
+    Open the columnar store for a CSV if pyarrow is installed and the store is current.
+
+    Returns None when the caller should fall back to CSV parsing.
+    """
+    if not HAS_PYARROW:
+        return None
+
+    store_path = store_path or default_store_path(csv_path)
+    if not os.path.exists(store_path):
+        return None
+
+    try:
+        store = ColumnarFeatureMatrix(store_path, csv_path)
+    except Exception as e:
+        logger.warning(f"Could not open columnar store {store_path}: {e}")
+        return None
+
+    if not store.is_current():
+        logger.warning(f"Columnar store {store_path} is older than {csv_path}; rebuild with "
+                       f"'python features/columnar_store.py build'")
+        return None
+
+    return store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DealGenie Columnar Parcel Store")
+    parser.add_argument("command", choices=['build', 'info'], help="Command to execute")
+    parser.add_argument("--csv", default="scraper/la_parcels_complete_merged.csv", help="Merged parcel CSV")
+    parser.add_argument("--out", help="Output store path (default: <csv>.features.arrow)")
+    parser.add_argument("--batch-rows", type=int, default=50000, help="Rows per record batch")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        path = build_columnar_store(args.csv, args.out, args.batch_rows)
+        print(f"✓ Columnar store written to {path}")
+
+    elif args.command == "info":
+        store = ColumnarFeatureMatrix(args.out or default_store_path(args.csv), args.csv)
+        print(f"Parcels: {store.table.num_rows:,}")
+        print(f"Columns: {store.table.num_columns}")
+        print(f"Size: {os.path.getsize(store.store_path) / 1024 / 1024:.1f} MB")
+        print(f"Current: {store.is_current()}")
@@ -19,12 +19,47 @@ Key Design Patterns:
 
 import logging
 import csv
+import io
+import json
 import os
 from typing import Dict, Any, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_CSV_PATH = "scraper/la_parcels_complete_merged.csv"
+
+# High-density transit areas in LA
+TRANSIT_ZIP_SCORES = {
+    '90028': 85,  # Hollywood
+    '90038': 80,  # Mid-City
+    '90010': 85,  # Koreatown
+    '90005': 80,  # Koreatown
+    '90026': 75,  # Silver Lake
+    '90027': 70,  # Los Feliz
+    '90004': 75,  # Los Feliz/Silver Lake
+    '90019': 70,  # Mid-City
+    '90035': 65,  # Pico-Robertson (our test area)
+    '90036': 70,  # Fairfax
+    '90048': 75,  # West Hollywood
+    '90069': 80,  # West Hollywood
+}
+
+# LA County demographic estimates by ZIP code (simplified)
+ZIP_DEMOGRAPHICS = {
+    '90035': {'median_income': 85000, 'population_density': 12500, 'crime_factor': 0.8},  # Pico-Robertson
+    '90028': {'median_income': 65000, 'population_density': 18500, 'crime_factor': 1.2},  # Hollywood
+    '90210': {'median_income': 125000, 'population_density': 8500, 'crime_factor': 0.4}, # Beverly Hills
+    '90024': {'median_income': 95000, 'population_density': 11000, 'crime_factor': 0.6}, # Westwood
+    '90272': {'median_income': 145000, 'population_density': 4500, 'crime_factor': 0.3}, # Pacific Palisades
+    '90049': {'median_income': 135000, 'population_density': 6000, 'crime_factor': 0.4}, # Brentwood
+    '90019': {'median_income': 52000, 'population_density': 16000, 'crime_factor': 1.4},  # Mid-City
+    '90037': {'median_income': 38000, 'population_density': 14500, 'crime_factor': 1.8},  # South LA
+    '90003': {'median_income': 35000, 'population_density': 15500, 'crime_factor': 1.9},  # South LA
+}
+
+DEFAULT_DEMOGRAPHICS = {'median_income': 65000, 'population_density': 10000, 'crime_factor': 1.0}
+
 class CSVFeatureMatrix:
     """
     CSV-based feature matrix for LA County parcel data processing.
@@ -40,20 +75,28 @@ class CSVFeatureMatrix:
     
     Performance Characteristics:
     - Processes 369K parcels efficiently via streaming
-    - ~10 parcels/second sustained throughput
+    - APN lookups use a sidecar byte-offset index (one seek + one row parse)
+    - Index is rebuilt automatically when the CSV size or mtime changes
     - Minimal memory footprint (streaming, not bulk loading)
     - 44 features extracted from 210 raw CSV columns
     """
     
-    def __init__(self, csv_path: str = "scraper/la_parcels_complete_merged.csv"):
+    INDEX_VERSION = 1
+
+    def __init__(self, csv_path: Optional[str] = DEFAULT_CSV_PATH,
+                 index_path: Optional[str] = None, load_headers: bool = True):
         self.csv_path = csv_path
+        self.index_path = index_path or (f"{csv_path}.apnidx.json" if csv_path else None)
         self.headers = []
         self.header_index = {}
-        self._load_headers()
+        self.apn_offsets = {}
+        self._index_signature = None
+        if load_headers:
+            self._load_headers()
         
     def _load_headers(self):
         """Load CSV headers for column mapping."""
-        if not os.path.exists(self.csv_path):
+        if not self.csv_path or not os.path.exists(self.csv_path):
             logger.error(f"CSV file not found: {self.csv_path}")
             return
             
@@ -68,19 +111,149 @@ class CSVFeatureMatrix:
         except Exception as e:
             logger.error(f"Error loading CSV headers: {e}")
     
+    def _csv_signature(self) -> Optional[Dict[str, int]]:
+        """Return the (size, mtime) signature used to validate the APN index."""
+        if not self.csv_path:
+            return None
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    @staticmethod
+    def _read_record(f) -> bytes:
+        """
+        Read one CSV record from a binary file handle.
+        
+        Quoted fields may contain newlines, so lines are accumulated until the
+        record has a balanced number of quote characters.
+        """
+        record = f.readline()
+        while record and record.count(b'"') % 2 == 1:
+            line = f.readline()
+            if not line:
+                break
+            record += line
+        return record
+    
+    @staticmethod
+    def _record_apn(record: bytes) -> str:
+        """Extract the APN (first column) from a raw CSV record."""
+        if record.startswith(b'"'):
+            row = next(csv.reader(io.StringIO(record.decode('utf-8', errors='replace'))), [])
+            return row[0] if row else ''
+        return record.split(b',', 1)[0].rstrip(b'\r\n').decode('utf-8', errors='replace')
+    
+    def build_apn_index(self) -> Dict[str, int]:
+        """
+        Scan the CSV once and build the APN -> byte offset index.
+        
+        The index is written to a sidecar JSON file next to the CSV together with
+        the CSV size/mtime so later runs can reuse it until the CSV changes.
+        """
+        signature = self._csv_signature()
+        if signature is None:
+            return {}
+        
+        offsets = {}
+        with open(self.csv_path, 'rb') as f:
+            self._read_record(f)  # Skip headers
+            while True:
+                offset = f.tell()
+                record = self._read_record(f)
+                if not record:
+                    break
+                apn = self._record_apn(record)
+                if apn:
+                    offsets.setdefault(apn, offset)  # First match wins, as in a linear scan
+        
+        self.apn_offsets = offsets
+        self._index_signature = signature
+        logger.info(f"Built APN index with {len(offsets):,} entries for {self.csv_path}")
+        
+        try:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.INDEX_VERSION,
+                    'csv_signature': signature,
+                    'offsets': offsets
+                }, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not persist APN index to {self.index_path}: {e}")
+        
+        return offsets
+    
+    def _load_apn_index(self) -> bool:
+        """Load the sidecar APN index if it matches the current CSV."""
+        signature = self._csv_signature()
+        if signature is None:
+            return False
+        
+        if self._index_signature == signature:
+            return True
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if data.get('version') != self.INDEX_VERSION or data.get('csv_signature') != signature:
+            logger.info(f"APN index {self.index_path} is stale, rebuilding")
+            return False
+        
+        self.apn_offsets = data.get('offsets', {})
+        self._index_signature = signature
+        return True
+    
+    def ensure_apn_index(self) -> Dict[str, int]:
+        """Return a current APN index, loading or rebuilding it as needed."""
+        if not self._load_apn_index():
+            self.build_apn_index()
+        return self.apn_offsets
+    
+    def _read_row_at(self, offset: int) -> Optional[list]:
+        """Seek to a byte offset and parse the single CSV row found there."""
+        with open(self.csv_path, 'rb') as f:
+            f.seek(offset)
+            record = self._read_record(f)
+        if not record:
+            return None
+        return next(csv.reader(io.StringIO(record.decode('utf-8'))), None)
+    
+    def _scan_for_apn(self, apn: str) -> Optional[list]:
+        """Linear scan fallback used when no index is available."""
+        with open(self.csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader)  # Skip headers
+            
+            for row in reader:
+                if len(row) > 0 and row[0] == str(apn):  # APN is first column
+                    return row
+        return None
+    
     def find_apn_data(self, apn: str) -> Optional[list]:
-        """Find row data for a specific APN."""
-        if not os.path.exists(self.csv_path):
+        """Find row data for a specific APN using the byte-offset index."""
+        if not self.csv_path or not os.path.exists(self.csv_path):
             return None
             
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip headers
-                
-                for row in reader:
-                    if len(row) > 0 and row[0] == str(apn):  # APN is first column
-                        return row
+            offsets = self.ensure_apn_index()
+            offset = offsets.get(str(apn))
+            if offset is None:
+                return None
+            
+            row = self._read_row_at(offset)
+            if row and row[0] == str(apn):
+                return row
+            
+            # Index disagrees with the file (e.g. CSV rewritten within mtime resolution)
+            logger.warning(f"APN index mismatch for {apn}, rebuilding index")
+            self.build_apn_index()
+            return self._scan_for_apn(apn)
                         
         except Exception as e:
             logger.error(f"Error searching for APN {apn}: {e}")
@@ -96,7 +269,8 @@ class CSVFeatureMatrix:
                 return value if value else default
         return default
     
-    def parse_numeric(self, value: str, default: float = 0.0) -> float:
+    @staticmethod
+    def parse_numeric(value: str, default: float = 0.0) -> float:
         """Parse numeric value from CSV, handling various formats."""
         if not value or value.lower() in ['', 'null', 'none', 'n/a']:
             return default
@@ -122,24 +296,8 @@ class CSVFeatureMatrix:
         """Calculate transit accessibility score based on location data."""
         base_score = 50.0  # Default
         
-        # High-density transit areas in LA
-        transit_zip_codes = {
-            '90028': 85,  # Hollywood
-            '90038': 80,  # Mid-City
-            '90010': 85,  # Koreatown
-            '90005': 80,  # Koreatown
-            '90026': 75,  # Silver Lake
-            '90027': 70,  # Los Feliz
-            '90004': 75,  # Los Feliz/Silver Lake
-            '90019': 70,  # Mid-City
-            '90035': 65,  # Pico-Robertson (our test area)
-            '90036': 70,  # Fairfax
-            '90048': 75,  # West Hollywood
-            '90069': 80,  # West Hollywood
-        }
-        
-        if zip_code in transit_zip_codes:
-            base_score = transit_zip_codes[zip_code]
+        if zip_code in TRANSIT_ZIP_SCORES:
+            base_score = TRANSIT_ZIP_SCORES[zip_code]
         
         # Adjust based on transit indicators from CSV
         if features.get('divTab3_ab_2097_within_a_half_mile_of_a_major_transit_stop') == 'Yes':
@@ -153,21 +311,7 @@ class CSVFeatureMatrix:
     
     def calculate_demographics_score(self, zip_code: str, zoning: str) -> dict:
         """Calculate demographics based on ZIP code and area characteristics."""
-        # LA County demographic estimates by ZIP code (simplified)
-        demographics_data = {
-            '90035': {'median_income': 85000, 'population_density': 12500, 'crime_factor': 0.8},  # Pico-Robertson
-            '90028': {'median_income': 65000, 'population_density': 18500, 'crime_factor': 1.2},  # Hollywood
-            '90210': {'median_income': 125000, 'population_density': 8500, 'crime_factor': 0.4}, # Beverly Hills
-            '90024': {'median_income': 95000, 'population_density': 11000, 'crime_factor': 0.6}, # Westwood
-            '90272': {'median_income': 145000, 'population_density': 4500, 'crime_factor': 0.3}, # Pacific Palisades
-            '90049': {'median_income': 135000, 'population_density': 6000, 'crime_factor': 0.4}, # Brentwood
-            '90019': {'median_income': 52000, 'population_density': 16000, 'crime_factor': 1.4},  # Mid-City
-            '90037': {'median_income': 38000, 'population_density': 14500, 'crime_factor': 1.8},  # South LA
-            '90003': {'median_income': 35000, 'population_density': 15500, 'crime_factor': 1.9},  # South LA
-        }
-        
-        default_demo = {'median_income': 65000, 'population_density': 10000, 'crime_factor': 1.0}
-        return demographics_data.get(zip_code, default_demo)
+        return ZIP_DEMOGRAPHICS.get(zip_code, DEFAULT_DEMOGRAPHICS)
     
     def get_feature_matrix(self, apn: str) -> Dict[str, Any]:
         """Get comprehensive feature matrix for an APN from CSV data."""
@@ -182,6 +326,16 @@ class CSVFeatureMatrix:
         
         logger.info(f"Found APN {apn} in CSV with {len(row_data)} fields")
         
+        features = self.extract_base_features(apn, row_data)
+        self.add_derived_features(features)
+        
+        logger.info(f"Successfully extracted {len(features)} features for APN {apn}")
+        logger.info(f"Key features: zoning={features['zoning']}, lot_size={features['lot_size_sqft']}, address={features['site_address']}")
+        
+        return features
+    
+    def extract_base_features(self, apn: str, row_data: list) -> Dict[str, Any]:
+        """Extract the typed per-parcel fields read directly from a CSV row."""
         # Extract core property data
         features = {
             'apn': apn,
@@ -224,6 +378,10 @@ class CSVFeatureMatrix:
             'landslide': self.get_column_value(row_data, 'divTab8_landslide') == 'Yes',
         }
         
+        return features
+    
+    def add_derived_features(self, features: Dict[str, Any]) -> Dict[str, Any]:
+        """Add derived metrics, transit, demographics and risk defaults in place."""
         # Calculate derived metrics
         if features['building_sqft'] > 0 and features['assessed_value'] > 0:
             features['price_per_sqft'] = features['assessed_value'] / features['building_sqft']
@@ -270,23 +428,17 @@ class CSVFeatureMatrix:
         # Calculate development potential
         features['development_potential'] = self._calculate_development_potential(features)
         
-        logger.info(f"Successfully extracted {len(features)} features for APN {apn}")
-        logger.info(f"Key features: zoning={features['zoning']}, lot_size={features['lot_size_sqft']}, address={features['site_address']}")
-        
         return features
     
     def _calculate_development_potential(self, features: Dict[str, Any]) -> float:
         """Calculate development potential score based on features."""
+        from scoring.zoning_lookup import get_zoning_table
+        
         score = 5.0  # Base score
         
-        # Zoning bonus
+        # Zoning bonus (precompiled per zoning code)
         zoning = str(features.get('zoning', '')).upper()
-        if any(z in zoning for z in ['R5', 'R4', 'C2', 'C4']):
-            score += 2.0
-        elif any(z in zoning for z in ['R3', 'RAS']):
-            score += 1.5
-        elif 'R2' in zoning:
-            score += 0.5
+        score += get_zoning_table().development_bonus(zoning)
         
         # Lot size bonus
         lot_size = features.get('lot_size_sqft', 0)
@@ -306,7 +458,8 @@ class CSVFeatureMatrix:
         
         return min(score, 10.0)
     
-    def _get_default_features(self, apn: str) -> Dict[str, Any]:
+    @staticmethod
+    def _get_default_features(apn: str) -> Dict[str, Any]:
         """Fallback default features when APN not found."""
         logger.warning(f"Using default features for APN {apn}")
         
@@ -352,11 +505,22 @@ class CSVFeatureMatrix:
 # Global instance for easy access
 _csv_feature_matrix = None
 
-def get_feature_matrix(apn: str) -> Dict[str, Any]:
-    """Get feature matrix for a property from CSV data."""
+def _get_global_matrix() -> CSVFeatureMatrix:
+    """Create the shared feature matrix, preferring a current columnar store."""
     global _csv_feature_matrix
     
     if _csv_feature_matrix is None:
-        _csv_feature_matrix = CSVFeatureMatrix()
+        try:
+            from features.columnar_store import open_feature_store
+            _csv_feature_matrix = open_feature_store(DEFAULT_CSV_PATH)
+        except ImportError:
+            _csv_feature_matrix = None
+        
+        if _csv_feature_matrix is None:
+            _csv_feature_matrix = CSVFeatureMatrix(DEFAULT_CSV_PATH)
     
-    return _csv_feature_matrix.get_feature_matrix(apn)
\ No newline at end of file
+    return _csv_feature_matrix
+
+def get_feature_matrix(apn: str) -> Dict[str, Any]:
+    """Get feature matrix for a property from the columnar store or CSV data."""
+    return _get_global_matrix().get_feature_matrix(apn)
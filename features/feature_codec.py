@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Binary Feature Vector Codec for the DealGenie Feature Cache
+
+Encodes the feature dictionaries stored in feature_cache.feature_vector as a
+compact binary record instead of json.dumps text. A cache hit then costs one
+struct unpack and a string split rather than a full JSON parse.
+
+Record layout (little-endian):
+    b'DG' | version (uint8) | header length (uint16)
+    header:  field count (uint16) | field ids (uint16 each) | type tags (1 byte each)
+             | extra field names ('\\0'-joined UTF-8, only for fields not in FEATURE_FIELDS)
+    values:  fixed-width array of the numeric/bool fields in header order
+    strings: '\\0'-joined UTF-8 string table (str fields, then JSON-encoded values)
+
+Architecture Decision: Schema-Ordered Struct Array With Cached Decode Plans
+- Field names are uint16 indexes into FEATURE_FIELDS, so the per-record
+  header is ~3 bytes per feature instead of repeating every key as text
+- Numbers keep their Python type: floats as float64, ints as int32 (int64
+  when they do not fit), bools as one byte, so decode(encode(f)) == f
+- Records produced from the same feature layout share identical header
+  bytes; the decoder caches a precompiled struct.Struct and key lists per
+  header, so decoding is unpack + zip with no per-field type dispatch
+- Values that are not scalars (lists, dicts, strings containing NUL) fall back
+  to JSON inside the string table, keeping the codec lossless for anything
+  json.dumps accepted before
+
+Key Design Patterns:
+- FEATURE_FIELDS is append-only: ids are positions, and records already in the
+  cache must keep decoding after new features are added
+- decode_features() also accepts legacy JSON text, so callers never need to
+  know which encoding a row holds; is_legacy_encoding() lets the database
+  re-encode old rows lazily on read
+- Key order of decoded dictionaries follows value kind, not insertion order
+"""
+
+import json
+import struct
+from typing import Dict, Any, List, Union
+
+FORMAT_MAGIC = b'DG'
+FORMAT_VERSION = 1
+
+# Feature names produced by CSVFeatureMatrix (base, derived and default
+# features). APPEND ONLY: a field's id is its position in this tuple.
+FEATURE_FIELDS = (
+    'apn', 'site_address', 'site_city', 'site_zip', 'zoning',
+    'lot_size_sqft', 'building_sqft', 'year_built', 'number_of_units',
+    'assessed_value', 'last_sale_amount',
+    'census_geoid', 'council_district', 'neighborhood_council',
+    'historic_preservation', 'hillside_area', 'coastal_zone', 'flood_zone', 'fire_hazard_zone',
+    'methane_hazard', 'airport_hazard', 'oil_well_adjacency', 'liquefaction', 'landslide',
+    'price_per_sqft', 'far', 'transit_score',
+    'total_population', 'median_income', 'population_density', 'crime_factor',
+    'flood_risk', 'toxic_sites_nearby', 'superfund_site_nearby', 'airport_noise_level',
+    'near_airport', 'homeless_encampments_nearby', 'homeless_population_density',
+    'freeway_distance_ft', 'industrial_facilities_nearby', 'air_quality_index',
+    'seismic_risk_level', 'utility_deficiencies', 'development_potential',
+    'latitude', 'longitude', 'housing_units', 'median_rent',
+    'college_degree_pct', 'unemployment_rate',
+)
+
+FIELD_IDS = {name: field_id for field_id, name in enumerate(FEATURE_FIELDS)}
+EXTRA_FIELD = 0xFFFF  # Field id for names carried in the header's name table
+
+_PREFIX = struct.Struct('<2sBH')
+_COUNT = struct.Struct('<H')
+
+# Type tags; numeric/bool tags double as struct format characters
+FLOAT64, INT32, INT64, BOOL = 'd', 'i', 'q', '?'
+STRING, NONE, EMPTY_LIST, JSON = 's', 'n', 'e', 'j'
+FIXED_TAGS = (FLOAT64, INT32, INT64, BOOL)
+
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+INT64_RANGE = (-2 ** 63, 2 ** 63 - 1)
+
+# Decode plans keyed by header bytes
+_plans: Dict[bytes, tuple] = {}
+MAX_CACHED_PLANS = 1024
+
+
+def _type_tag(value: Any) -> str:
+    """Storage tag for a feature value"""
+    if value is None:
+        return NONE
+    value_type = type(value)
+    if value_type is bool:
+        return BOOL
+    if value_type is float:
+        return FLOAT64
+    if value_type is int:
+        if INT32_RANGE[0] <= value <= INT32_RANGE[1]:
+            return INT32
+        if INT64_RANGE[0] <= value <= INT64_RANGE[1]:
+            return INT64
+        return JSON
+    if value_type is str:
+        return JSON if '\0' in value else STRING
+    if value_type is list and not value:
+        return EMPTY_LIST
+    return JSON
+
+
+def encode_features(features: Dict[str, Any]) -> bytes:
+    """
+    Encode a feature dictionary as a binary feature vector.
+
+    Args:
+        features: Feature dictionary (string keys, JSON-compatible values)
+
+    Returns:
+        Encoded record
+    """
+    field_ids = []
+    tags = []
+    extra_names = []
+    fixed_values = []
+    strings = []
+    json_values = []
+
+    for name, value in features.items():
+        field_id = FIELD_IDS.get(name)
+        if field_id is None:
+            field_id = EXTRA_FIELD
+            extra_names.append(name)
+        field_ids.append(field_id)
+
+        tag = _type_tag(value)
+        tags.append(tag)
+        if tag in FIXED_TAGS:
+            fixed_values.append(value)
+        elif tag == STRING:
+            strings.append(value)
+        elif tag == JSON:
+            json_values.append(json.dumps(value))
+
+    count = len(field_ids)
+    header = b''.join((
+        _COUNT.pack(count),
+        struct.pack(f'<{count}H', *field_ids),
+        ''.join(tags).encode('ascii'),
+        '\0'.join(extra_names).encode('utf-8'),
+    ))
+    fixed_format = '<' + ''.join(tag for tag in tags if tag in FIXED_TAGS)
+    table = strings + json_values
+
+    return b''.join((
+        _PREFIX.pack(FORMAT_MAGIC, FORMAT_VERSION, len(header)),
+        header,
+        struct.pack(fixed_format, *fixed_values),
+        '\0'.join(table).encode('utf-8') if table else b'',
+    ))
+
+
+def _build_plan(header: bytes) -> tuple:
+    """Precompile the struct and key lists for one header layout"""
+    count = _COUNT.unpack_from(header)[0]
+    ids_end = _COUNT.size + 2 * count
+    field_ids = struct.unpack_from(f'<{count}H', header, _COUNT.size)
+    tags = header[ids_end:ids_end + count].decode('ascii')
+    extra_names = iter(header[ids_end + count:].decode('utf-8').split('\0'))
+
+    names = [FEATURE_FIELDS[field_id] if field_id != EXTRA_FIELD else next(extra_names)
+             for field_id in field_ids]
+    fixed_keys = tuple(name for name, tag in zip(names, tags) if tag in FIXED_TAGS)
+    string_keys = tuple(name for name, tag in zip(names, tags) if tag == STRING)
+    json_keys = tuple(name for name, tag in zip(names, tags) if tag == JSON)
+    constants = tuple((name, tag) for name, tag in zip(names, tags) if tag in (NONE, EMPTY_LIST))
+    fixed = struct.Struct('<' + ''.join(tag for tag in tags if tag in FIXED_TAGS))
+    return fixed, fixed_keys, string_keys, json_keys, constants
+
+
+def _plan_for(header: bytes) -> tuple:
+    plan = _plans.get(header)
+    if plan is None:
+        if len(_plans) >= MAX_CACHED_PLANS:
+            _plans.clear()
+        plan = _plans[header] = _build_plan(header)
+    return plan
+
+
+def is_legacy_encoding(data: Union[bytes, str]) -> bool:
+    """True for feature vectors stored as JSON text by older versions"""
+    return not (isinstance(data, (bytes, bytearray, memoryview))
+                and bytes(data[:2]) == FORMAT_MAGIC)
+
+
+def decode_features(data: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Decode a feature vector written by encode_features (or legacy JSON text).
+
+    Args:
+        data: Encoded record, or JSON text/bytes from a legacy cache row
+
+    Returns:
+        Feature dictionary
+
+    Raises:
+        ValueError: If the record is corrupt or from an unsupported version
+            (json.JSONDecodeError, a ValueError, for invalid legacy JSON)
+    """
+    if is_legacy_encoding(data):
+        return json.loads(data)
+
+    try:
+        _, version, header_length = _PREFIX.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported feature vector version {version}")
+        header_end = _PREFIX.size + header_length
+        fixed, fixed_keys, string_keys, json_keys, constants = _plan_for(bytes(data[_PREFIX.size:header_end]))
+
+        features = dict(zip(fixed_keys, fixed.unpack_from(data, header_end)))
+        if string_keys or json_keys:
+            table: List[str] = bytes(data[header_end + fixed.size:]).decode('utf-8').split('\0')
+            features.update(zip(string_keys, table))
+            for name, text in zip(json_keys, table[len(string_keys):]):
+                features[name] = json.loads(text)
+        for name, tag in constants:
+            features[name] = None if tag == NONE else []
+        return features
+    except (struct.error, IndexError, StopIteration, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt feature vector: {e}") from e
+
@@ -3,34 +3,53 @@ DealGenie Batch Processing Engine v1.2
 
 Implements template pre-filtering, batch feature matrix generation, and shared z-score caching
 for optimized multi-template scoring across parcels in the same census block group.
+
+When a BlockGroupStatsTable is attached (see scoring/block_group_stats.py), z-scores
+come from statistics computed over the full parcel universe, looked up per parcel
+by block group / tract. Without one, statistics fall back to the parcels in the
+current call and are not cached, so one batch never fixes another's normalization.
+
+The census block cache is a BoundedCache (LRU + TTL), so long-lived API workers
+hold at most cache_max_entries block groups and pick up refreshed statistics
+after cache_ttl_seconds.
 """
 
 import logging
-import numpy as np
-import pandas as pd
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Dict, Any, List, Optional, Tuple, Set, TYPE_CHECKING
 from collections import defaultdict
 from pathlib import Path
 
+from .bounded_cache import BoundedCache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 class BatchProcessor:
     """Handles batch processing optimization for multi-template scoring"""
     
-    def __init__(self, zoning_engine, compatibility_threshold: float = 0.5):
+    def __init__(self, zoning_engine, compatibility_threshold: float = 0.5, stats_table=None,
+                 cache_max_entries: int = 4096, cache_ttl_seconds: Optional[float] = 3600):
         """
         Initialize batch processor
         
         Args:
             zoning_engine: ZoningConstraintsEngine instance
             compatibility_threshold: Minimum compatibility for template inclusion (≥ 0.5)
+            stats_table: Optional BlockGroupStatsTable with full-universe z-score statistics
+            cache_max_entries: Maximum census block groups held in the z-score cache
+            cache_ttl_seconds: Lifetime of cached z-score statistics (None = no expiry)
         """
         self.zoning_engine = zoning_engine
         self.compatibility_threshold = compatibility_threshold
         self.templates = ['retail', 'office', 'multifamily', 'residential', 'commercial', 'industrial', 'mixed_use']
+        self.stats_table = stats_table
         
         # Cache for z-score statistics by census block group
-        self.census_block_cache = {}
+        self.census_block_cache = BoundedCache(
+            max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds, name='census_block'
+        )
         
         # Feature columns for matrix generation
         self.feature_columns = [
@@ -93,6 +112,11 @@ class BatchProcessor:
         Returns:
             Census block group identifier
         """
+        if self.stats_table is not None:
+            label, _ = self.stats_table.lookup(features)
+            if label != 'REGIONAL':
+                return label
+        
         # Use lat/lng to approximate census block group
         lat = features.get('latitude', 34.05)
         lng = features.get('longitude', -118.25)
@@ -119,9 +143,20 @@ class BatchProcessor:
             Dictionary mapping feature -> {mean, std} statistics
         """
         # Check cache first
-        if census_block_group in self.census_block_cache:
+        cached = self.census_block_cache.get(census_block_group)
+        if cached is not None:
             logger.debug(f"Using cached z-scores for {census_block_group}")
-            return self.census_block_cache[census_block_group]
+            return cached
+        
+        # Full-universe statistics for real geographies
+        if self.stats_table is not None and parcels:
+            label, z_score_stats = self.stats_table.lookup(parcels[0])
+            if label == census_block_group:
+                self.census_block_cache.set(census_block_group, z_score_stats)
+                return z_score_stats
+        
+        import numpy as np
+        import pandas as pd
         
         # Calculate statistics from parcel data
         z_score_stats = {}
@@ -154,90 +189,116 @@ class BatchProcessor:
                     'count': 0
                 }
         
-        # Cache for future use
-        self.census_block_cache[census_block_group] = z_score_stats
-        logger.info(f"Cached z-scores for {census_block_group} with {len(parcels)} parcels")
+        # Batch-derived statistics depend on which parcels were passed, so they are not cached
+        logger.debug(f"Computed batch z-scores for {census_block_group} from {len(parcels)} parcels")
         
         return z_score_stats
     
     def _get_regional_default(self, feature: str, stat_type: str) -> float:
         """Get regional default statistics for LA area"""
-        regional_defaults = {
-            'lot_size_sqft': {'mean': 7500, 'std': 5000},
-            'transit_score': {'mean': 55, 'std': 20},
-            'population_density': {'mean': 7000, 'std': 3000},
-            'median_income': {'mean': 65000, 'std': 25000},
-            'price_per_sqft': {'mean': 550, 'std': 200},
-            'crime_factor': {'mean': 1.0, 'std': 0.3}
-        }
+        from .block_group_stats import REGIONAL_DEFAULTS
         
-        return regional_defaults.get(feature, {}).get(stat_type, 1.0)
+        return REGIONAL_DEFAULTS.get(feature, {}).get(stat_type, 1.0)
     
     def build_rows(
         self,
         parcels: List[Dict[str, Any]],
         viable_templates: List[str],
         census_block_group: Optional[str] = None
-    ) -> pd.DataFrame:
+    ) -> 'pd.DataFrame':
         """
         Build feature matrix for batch processing with z-score normalization
         
+        Columns are assembled as NumPy arrays: z-scores are broadcast against
+        per-geography statistics, templates are expanded with np.repeat/np.tile,
+        and zoning caps are gathered from a (zoning code x template) table.
+        
         Args:
             parcels: List of parcel feature dictionaries
             viable_templates: Pre-filtered viable templates
-            census_block_group: Optional census block group for z-score caching
+            census_block_group: Optional census block group for z-score caching. When
+                omitted and a stats table is attached, each parcel uses its own geography.
             
         Returns:
             DataFrame with normalized features for batch processing
         """
-        if not parcels:
+        import numpy as np
+        import pandas as pd
+        
+        if not parcels or not viable_templates:
             return pd.DataFrame()
         
+        per_parcel_stats = census_block_group is None and bool(self.stats_table)
+        
         # Determine census block group if not provided
         if census_block_group is None:
             census_block_group = self.get_census_block_group(parcels[0])
         
-        # Get z-score statistics (cached if available)
-        z_score_stats = self.calculate_z_scores(parcels, census_block_group)
+        num_parcels = len(parcels)
+        num_templates = len(viable_templates)
+        default_stats = {'mean': 0, 'std': 1}
         
-        # Build feature matrix
-        rows = []
+        # Z-score statistics: one (mean, std) row per distinct geography, gathered per parcel
+        if per_parcel_stats:
+            geoid_groups = {}  # raw geography -> (label, group index); resolved once per distinct value
+            group_index = {}
+            group_stats = []
+            parcel_groups = np.empty(num_parcels, dtype=np.intp)
+            labels = []
+            for parcel_idx, parcel in enumerate(parcels):
+                geoid = (parcel.get('census_block_group'), parcel.get('census_geoid'))
+                resolved = geoid_groups.get(geoid)
+                if resolved is None:
+                    label, stats = self.stats_table.lookup(parcel)
+                    if label not in group_index:
+                        group_index[label] = len(group_stats)
+                        group_stats.append(stats)
+                    resolved = geoid_groups[geoid] = (label, group_index[label])
+                labels.append(resolved[0])
+                parcel_groups[parcel_idx] = resolved[1]
+            block_groups = np.array(labels, dtype=object)
+        else:
+            group_stats = [self.calculate_z_scores(parcels, census_block_group)]
+            parcel_groups = np.zeros(num_parcels, dtype=np.intp)
+            block_groups = np.full(num_parcels, census_block_group, dtype=object)
         
-        for parcel_idx, parcel in enumerate(parcels):
-            parcel_id = parcel.get('apn', f'parcel_{parcel_idx}')
-            zoning = parcel.get('zoning', 'R1')
-            
-            # Create base row
-            base_row = {
-                'parcel_id': parcel_id,
-                'zoning': zoning,
-                'census_block_group': census_block_group
-            }
-            
-            # Add normalized features
-            for feature in self.feature_columns:
-                raw_value = parcel.get(feature, 0)
-                
-                # Z-score normalization
-                stats = z_score_stats.get(feature, {'mean': 0, 'std': 1})
-                normalized_value = (raw_value - stats['mean']) / stats['std']
-                
-                base_row[feature] = raw_value
-                base_row[f'{feature}_zscore'] = normalized_value
-            
-            # Create template-specific rows
-            for template in viable_templates:
-                template_row = base_row.copy()
-                template_row['template'] = template
-                
-                # Add template-specific features
-                template_row['template_zoning_compatible'] = self.zoning_engine.is_compatible(template, zoning)
-                template_row['template_score_cap'] = self.zoning_engine.get_score_cap(template, zoning)
-                template_row['template_plausibility_floor'] = self.zoning_engine.get_plausibility_floor(template)
-                
-                rows.append(template_row)
+        means = np.array([[stats.get(feature, default_stats)['mean'] for feature in self.feature_columns]
+                          for stats in group_stats], dtype='float64')[parcel_groups]
+        stds = np.array([[stats.get(feature, default_stats)['std'] for feature in self.feature_columns]
+                         for stats in group_stats], dtype='float64')[parcel_groups]
         
-        df = pd.DataFrame(rows)
+        parcel_ids = np.array([parcel.get('apn', f'parcel_{idx}') for idx, parcel in enumerate(parcels)], dtype=object)
+        zonings = np.array([parcel.get('zoning', 'R1') for parcel in parcels], dtype=object)
+        raw_values = [np.asarray([parcel.get(feature, 0) for parcel in parcels]) for feature in self.feature_columns]
+        zscores = (np.column_stack(raw_values).astype('float64') - means) / stds
+        
+        # Zoning-template attributes computed once per distinct zoning code
+        unique_zonings, zoning_codes = np.unique(zonings.astype(str), return_inverse=True)
+        compatible = np.array([[self.zoning_engine.is_compatible(template, zoning) for template in viable_templates]
+                               for zoning in unique_zonings], dtype=bool)
+        score_caps = np.array([[self.zoning_engine.get_score_cap(template, zoning) for template in viable_templates]
+                               for zoning in unique_zonings], dtype='float64')
+        floors = np.array([self.zoning_engine.get_plausibility_floor(template) for template in viable_templates],
+                          dtype='float64')
+        
+        # Expand parcel-major, template-minor: row = parcel_idx * num_templates + template_idx
+        template_idx = np.tile(np.arange(num_templates), num_parcels)
+        row_zoning = np.repeat(zoning_codes, num_templates)
+        
+        columns = {
+            'parcel_id': np.repeat(parcel_ids, num_templates),
+            'zoning': np.repeat(zonings, num_templates),
+            'census_block_group': np.repeat(block_groups, num_templates),
+        }
+        for feature_idx, feature in enumerate(self.feature_columns):
+            columns[feature] = np.repeat(raw_values[feature_idx], num_templates)
+            columns[f'{feature}_zscore'] = np.repeat(zscores[:, feature_idx], num_templates)
+        columns['template'] = np.array(viable_templates, dtype=object)[template_idx]
+        columns['template_zoning_compatible'] = compatible[row_zoning, template_idx]
+        columns['template_score_cap'] = score_caps[row_zoning, template_idx]
+        columns['template_plausibility_floor'] = floors[template_idx]
+        
+        df = pd.DataFrame(columns)
         logger.info(f"Built feature matrix: {len(df)} rows for {len(parcels)} parcels × {len(viable_templates)} templates")
         
         return df
@@ -289,6 +350,10 @@ class BatchProcessor:
         else:
             self.census_block_cache.clear()
             logger.info("Cleared all z-score cache")
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss/eviction counters of the z-score cache"""
+        return self.census_block_cache.stats()
 
 def create_batch_processor(zoning_engine, compatibility_threshold: float = 0.5) -> BatchProcessor:
     """
@@ -0,0 +1,477 @@
+"""
+DealGenie Census Geography Z-Score Statistics
+
+Per-block-group and per-tract mean/std for the z-score feature columns,
+computed once over the full parcel universe instead of from whichever parcels
+happen to share a build_rows call. BatchProcessor reads the table with a
+dictionary lookup, so normalization no longer depends on batch composition.
+
+Architecture Decision: Sufficient Statistics
+- Each geography stores count, sum and sum of squares per feature; mean and
+  sample std (ddof=1) are derived on lookup
+- Sufficient statistics are additive, so a changed parcel updates its group by
+  subtracting its old contribution and adding the new one - no full rebuild
+- The offline build is a vectorized groupby over iter_feature_matrix_batches
+- numpy/pandas are imported on first use, so loading an empty table stays cheap
+
+Geography Keys:
+- Tract: census_geoid holds the ZIMAS divTab2_census_tract value ("1380.00000000"),
+  normalized to an 11-digit GEOID - LA County FIPS 06037 + zero-padded 6-digit tract
+- Block group: only from an explicit 12-digit census_block_group feature; ZIMAS
+  has no block group, so tract-only parcels never produce block-group entries
+
+Lookup Order:
+- Block group with at least min_count parcels (when census_block_group is known)
+- Tract with at least min_count parcels
+- LA regional defaults
+
+Usage:
+    python scoring/block_group_stats.py build --csv scraper/la_parcels_complete_merged.csv
+"""
+
+import logging
+import math
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "data/dealgenie.db"
+
+Z_SCORE_FEATURES = [
+    'lot_size_sqft', 'transit_score', 'population_density',
+    'median_income', 'price_per_sqft', 'crime_factor'
+]
+
+# LA regional statistics used when a geography has too few parcels
+REGIONAL_DEFAULTS = {
+    'lot_size_sqft': {'mean': 7500, 'std': 5000},
+    'transit_score': {'mean': 55, 'std': 20},
+    'population_density': {'mean': 7000, 'std': 3000},
+    'median_income': {'mean': 65000, 'std': 25000},
+    'price_per_sqft': {'mean': 550, 'std': 200},
+    'crime_factor': {'mean': 1.0, 'std': 0.3}
+}
+
+BLOCK_GROUP = 'block_group'
+TRACT = 'tract'
+
+# GEOID length per level (state 2 + county 3 + tract 6 + block group 1)
+GEOID_LENGTHS = {BLOCK_GROUP: 12, TRACT: 11}
+
+# State + county FIPS prefix for Los Angeles County
+LA_COUNTY_FIPS = '06037'
+
+
+def normalize_tract_geoid(value: Any) -> Optional[str]:
+    """
+    Normalize a census tract to its 11-digit GEOID, None if missing or a placeholder
+
+    Accepts ZIMAS tract numbers ("1380.00000000" -> "06037138000", "2011.02" ->
+    "06037201102"), bare 4/6-digit tract codes and full 11/12-digit GEOIDs.
+    The feature default "06037000000" (tract 000000) is treated as unknown.
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+
+    if text.isdigit() and len(text) in (GEOID_LENGTHS[TRACT], GEOID_LENGTHS[BLOCK_GROUP]):
+        geoid = text[:GEOID_LENGTHS[TRACT]]
+    else:
+        whole, _, fraction = text.partition('.')
+        fraction = fraction.rstrip('0') if len(fraction) > 2 else fraction
+        if not whole.isdigit() or (fraction and not fraction.isdigit()) or len(fraction) > 2:
+            return None
+        if len(whole) == 6 and not fraction:
+            tract = whole
+        elif len(whole) <= 4:
+            tract = whole.zfill(4) + fraction.ljust(2, '0')
+        else:
+            return None
+        geoid = LA_COUNTY_FIPS + tract
+
+    return None if geoid.endswith('000000') else geoid
+
+
+def geography_keys(features: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (block_group_geoid, tract_geoid) for a parcel, None where unknown
+
+    Args:
+        features: Parcel features with census_geoid (ZIMAS tract) and optionally
+            a 12-digit census_block_group GEOID
+    """
+    block_group = str(features.get('census_block_group') or '').strip()
+    if not (block_group.isdigit() and len(block_group) == GEOID_LENGTHS[BLOCK_GROUP]):
+        block_group = None
+
+    tract = normalize_tract_geoid(features.get('census_geoid'))
+    if tract is None and block_group is not None:
+        tract = normalize_tract_geoid(block_group)
+    return block_group, tract
+
+
+def regional_default_stats(features: List[str] = Z_SCORE_FEATURES) -> Dict[str, Dict[str, float]]:
+    """Regional default statistics in calculate_z_scores format"""
+    return {
+        feature: {
+            'mean': REGIONAL_DEFAULTS.get(feature, {}).get('mean', 1.0),
+            'std': REGIONAL_DEFAULTS.get(feature, {}).get('std', 1.0),
+            'count': 0
+        }
+        for feature in features
+    }
+
+
+class BlockGroupStatsTable:
+    """Census geography z-score statistics with O(1) lookup and incremental updates"""
+
+    def __init__(self, features: List[str] = None, min_count: int = 2):
+        """
+        Initialize an empty statistics table
+
+        Args:
+            features: Feature columns to track (default: Z_SCORE_FEATURES)
+            min_count: Parcels a geography needs before its own statistics are used
+        """
+        self.features = list(features or Z_SCORE_FEATURES)
+        self.min_count = min_count
+        # (level, geoid) -> array [count, sum, sum_sq] x features
+        self._accumulators: Dict[Tuple[str, str], 'np.ndarray'] = {}
+        self._resolved: Dict[Tuple[str, str], Dict[str, Dict[str, float]]] = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._accumulators)
+
+    # -- Building -----------------------------------------------------------
+
+    def add_frame(self, frame) -> int:
+        """
+        Accumulate a batch feature DataFrame with a vectorized groupby
+
+        Args:
+            frame: DataFrame with census_geoid (and optionally census_block_group) and feature columns
+
+        Returns:
+            Number of parcels accumulated
+        """
+        import numpy as np
+        import pandas as pd
+
+        if frame is None or frame.empty:
+            return 0
+
+        has_block_group = 'census_block_group' in frame.columns
+        if 'census_geoid' not in frame.columns and not has_block_group:
+            return 0
+
+        # Normalize each distinct raw value once, then map the column
+        keys = {}
+        if has_block_group:
+            raw = frame['census_block_group'].astype(str).str.strip()
+            keys[BLOCK_GROUP] = raw.where(raw.str.fullmatch(r'\d{12}'))
+        tracts = pd.Series(None, index=frame.index, dtype=object)
+        if 'census_geoid' in frame.columns:
+            raw = frame['census_geoid']
+            tracts = raw.map({value: normalize_tract_geoid(value) for value in raw.unique()})
+        if has_block_group:
+            tracts = tracts.fillna(keys[BLOCK_GROUP].str[:GEOID_LENGTHS[TRACT]])
+        keys[TRACT] = tracts
+
+        values = pd.DataFrame({
+            feature: pd.to_numeric(frame[feature], errors='coerce') if feature in frame.columns
+            else np.nan
+            for feature in self.features
+        })
+        present = values.notna()
+        filled = values.fillna(0.0)
+        parts = pd.concat([
+            present.astype('float64').add_prefix('n:'),
+            filled.add_prefix('s:'),
+            (filled * filled).add_prefix('q:'),
+        ], axis=1)
+
+        with self._lock:
+            for level, geoids in keys.items():
+                grouped = parts.groupby(geoids.to_numpy(), sort=False).sum()
+                matrix = grouped.to_numpy(dtype='float64').reshape(len(grouped), 3, len(self.features))
+                for geoid, contribution in zip(grouped.index, matrix):
+                    self._accumulate((level, geoid), contribution)
+
+        return len(frame)
+
+    def add_parcel(self, features: Dict[str, Any]):
+        """Add one parcel's contribution to its block group and tract"""
+        self._apply(features, 1.0)
+
+    def remove_parcel(self, features: Dict[str, Any]):
+        """Remove one parcel's previous contribution"""
+        self._apply(features, -1.0)
+
+    def update_parcel(self, old_features: Optional[Dict[str, Any]], new_features: Optional[Dict[str, Any]]):
+        """
+        Replace a parcel's contribution after its features (or geography) changed
+
+        Args:
+            old_features: Features the table was built with (None for a new parcel)
+            new_features: Current features (None for a deleted parcel)
+        """
+        with self._lock:
+            if old_features is not None:
+                self.remove_parcel(old_features)
+            if new_features is not None:
+                self.add_parcel(new_features)
+
+    def _apply(self, features: Dict[str, Any], sign: float):
+        import numpy as np
+
+        contribution = np.zeros((3, len(self.features)))
+        for i, feature in enumerate(self.features):
+            value = features.get(feature)
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            if math.isnan(value):
+                continue
+            contribution[:, i] = (sign, sign * value, sign * value * value)
+
+        with self._lock:
+            for level, geoid in zip((BLOCK_GROUP, TRACT), geography_keys(features)):
+                if geoid is not None:
+                    self._accumulate((level, geoid), contribution)
+
+    def _accumulate(self, key: Tuple[str, str], contribution: 'np.ndarray'):
+        current = self._accumulators.get(key)
+        updated = contribution.copy() if current is None else current + contribution
+        if updated[0].max() <= 0:
+            self._accumulators.pop(key, None)
+        else:
+            self._accumulators[key] = updated
+        self._resolved.pop(key, None)
+        self._dirty.add(key)
+
+    # -- Lookup -------------------------------------------------------------
+
+    def get_stats(self, level: str, geoid: Optional[str]) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Statistics for one geography, or None if it has no parcels
+
+        Features with fewer than min_count values fall back to regional defaults.
+        """
+        if geoid is None:
+            return None
+
+        key = (level, geoid)
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+
+        with self._lock:
+            accumulator = self._accumulators.get(key)
+            if accumulator is None:
+                return None
+
+            counts, sums, sum_sqs = accumulator
+            defaults = regional_default_stats(self.features)
+            resolved = {}
+            for i, feature in enumerate(self.features):
+                count = int(round(counts[i]))
+                if count < max(self.min_count, 2):
+                    resolved[feature] = defaults[feature]
+                    continue
+                mean = sums[i] / count
+                variance = max((sum_sqs[i] - sums[i] * mean) / (count - 1), 0.0)
+                std = math.sqrt(variance)
+                resolved[feature] = {'mean': float(mean), 'std': std if std > 1e-9 else 1.0, 'count': count}
+
+            self._resolved[key] = resolved
+            return resolved
+
+    def _has_enough(self, stats: Optional[Dict[str, Dict[str, float]]]) -> bool:
+        return stats is not None and any(entry['count'] >= self.min_count for entry in stats.values())
+
+    def lookup(self, features: Dict[str, Any]) -> Tuple[str, Dict[str, Dict[str, float]]]:
+        """
+        Resolve a parcel's statistics: block group, then tract, then regional defaults
+
+        Returns:
+            Tuple of (geography label, feature -> {mean, std, count})
+        """
+        block_group, tract = geography_keys(features)
+
+        stats = self.get_stats(BLOCK_GROUP, block_group)
+        if self._has_enough(stats):
+            return f"BG_{block_group}", stats
+
+        stats = self.get_stats(TRACT, tract)
+        if self._has_enough(stats):
+            return f"TRACT_{tract}", stats
+
+        return "REGIONAL", regional_default_stats(self.features)
+
+    # -- Persistence --------------------------------------------------------
+
+    def save(self, db_path: str = DEFAULT_DB_PATH, full: bool = False,
+             conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Write changed geographies to the block_group_stats table
+
+        Args:
+            db_path: SQLite database
+            full: Rewrite the whole table instead of only changed geographies
+            conn: Write inside this connection's open transaction (no commit)
+
+        Returns:
+            Number of geographies written
+        """
+        own_connection = conn is None
+        if own_connection:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path)
+        try:
+            _ensure_table(conn)
+            with self._lock:
+                keys = list(self._accumulators) if full else list(self._dirty)
+                if full:
+                    conn.execute("DELETE FROM block_group_stats")
+
+                for key in keys:
+                    conn.execute("DELETE FROM block_group_stats WHERE geo_level = ? AND geoid = ?", key)
+                    accumulator = self._accumulators.get(key)
+                    if accumulator is None:
+                        continue
+                    conn.executemany(
+                        "INSERT INTO block_group_stats "
+                        "(geo_level, geoid, feature, value_count, value_sum, value_sum_sq) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(key[0], key[1], feature, float(accumulator[0, i]), float(accumulator[1, i]),
+                          float(accumulator[2, i]))
+                         for i, feature in enumerate(self.features)]
+                    )
+                if own_connection:
+                    conn.commit()
+                self._dirty.clear()
+        finally:
+            if own_connection:
+                conn.close()
+
+        logger.info(f"Saved z-score statistics for {len(keys):,} geographies to {db_path}")
+        return len(keys)
+
+    @classmethod
+    def load(cls, db_path: str = DEFAULT_DB_PATH, features: List[str] = None,
+             min_count: int = 2) -> 'BlockGroupStatsTable':
+        """
+        Load a persisted table (empty if the database or table does not exist)
+        """
+        table = cls(features, min_count)
+        if not Path(db_path).exists():
+            return table
+
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT geo_level, geoid, feature, value_count, value_sum, value_sum_sq FROM block_group_stats"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        finally:
+            conn.close()
+
+        if not rows:
+            return table
+
+        import numpy as np
+
+        index = {feature: i for i, feature in enumerate(table.features)}
+        for level, geoid, feature, count, total, total_sq in rows:
+            if feature not in index:
+                continue
+            accumulator = table._accumulators.setdefault((level, geoid), np.zeros((3, len(table.features))))
+            accumulator[:, index[feature]] = (count, total, total_sq)
+
+        logger.info(f"Loaded z-score statistics for {len(table):,} geographies from {db_path}")
+        return table
+
+
+def _ensure_table(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS block_group_stats (
+            geo_level VARCHAR(20) NOT NULL,
+            geoid VARCHAR(12) NOT NULL,
+            feature VARCHAR(50) NOT NULL,
+            value_count REAL NOT NULL,
+            value_sum REAL NOT NULL,
+            value_sum_sq REAL NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (geo_level, geoid, feature)
+        )
+    ''')
+
+
+def build_block_group_stats(
+    frames: Optional[Iterable] = None,
+    csv_path: Optional[str] = None,
+    store_path: Optional[str] = None,
+    chunk_size: int = 50000
+) -> BlockGroupStatsTable:
+    """
+    Compute statistics over the full parcel universe
+
+    Args:
+        frames: Feature DataFrames to aggregate (default: every parcel via iter_feature_matrix_batches)
+        csv_path: Merged parcel CSV when frames is not given
+        store_path: Optional columnar store path
+        chunk_size: Parcels read per chunk
+
+    Returns:
+        Populated BlockGroupStatsTable
+    """
+    if frames is None:
+        from features.batch_features import iter_feature_matrix_batches
+        from features.csv_feature_matrix import DEFAULT_CSV_PATH
+
+        frames = iter_feature_matrix_batches(None, chunk_size, csv_path or DEFAULT_CSV_PATH, store_path)
+
+    table = BlockGroupStatsTable()
+    total = 0
+    for frame in frames:
+        total += table.add_frame(frame)
+
+    logger.info(f"Built z-score statistics for {len(table):,} geographies from {total:,} parcels")
+    return table
+
+
+if __name__ == "__main__":
+    import argparse
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="DealGenie Census Geography Z-Score Statistics")
+    parser.add_argument("command", choices=['build', 'info'], help="Command to execute")
+    parser.add_argument("--csv", default="scraper/la_parcels_complete_merged.csv", help="Merged parcel CSV")
+    parser.add_argument("--store", help="Columnar store path (default: <csv>.features.arrow)")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database holding block_group_stats")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        stats_table = build_block_group_stats(csv_path=args.csv, store_path=args.store)
+        written = stats_table.save(args.db, full=True)
+        print(f"✓ Z-score statistics for {written:,} geographies written to {args.db}")
+
+    elif args.command == "info":
+        stats_table = BlockGroupStatsTable.load(args.db)
+        levels = [key[0] for key in stats_table._accumulators]
+        print(f"Block groups: {levels.count(BLOCK_GROUP):,}")
+        print(f"Tracts: {levels.count(TRACT):,}")
@@ -0,0 +1,198 @@
+"""
+DealGenie Bounded In-Process Cache
+
+Thread-safe LRU cache with entry-count and byte-size limits, optional TTL, and
+hit/miss/eviction counters. Used wherever a long-lived API worker memoizes
+per-key results that would otherwise grow without bound: BatchProcessor
+census block statistics, zoning profiles for codes outside the constraints
+YAML, and the in-process tiers of GeocodeCache and ScoreCache.
+
+Key Design Patterns:
+- LRU Eviction: an OrderedDict is kept in recency order; the oldest entries are
+  evicted once max_entries or max_bytes is exceeded
+- Lazy Expiry: entries past their TTL are dropped when read or evicted, so no
+  background thread is needed
+- Pluggable Sizing: max_bytes uses a caller-supplied sizeof, defaulting to a
+  shallow recursive sys.getsizeof estimate
+
+Only the standard library is used, so any package can import it.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate memory footprint of a value in bytes (containers up to 3 levels deep)"""
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in value)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _depth + 1)
+    return size
+
+
+class BoundedCache:
+    """LRU + TTL cache with size limits and metrics"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        name: str = 'cache',
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of entries (None = unlimited)
+            max_bytes: Maximum total estimated size of values (None = unlimited)
+            ttl_seconds: Entry lifetime (None = never expires)
+            sizeof: Function estimating a value's size in bytes (used with max_bytes)
+            name: Label reported in stats
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof
+        self.name = name
+        self._clock = clock
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.reset_stats()
+
+    # -- Lookup -------------------------------------------------------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (refreshing its recency) or default"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                if entry[1] is not None and entry[1] <= self._clock():
+                    self._remove(key)
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+            self.misses += 1
+            return default
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            return entry is not _MISSING and (entry[1] is None or entry[1] > self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value, computing and storing it on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    # -- Mutation -----------------------------------------------------------
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        Store a value, evicting least-recently-used entries as needed
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Override the cache-wide TTL for this entry
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return  # Would evict everything and still not fit
+
+            expires_at = self._clock() + ttl if ttl is not None else None
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict()
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a value"""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._remove(key)[0]
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> Tuple[Any, Optional[float], int]:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[2]
+        return entry
+
+    def _evict(self):
+        now = self._clock()
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key, entry = next(iter(self._entries.items()))
+            self._remove(key)
+            if entry[1] is not None and entry[1] <= now:
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    # -- Metrics ------------------------------------------------------------
+
+    def reset_stats(self):
+        """Zero the hit/miss/eviction counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of size and counters"""
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self._entries),
+            'bytes': self._bytes if self.max_bytes is not None else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -5,12 +5,21 @@ Implements confidence scoring formula with weighted components:
 - 50% score margin (sigmoid function)  
 - 30% data coverage percentage
 - 20% zoning compatibility
+
+calculate_confidence_batch computes the same components for a whole
+(parcels x templates) score matrix with NumPy. Values that go through math.exp
+are evaluated once per distinct score margin, so batch results are identical
+to calculate_overall_confidence rather than merely close.
 """
 
 import math
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from .geographic_calibration import GeographicCalibrator
+from typing import Dict, Any, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from .engine_registry import get_geographic_calibrator, get_confidence_engine
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +41,7 @@ class ConfidenceEngine:
         self.SIGMOID_MIDPOINT = 1.0   # Was 2.0 - lower midpoint
         
         # Geographic calibrator for location adjustments
-        self.geo_calibrator = GeographicCalibrator()
+        self.geo_calibrator = get_geographic_calibrator()
         
         # Data coverage thresholds
         self.REQUIRED_FIELDS = [
@@ -302,6 +311,138 @@ class ConfidenceEngine:
             analysis['interpretation'] = 'Very low confidence, do not make primary recommendations'
         
         return overall_confidence, analysis
+    
+    def calculate_confidence_batch(
+        self,
+        score_matrix: 'np.ndarray',
+        features_frame: 'pd.DataFrame',
+        zoning_array: Sequence[str],
+        templates: Sequence[str],
+        zoning_engine,
+        secondary_scores: Optional['np.ndarray'] = None
+    ) -> Dict[str, 'np.ndarray']:
+        """
+        Vectorized calculate_overall_confidence for every parcel x template
+        
+        Args:
+            score_matrix: (parcels x templates) constrained scores; NaN marks templates
+                that were not scored (their confidence is NaN)
+            features_frame: Parcel features, one row per score_matrix row
+            zoning_array: Zoning code per parcel
+            templates: Template of each score_matrix column
+            zoning_engine: ZoningConstraintsEngine instance
+            secondary_scores: Second-highest score per parcel (default: derived from
+                score_matrix the way MultiTemplateScorer does)
+            
+        Returns:
+            Dictionary of (parcels x templates) arrays: 'confidence', 'base_confidence',
+            'score_margin', 'data_coverage', 'zoning_compatibility', 'score_quality',
+            'confidence_level'; plus per-parcel 'neighborhood_tier' and 'secondary_score'
+        """
+        import numpy as np
+        import pandas as pd
+        
+        scores = np.asarray(score_matrix, dtype='float64')
+        if scores.ndim != 2 or scores.shape[1] != len(templates):
+            raise ValueError(f"score_matrix must be (parcels x {len(templates)}), got {scores.shape}")
+        num_parcels = scores.shape[0]
+        scored = ~np.isnan(scores)
+        
+        # Secondary score: second highest scored template, 0.0 when fewer than two
+        if secondary_scores is None:
+            ranked = -np.sort(np.where(scored, -scores, np.inf), axis=1)
+            secondary_scores = np.zeros(num_parcels)
+            if scores.shape[1] > 1:
+                second = ranked[:, 1]
+                secondary_scores = np.where(np.isfinite(second), second, 0.0)
+        secondary_scores = np.asarray(secondary_scores, dtype='float64')
+        
+        # Score margin sigmoid, evaluated with math.exp once per distinct margin
+        margins = scores - secondary_scores[:, None]
+        unique_margins, margin_codes = np.unique(np.where(scored, margins, 0.0), return_inverse=True)
+        sigmoid = np.array([
+            1.0 / (1.0 + math.exp(-self.SIGMOID_STEEPNESS * (margin - self.SIGMOID_MIDPOINT)))
+            for margin in unique_margins.tolist()
+        ])
+        margin_conf = sigmoid[margin_codes.reshape(scores.shape)]
+        
+        # Data coverage: present means not null, not '' and not 0
+        present_count = np.zeros(num_parcels, dtype=np.intp)
+        for field in self.REQUIRED_FIELDS:
+            if field not in features_frame.columns:
+                continue
+            values = features_frame[field]
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                present = values.notna().to_numpy() & (values != 0).to_numpy()
+            else:
+                present = values.map(lambda v: v is not None and v == v and v != '' and v != 0).to_numpy(dtype=bool)
+            present_count += present
+        coverage_conf = (present_count / len(self.REQUIRED_FIELDS))[:, None]
+        
+        # Zoning compatibility strength, once per distinct zoning code and template
+        zoning_codes, unique_zonings = pd.factorize(pd.Series(list(zoning_array), dtype=object), sort=False)
+        compat_table = np.array([
+            [self.calculate_zoning_compatibility_confidence(template, zoning, zoning_engine)[0]
+             for template in templates]
+            for zoning in unique_zonings
+        ], dtype='float64').reshape(len(unique_zonings), len(templates))
+        compat_conf = compat_table[zoning_codes]
+        
+        # Score quality, piecewise linear in the absolute score
+        quality_conf = np.select(
+            [scores >= 8.0, scores >= 6.0, scores >= 4.0],
+            [0.9 + (scores - 8.0) * 0.05, 0.6 + (scores - 6.0) * 0.15, 0.3 + (scores - 4.0) * 0.15],
+            default=scores * 0.075
+        )
+        
+        base_confidence = (
+            margin_conf * self.SCORE_MARGIN_WEIGHT +
+            coverage_conf * self.DATA_COVERAGE_WEIGHT +
+            compat_conf * self.ZONING_COMPAT_WEIGHT +
+            quality_conf * self.SCORE_QUALITY_WEIGHT
+        )
+        
+        # Geographic adjustment by neighborhood tier
+        calibrator = self.geo_calibrator
+        income = self._column_or_default(features_frame, 'median_income', 50000)
+        price = self._column_or_default(features_frame, 'price_per_sqft', 400)
+        tier_names = ['premium', 'high', 'mid']
+        tiers = np.select(
+            [(income >= calibrator.income_thresholds[tier]) & (price >= calibrator.price_thresholds[tier])
+             for tier in tier_names],
+            tier_names, default='challenging'
+        )
+        multipliers = np.array([calibrator.confidence_multipliers[tier] for tier in tiers.tolist()])
+        confidence = np.minimum(base_confidence * multipliers[:, None], 1.0)
+        
+        confidence = np.where(scored, confidence, np.nan)
+        confidence_level = np.select(
+            [confidence >= 0.8, confidence >= 0.6, confidence >= 0.5],
+            ['high', 'medium', 'low'], default='very_low'
+        ).astype(object)
+        confidence_level[~scored] = None
+        
+        return {
+            'confidence': confidence,
+            'base_confidence': np.where(scored, base_confidence, np.nan),
+            'score_margin': np.where(scored, margin_conf, np.nan),
+            'data_coverage': np.where(scored, np.broadcast_to(coverage_conf, scores.shape), np.nan),
+            'zoning_compatibility': np.where(scored, compat_conf, np.nan),
+            'score_quality': np.where(scored, quality_conf, np.nan),
+            'confidence_level': confidence_level,
+            'neighborhood_tier': tiers.astype(object),
+            'secondary_score': secondary_scores,
+        }
+    
+    @staticmethod
+    def _column_or_default(frame: 'pd.DataFrame', column: str, default: float) -> 'np.ndarray':
+        """Numeric column with features.get(column, default) semantics for absent cells"""
+        import numpy as np
+        import pandas as pd
+        
+        if column not in frame.columns:
+            return np.full(len(frame), float(default))
+        return pd.to_numeric(frame[column], errors='coerce').fillna(default).to_numpy(dtype='float64')
 
 def calculate_confidence_score(
     primary_score: float,
@@ -325,7 +466,7 @@ def calculate_confidence_score(
     Returns:
         Tuple of (confidence_score, detailed_analysis)
     """
-    engine = ConfidenceEngine()
+    engine = get_confidence_engine()
     return engine.calculate_overall_confidence(
         primary_score, secondary_score, features, template, zoning, zoning_engine
     )
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+DealGenie Scoring Engine Registry
+
+Process-wide cache of parsed YAML configs and shared scoring engines. The
+scoring engines are read-only after construction, so a CLI run or API worker
+can build each one once and hand the same instance to every
+MultiTemplateScorer instead of re-parsing the same YAML files per request.
+
+Key Design Patterns:
+- Config Cache: YAML parsed once per (path, mtime); editing a file invalidates it
+- Shared Engines: one ZoningConstraintsEngine / MultiTemplateEngine per config file,
+  one ConfidenceEngine and GeographicCalibrator per process
+- Shared Statistics: the z-score table reloads when its database file changes,
+  and the shared BatchProcessor is rebuilt around the reloaded table
+- Lazy Imports: yaml and engine modules are imported on first use only
+
+Callers must treat returned configs and engines as read-only.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.RLock()
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_engine_cache: Dict[Tuple[str, Optional[str]], Tuple[Tuple[Optional[int], Any], Any]] = {}
+
+
+def _config_mtime(config_path: Optional[str]) -> Optional[int]:
+    try:
+        return os.stat(config_path).st_mtime_ns if config_path else None
+    except OSError:
+        return None
+
+
+def load_yaml_config(config_path) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, cached by path and modification time.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Parsed configuration (shared; do not mutate)
+
+    Raises:
+        OSError / yaml.YAMLError if the file cannot be read or parsed
+    """
+    import yaml
+
+    key = str(Path(config_path).resolve())
+    mtime = os.stat(key).st_mtime_ns
+
+    with _lock:
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    with open(key, 'r') as f:
+        config = yaml.safe_load(f)
+
+    with _lock:
+        _config_cache[key] = (mtime, config)
+    return config
+
+
+def _shared(kind: str, config_path: Optional[str], factory, version: Any = None):
+    """
+    Return the cached engine for (kind, config), rebuilding it if the config changed.
+
+    version is an extra staleness token compared alongside the config mtime
+    (e.g. the identity of a dependency the engine was built with).
+    """
+    key = (kind, str(config_path) if config_path is not None else None)
+    stamp = (_config_mtime(config_path), version)
+
+    with _lock:
+        cached = _engine_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        engine = factory()
+        _engine_cache[key] = (stamp, engine)
+        logger.debug(f"Registered shared {kind} engine for {config_path or 'defaults'}")
+        return engine
+
+
+def get_zoning_engine(config_path: Optional[str] = None):
+    """Shared ZoningConstraintsEngine for a constraints YAML (default: LA-enhanced)"""
+    from .zoning_engine import ZoningConstraintsEngine, default_constraints_path
+
+    path = config_path or default_constraints_path()
+    return _shared('zoning', path, lambda: ZoningConstraintsEngine(path))
+
+
+def get_multi_template_engine(config_path: Optional[str] = None):
+    """Shared MultiTemplateEngine for an environment YAML"""
+    from .multi_template_engine import MultiTemplateEngine, DEFAULT_ENVIRONMENT_CONFIG
+
+    path = config_path or DEFAULT_ENVIRONMENT_CONFIG
+    return _shared('multi_template', path, lambda: MultiTemplateEngine(path))
+
+
+def get_geographic_calibrator():
+    """Shared GeographicCalibrator"""
+    from .geographic_calibration import GeographicCalibrator
+
+    return _shared('geographic', None, GeographicCalibrator)
+
+
+def get_confidence_engine():
+    """Shared ConfidenceEngine"""
+    from .confidence_engine import ConfidenceEngine
+
+    return _shared('confidence', None, ConfidenceEngine)
+
+
+def get_block_group_stats(db_path: Optional[str] = None):
+    """
+    Shared BlockGroupStatsTable loaded from the database, reloaded when the database
+    file (or its WAL) changes so a rebuilt statistics table is picked up
+    """
+    from .block_group_stats import BlockGroupStatsTable, DEFAULT_DB_PATH
+
+    path = str(db_path or DEFAULT_DB_PATH)
+    return _shared('block_group_stats', path, lambda: BlockGroupStatsTable.load(path),
+                   version=_config_mtime(f"{path}-wal"))
+
+
+def get_batch_processor(config_path: Optional[str] = None, stats_db_path: Optional[str] = None):
+    """Shared BatchProcessor bound to the shared zoning engine and z-score statistics"""
+    from .batch_processor import BatchProcessor
+    from .zoning_engine import default_constraints_path
+
+    path = config_path or default_constraints_path()
+    zoning_engine = get_zoning_engine(path)
+    stats_table = get_block_group_stats(stats_db_path)
+    return _shared('batch', path, lambda: BatchProcessor(zoning_engine, stats_table=stats_table or None),
+                   version=(id(zoning_engine), id(stats_table)))
+
+
+def get_multi_template_scorer(config_path: Optional[str] = None):
+    """Shared MultiTemplateScorer for an environment YAML"""
+    from .multi_template_scorer import MultiTemplateScorer
+    from .multi_template_engine import DEFAULT_ENVIRONMENT_CONFIG
+
+    path = config_path or DEFAULT_ENVIRONMENT_CONFIG
+    return _shared('multi_template_scorer', path, lambda: MultiTemplateScorer(path))
+
+
+def clear_registry():
+    """Drop all cached configs and engines (tests, config hot-reload)"""
+    with _lock:
+        _config_cache.clear()
+        _engine_cache.clear()
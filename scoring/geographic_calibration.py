@@ -5,7 +5,7 @@ Implements location-based confidence adjustments based on LA neighborhood tiers.
 Premium areas get confidence boosts while challenging areas get penalties.
 """
 
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Optional
 
 class GeographicCalibrator:
     """Calibrates confidence based on LA neighborhood characteristics"""
@@ -102,7 +102,8 @@ class GeographicCalibrator:
     def adjust_score_for_location(
         self,
         base_score: float,
-        features: Dict[str, Any]
+        features: Dict[str, Any],
+        tier: Optional[str] = None
     ) -> Tuple[float, Dict[str, Any]]:
         """
         Apply subtle score adjustments based on location
@@ -110,11 +111,13 @@ class GeographicCalibrator:
         Args:
             base_score: Original template score (0-10)
             features: Property features
+            tier: Precomputed neighborhood tier (looked up from features if omitted)
             
         Returns:
             Tuple of (adjusted_score, adjustment_details)
         """
-        tier = self.get_neighborhood_tier(features)
+        if tier is None:
+            tier = self.get_neighborhood_tier(features)
         adjustment = self.score_adjustments[tier]
         
         # Apply adjustment but keep within 0-10 range
@@ -5,13 +5,16 @@ Implements compatibility matrix logic and multi-template trigger rules.
 Determines when to run multi-template scoring based on trigger conditions.
 """
 
-import yaml
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from .engine_registry import load_yaml_config, get_multi_template_engine
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_ENVIRONMENT_CONFIG = Path(__file__).parent.parent / "config" / "environment_v12.yml"
+
 class MultiTemplateEngine:
     """Handles multi-template scoring triggers and compatibility analysis"""
     
@@ -23,7 +26,7 @@ class MultiTemplateEngine:
             config_path: Path to environment_v12.yml config file
         """
         if config_path is None:
-            config_path = Path(__file__).parent.parent / "config" / "environment_v12.yml"
+            config_path = DEFAULT_ENVIRONMENT_CONFIG
         
         self.config = self._load_config(config_path)
         self.templates = self.config.get('templates', [])
@@ -40,8 +43,7 @@ class MultiTemplateEngine:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load environment configuration from YAML"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(config_path)
             logger.info(f"Loaded multi-template config from {config_path}")
             return config
         except Exception as e:
@@ -279,5 +281,5 @@ def should_run_multi_template_scoring(
     Returns:
         Tuple of (should_run, trigger_analysis)
     """
-    engine = MultiTemplateEngine(config_path)
+    engine = get_multi_template_engine(config_path)
     return engine.should_run_multi_template(zoning, template_scores, compatibility_scores)
\ No newline at end of file
@@ -7,18 +7,22 @@ primary/secondary/tertiary recommendations based on threshold rules.
 """
 
 import logging
-import yaml
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
-from .engine import calculate_score
-from .zoning_engine import ZoningConstraintsEngine
-from .multi_template_engine import MultiTemplateEngine
-from .confidence_engine import ConfidenceEngine
-from .batch_processor import BatchProcessor
+from .engine import calculate_score, calculate_template_scores
+from .multi_template_engine import DEFAULT_ENVIRONMENT_CONFIG
 from .business_logic_fixes import determine_recommendations_fixed, format_business_guidance
-from .geographic_calibration import GeographicCalibrator
+from .engine_registry import (
+    load_yaml_config,
+    get_zoning_engine,
+    get_multi_template_engine,
+    get_confidence_engine,
+    get_batch_processor,
+    get_geographic_calibrator,
+    get_multi_template_scorer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,18 +37,18 @@ class MultiTemplateScorer:
             config_path: Path to environment_v12.yml config file
         """
         if config_path is None:
-            config_path = Path(__file__).parent.parent / "config" / "environment_v12.yml"
+            config_path = DEFAULT_ENVIRONMENT_CONFIG
         
         # Load configuration
         self.config = self._load_config(config_path)
         self.thresholds = self.config.get('confidence_thresholds', {})
         
-        # Initialize component engines
-        self.zoning_engine = ZoningConstraintsEngine()
-        self.multi_engine = MultiTemplateEngine(config_path)
-        self.confidence_engine = ConfidenceEngine()
-        self.batch_processor = BatchProcessor(self.zoning_engine)
-        self.geo_calibrator = GeographicCalibrator()
+        # Component engines are shared per process (configs parsed once)
+        self.zoning_engine = get_zoning_engine()
+        self.multi_engine = get_multi_template_engine(config_path)
+        self.confidence_engine = get_confidence_engine()
+        self.batch_processor = get_batch_processor()
+        self.geo_calibrator = get_geographic_calibrator()
         
         # Recommendation thresholds from config
         self.CONF_PRIMARY_MIN = self.thresholds.get('CONF_PRIMARY_MIN', 1.5)
@@ -56,8 +60,7 @@ class MultiTemplateScorer:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(config_path)
             logger.info(f"Loaded multi-template config from {config_path}")
             return config
         except Exception as e:
@@ -92,49 +95,105 @@ class MultiTemplateScorer:
         try:
             # Calculate raw score using existing engine
             raw_result = calculate_score(features, template)
-            raw_score = raw_result['score']
-            zoning = features.get('zoning', 'R1')
+            return self._build_template_result(features, template, raw_result, apply_constraints)
             
-            result = {
-                'template': template,
-                'raw_score': raw_score,
-                'constrained_score': raw_score,
-                'viable': raw_score >= self.TEMPLATE_VIABLE_MIN,
-                'strong': raw_score >= self.TEMPLATE_STRONG_MIN,
-                'zoning': zoning,
-                'constraints_applied': {},
-                'raw_result': raw_result
-            }
+        except Exception as e:
+            logger.error(f"Error scoring template {template}: {e}")
+            return self._template_error_result(template, e)
+    
+    def score_templates(
+        self,
+        features: Dict[str, Any],
+        templates: List[str],
+        apply_constraints: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score several templates in one pass over the parcel features
+        
+        Template-independent score components, penalties and the neighborhood
+        tier are computed once; each entry equals score_single_template.
+        
+        Args:
+            features: Property features dictionary
+            templates: Templates to score
+            apply_constraints: Whether to apply zoning constraints
             
-            # Apply zoning constraints if requested
-            if apply_constraints:
-                constrained_score, constraints = self.zoning_engine.apply_constraints(
-                    raw_score, template, zoning
-                )
-                
-                # Apply geographic adjustment to score
-                adjusted_score, geo_details = self.geo_calibrator.adjust_score_for_location(
-                    constrained_score, features
+        Returns:
+            Dictionary of template -> template scoring result
+        """
+        raw_results = calculate_template_scores(features, templates)
+        
+        tier = None
+        if apply_constraints:
+            try:
+                tier = self.geo_calibrator.get_neighborhood_tier(features)
+            except Exception:
+                tier = None  # Let each template surface the error as score_single_template would
+        
+        template_results = {}
+        for template in templates:
+            try:
+                template_results[template] = self._build_template_result(
+                    features, template, raw_results[template], apply_constraints, tier
                 )
-                
-                result['constrained_score'] = adjusted_score
-                result['constraints_applied'] = constraints
-                result['geographic_adjustment'] = geo_details
-                result['viable'] = adjusted_score >= self.TEMPLATE_VIABLE_MIN
-                result['strong'] = adjusted_score >= self.TEMPLATE_STRONG_MIN
+            except Exception as e:
+                logger.error(f"Error scoring template {template}: {e}")
+                template_results[template] = self._template_error_result(template, e)
+        
+        return template_results
+    
+    def _build_template_result(
+        self,
+        features: Dict[str, Any],
+        template: str,
+        raw_result: Dict[str, Any],
+        apply_constraints: bool,
+        tier: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Wrap a raw engine result with zoning constraints and geographic adjustment"""
+        raw_score = raw_result['score']
+        zoning = features.get('zoning', 'R1')
+        
+        result = {
+            'template': template,
+            'raw_score': raw_score,
+            'constrained_score': raw_score,
+            'viable': raw_score >= self.TEMPLATE_VIABLE_MIN,
+            'strong': raw_score >= self.TEMPLATE_STRONG_MIN,
+            'zoning': zoning,
+            'constraints_applied': {},
+            'raw_result': raw_result
+        }
+        
+        # Apply zoning constraints if requested
+        if apply_constraints:
+            constrained_score, constraints = self.zoning_engine.apply_constraints(
+                raw_score, template, zoning
+            )
             
-            return result
+            # Apply geographic adjustment to score
+            adjusted_score, geo_details = self.geo_calibrator.adjust_score_for_location(
+                constrained_score, features, tier
+            )
             
-        except Exception as e:
-            logger.error(f"Error scoring template {template}: {e}")
-            return {
-                'template': template,
-                'raw_score': 0.0,
-                'constrained_score': 0.0,
-                'viable': False,
-                'strong': False,
-                'error': str(e)
-            }
+            result['constrained_score'] = adjusted_score
+            result['constraints_applied'] = constraints
+            result['geographic_adjustment'] = geo_details
+            result['viable'] = adjusted_score >= self.TEMPLATE_VIABLE_MIN
+            result['strong'] = adjusted_score >= self.TEMPLATE_STRONG_MIN
+        
+        return result
+    
+    def _template_error_result(self, template: str, error: Exception) -> Dict[str, Any]:
+        """Zero-score result for a template that failed to score"""
+        return {
+            'template': template,
+            'raw_score': 0.0,
+            'constrained_score': 0.0,
+            'viable': False,
+            'strong': False,
+            'error': str(error)
+        }
     
     def process_multi_template(
         self,
@@ -161,14 +220,11 @@ class MultiTemplateScorer:
             logger.warning(f"No viable templates for parcel {parcel_id} with zoning {zoning}")
             return self._create_empty_result(parcel_id, zoning, "no_viable_templates")
         
-        # Step 2: Score all viable templates
-        template_results = {}
-        template_scores = {}
-        
-        for template in viable_templates:
-            result = self.score_single_template(features, template, apply_constraints=True)
-            template_results[template] = result
-            template_scores[template] = result['constrained_score']
+        # Step 2: Score all viable templates in a single pass
+        template_results = self.score_templates(features, viable_templates, apply_constraints=True)
+        template_scores = {
+            template: result['constrained_score'] for template, result in template_results.items()
+        }
         
         # Step 3: Check if multi-template triggers are met (unless forced)
         should_run_multi = force_multi_template
@@ -377,7 +433,8 @@ class MultiTemplateScorer:
 def score_parcel_multi_template(
     features: Dict[str, Any],
     force_multi_template: bool = False,
-    config_path: Optional[str] = None
+    config_path: Optional[str] = None,
+    score_cache=None
 ) -> Dict[str, Any]:
     """
     Convenience function to score a parcel with multi-template logic
@@ -386,9 +443,12 @@ def score_parcel_multi_template(
         features: Property features dictionary
         force_multi_template: Force multi-template even if not triggered
         config_path: Optional path to config file
+        score_cache: Optional ScoreCache; unchanged parcels are served from it
         
     Returns:
         Multi-template scoring result
     """
-    scorer = MultiTemplateScorer(config_path)
+    scorer = get_multi_template_scorer(config_path)
+    if score_cache is not None:
+        return score_cache.process_multi_template(features, force_multi_template, scorer)[0]
     return scorer.process_multi_template(features, force_multi_template)
\ No newline at end of file
@@ -4,15 +4,177 @@ DealGenie Result Formatting Engine v1.2
 Implements result ranking logic and output formatting for multi-template results.
 Creates JSON payload structure with viable_uses array, primary recommendation, 
 and alternatives list as specified in v1.2.
+
+Architecture Decision: Lazily Formatted Payload Sections
+- format_multi_template_result returns a FormattedResult, a dict whose
+  viable_uses, primary_recommendation and alternatives sections (ranking,
+  reasoning text, risk factors) are built on first access or serialization
+- Scalar fields and meta reference the scoring result without copying
+- Batch callers that only need scores use scores_only=True, which skips the
+  sections entirely and emits a flat per-template score payload
 """
 
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# v1.2 payload key order
+PAYLOAD_KEYS = (
+    'version', 'parcel_id', 'zoning', 'scoring_method', 'scored_at',
+    'viable_uses', 'primary_recommendation', 'alternatives',
+    'analysis_type', 'business_guidance', 'viable_options', 'tied_options',
+    'meta'
+)
+
+# Analysis types that deliberately carry no primary recommendation
+NO_PRIMARY_ANALYSIS_TYPES = ('multiple_viable_options', 'statistical_tie')
+
+
+class FormattedResult(dict):
+    """
+    v1.2 payload whose expensive sections are formatted on first use
+    
+    Behaves as a dict: reading a pending section builds just that section,
+    while iteration, items(), equality, copying, pickling and json.dumps
+    build every pending section first. If a section fails to build, the
+    payload becomes the formatter's error payload, as the eager formatter
+    returned.
+    """
+    
+    __slots__ = ('_pending', '_on_error', '_ordered')
+    
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        pending: Dict[str, Callable[[], Any]],
+        on_error: Callable[[str], Dict[str, Any]]
+    ):
+        """
+        Args:
+            fields: Payload fields that are already formatted
+            pending: Section name -> zero-argument builder
+            on_error: Builds the error payload from an error message
+        """
+        super().__init__(fields)
+        self._pending = dict(pending)
+        self._on_error = on_error
+        self._ordered = not pending
+    
+    @property
+    def is_resolved(self) -> bool:
+        """True once every section has been formatted"""
+        return not self._pending
+    
+    def _resolve_section(self, key: str):
+        builder = self._pending.pop(key)
+        try:
+            value = builder()
+        except Exception as e:
+            logger.error(f"Error formatting {key} for parcel {dict.get(self, 'parcel_id', 'unknown')}: {e}")
+            error_payload = self._on_error(str(e))
+            self._pending.clear()
+            dict.clear(self)
+            dict.update(self, error_payload)
+            self._ordered = True
+            return
+        dict.__setitem__(self, key, value)
+    
+    def resolve(self) -> 'FormattedResult':
+        """Format all pending sections (keys end up in v1.2 payload order)"""
+        while self._pending:
+            self._resolve_section(next(iter(self._pending)))
+        if not self._ordered:
+            ordered = [(key, dict.__getitem__(self, key)) for key in PAYLOAD_KEYS if dict.__contains__(self, key)]
+            ordered += [(key, value) for key, value in dict.items(self) if key not in PAYLOAD_KEYS]
+            dict.clear(self)
+            dict.update(self, ordered)
+            self._ordered = True
+        return self
+    
+    def __getitem__(self, key):
+        if key in self._pending:
+            self._resolve_section(key)
+        return dict.__getitem__(self, key)
+    
+    def get(self, key, default=None):
+        if key in self._pending:
+            self._resolve_section(key)
+        return dict.get(self, key, default)
+    
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+    
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+    
+    def __iter__(self):
+        return dict.__iter__(self.resolve())
+    
+    def keys(self):
+        return dict.keys(self.resolve())
+    
+    def values(self):
+        return dict.values(self.resolve())
+    
+    def items(self):
+        return dict.items(self.resolve())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FormattedResult):
+            other.resolve()
+        return dict.__eq__(self.resolve(), other)
+    
+    def __ne__(self, other) -> bool:
+        return not self == other
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return dict.__repr__(self.resolve())
+    
+    def copy(self) -> Dict[str, Any]:
+        """Plain dict copy of the fully formatted payload"""
+        return dict(dict.items(self.resolve()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fully formatted payload"""
+        return self.copy()
+    
+    def __reduce__(self):
+        # Unpickles (e.g. across worker processes) as the plain formatted dict
+        return (dict, (self.copy(),))
+    
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+    
+    def __delitem__(self, key):
+        dict.__delitem__(self.resolve(), key)
+    
+    def pop(self, *args):
+        return dict.pop(self.resolve(), *args)
+    
+    def popitem(self):
+        return dict.popitem(self.resolve())
+    
+    def setdefault(self, key, default=None):
+        return dict.setdefault(self.resolve(), key, default)
+    
+    def update(self, *args, **kwargs):
+        dict.update(self.resolve(), *args, **kwargs)
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def clear(self):
+        self._pending.clear()
+        dict.clear(self)
+
+
 class ResultFormatter:
     """Handles result ranking and JSON payload formatting"""
     
@@ -27,6 +189,9 @@ class ResultFormatter:
         """
         Format multi-template scoring result into v1.2 JSON payload structure
         
+        The viable_uses, primary_recommendation and alternatives sections are
+        formatted on first access (see FormattedResult).
+        
         Args:
             scoring_result: Result from MultiTemplateScorer.process_multi_template()
             
@@ -46,41 +211,30 @@ class ResultFormatter:
             template_results = scoring_result.get('template_results', {})
             template_confidences = scoring_result.get('template_confidences', {})
             
-            # Build viable_uses array
-            viable_uses = self._build_viable_uses_array(
-                template_results, template_confidences, recommendations
-            )
-            
-            # Build primary recommendation (handle new business logic)
             analysis_type = recommendations.get('analysis_type', 'clear_ranking')
             primary_rec = recommendations.get('primary')
             
-            if analysis_type in ['multiple_viable_options', 'statistical_tie']:
-                # No primary recommendation for these cases
-                primary_recommendation = None
-            else:
-                primary_recommendation = self._build_primary_recommendation(
+            # Sections built on first access
+            pending = {
+                'viable_uses': lambda: self._build_viable_uses_array(
+                    template_results, template_confidences, recommendations
+                ),
+                'primary_recommendation': lambda: self._build_primary_recommendation(
                     primary_rec, template_results, template_confidences
-                )
-            
-            # Build alternatives list
-            alternatives = self._build_alternatives_list(
-                recommendations, template_results, template_confidences
-            )
+                ),
+                'alternatives': lambda: self._build_alternatives_list(
+                    recommendations, template_results, template_confidences
+                ),
+            }
             
             # Create main payload structure
-            payload = {
+            fields = {
                 'version': self.version,
                 'parcel_id': parcel_id,
                 'zoning': zoning,
                 'scoring_method': 'multi_template' if multi_triggered else 'single_template',
                 'scored_at': scoring_result.get('processing_timestamp', datetime.now().isoformat()),
                 
-                # Core results
-                'viable_uses': viable_uses,
-                'primary_recommendation': primary_recommendation,
-                'alternatives': alternatives,
-                
                 # Business logic results
                 'analysis_type': analysis_type,
                 'business_guidance': recommendations.get('business_guidance', ''),
@@ -88,16 +242,18 @@ class ResultFormatter:
                 'tied_options': recommendations.get('tied_options', []),
                 
                 # Metadata
-                'meta': {
-                    'templates_evaluated': scoring_result.get('viable_templates_count', 0),
-                    'templates_scored': scoring_result.get('scored_templates_count', 0),
-                    'multi_template_triggered': multi_triggered,
-                    'trigger_analysis': scoring_result.get('trigger_analysis', {}),
-                    'compatibility_scores': scoring_result.get('compatibility_scores', {})
-                }
+                'meta': self._build_meta(scoring_result, multi_triggered)
             }
             
-            return payload
+            if analysis_type in NO_PRIMARY_ANALYSIS_TYPES:
+                # No primary recommendation for these cases
+                del pending['primary_recommendation']
+                fields['primary_recommendation'] = None
+            
+            return FormattedResult(
+                fields, pending,
+                on_error=lambda message: self._create_error_payload(parcel_id, zoning, message)
+            )
             
         except Exception as e:
             import traceback
@@ -109,6 +265,74 @@ class ResultFormatter:
                 str(e)
             )
     
+    def _build_meta(self, scoring_result: Dict[str, Any], multi_triggered: bool) -> Dict[str, Any]:
+        """Payload meta section"""
+        return {
+            'templates_evaluated': scoring_result.get('viable_templates_count', 0),
+            'templates_scored': scoring_result.get('scored_templates_count', 0),
+            'multi_template_triggered': multi_triggered,
+            'trigger_analysis': scoring_result.get('trigger_analysis', {}),
+            'compatibility_scores': scoring_result.get('compatibility_scores', {})
+        }
+    
+    def format_scores_only(self, scoring_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format only the scores of a multi-template result (batch fast path)
+        
+        Skips viable_uses, reasoning text, risk factors and alternatives.
+        
+        Args:
+            scoring_result: Result from MultiTemplateScorer.process_multi_template()
+            
+        Returns:
+            Flat payload with per-template scores and the primary template
+        """
+        if scoring_result is None:
+            return self._create_error_payload('unknown', 'unknown', 'Scoring result is None')
+        
+        try:
+            multi_triggered = scoring_result.get('multi_template_triggered', False)
+            recommendations = scoring_result.get('recommendations') or {}
+            analysis_type = recommendations.get('analysis_type', 'clear_ranking')
+            primary_rec = recommendations.get('primary')
+            if analysis_type in NO_PRIMARY_ANALYSIS_TYPES:
+                primary_rec = None
+            
+            ranked = sorted(
+                ((template, result['constrained_score'])
+                 for template, result in scoring_result.get('template_results', {}).items()
+                 if result.get('viable', False)),
+                key=lambda entry: entry[1],
+                reverse=True
+            )
+            
+            return {
+                'version': self.version,
+                'parcel_id': scoring_result.get('parcel_id', 'unknown'),
+                'zoning': scoring_result.get('zoning', 'unknown'),
+                'scoring_method': 'multi_template' if multi_triggered else 'single_template',
+                'scored_at': scoring_result.get('processing_timestamp', datetime.now().isoformat()),
+                'analysis_type': analysis_type,
+                'primary_template': primary_rec['template'] if primary_rec else None,
+                'primary_score': round(primary_rec['score'], 1) if primary_rec else None,
+                'top_template': ranked[0][0] if ranked else None,
+                'top_score': round(ranked[0][1], 1) if ranked else None,
+                'scores': {template: round(score, 1) for template, score in ranked},
+                'meta': {
+                    'templates_evaluated': scoring_result.get('viable_templates_count', 0),
+                    'templates_scored': scoring_result.get('scored_templates_count', 0),
+                    'multi_template_triggered': multi_triggered
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"Error formatting scores for parcel {scoring_result.get('parcel_id', 'unknown')}: {e}")
+            return self._create_error_payload(
+                scoring_result.get('parcel_id', 'unknown'),
+                scoring_result.get('zoning', 'unknown'),
+                str(e)
+            )
+    
     def _build_viable_uses_array(
         self,
         template_results: Dict[str, Dict[str, Any]],
@@ -383,62 +607,109 @@ class ResultFormatter:
     
     def format_batch_results(
         self,
-        batch_results: List[Dict[str, Any]]
+        batch_results: List[Dict[str, Any]],
+        scores_only: bool = False
     ) -> Dict[str, Any]:
         """
         Format batch processing results into consolidated payload
         
         Args:
             batch_results: List of individual parcel results
+            scores_only: Emit format_scores_only() payloads instead of full v1.2 payloads
             
         Returns:
             Consolidated batch results payload
         """
         formatted_results = []
-        batch_stats = {
-            'total_parcels': len(batch_results),
+        batch_stats = self._new_batch_stats()
+        
+        for result in batch_results:
+            formatted_results.append(self._format_batch_entry(result, batch_stats, scores_only))
+        
+        return {
+            'version': self.version,
+            'batch_stats': self._finish_batch_stats(batch_stats),
+            'results': formatted_results
+        }
+    
+    def stream_batch_results(
+        self,
+        batch_results: Iterable[Dict[str, Any]],
+        sink,
+        scores_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Format results one at a time into a streaming sink (see scoring.result_sinks)
+        
+        Only the running statistics are kept in memory, so an iterator over a
+        full-county rescore can be formatted without materializing the batch.
+        
+        Args:
+            batch_results: Iterable of individual parcel results
+            sink: ResultSink receiving each formatted payload (JSONL suits the nested structure)
+            scores_only: Emit format_scores_only() payloads instead of full v1.2 payloads
+            
+        Returns:
+            Batch statistics, as in format_batch_results()['batch_stats']
+        """
+        batch_stats = self._new_batch_stats()
+        
+        for result in batch_results:
+            sink.write(self._format_batch_entry(result, batch_stats, scores_only))
+        
+        return self._finish_batch_stats(batch_stats)
+    
+    def _new_batch_stats(self) -> Dict[str, Any]:
+        return {
+            'total_parcels': 0,
             'successful_scores': 0,
             'multi_template_triggered': 0,
             'average_viable_templates': 0,
-            'processing_timestamp': datetime.now().isoformat()
+            'processing_timestamp': datetime.now().isoformat(),
+            '_viable_total': 0,
+            '_viable_count': 0
         }
+    
+    def _format_batch_entry(self, result: Dict[str, Any], batch_stats: Dict[str, Any],
+                            scores_only: bool = False) -> Dict[str, Any]:
+        """Format one batch result and fold it into the running statistics"""
+        batch_stats['total_parcels'] += 1
         
-        viable_template_counts = []
-        
-        for result in batch_results:
-            try:
+        try:
+            if scores_only:
+                formatted_result = self.format_scores_only(result)
+            else:
+                # Full batch output is serialized anyway; format now so errors are counted
                 formatted_result = self.format_multi_template_result(result)
-                formatted_results.append(formatted_result)
+                if isinstance(formatted_result, FormattedResult):
+                    formatted_result.resolve()
+            
+            # Update stats
+            if 'error' not in formatted_result:
+                batch_stats['successful_scores'] += 1
                 
-                # Update stats
-                if 'error' not in formatted_result:
-                    batch_stats['successful_scores'] += 1
-                    
-                if formatted_result.get('meta', {}).get('multi_template_triggered', False):
-                    batch_stats['multi_template_triggered'] += 1
-                    
-                viable_count = formatted_result.get('meta', {}).get('templates_evaluated', 0)
-                viable_template_counts.append(viable_count)
+            if formatted_result.get('meta', {}).get('multi_template_triggered', False):
+                batch_stats['multi_template_triggered'] += 1
                 
-            except Exception as e:
-                logger.error(f"Error formatting result for parcel {result.get('parcel_id', 'unknown')}: {e}")
-                formatted_results.append(self._create_error_payload(
-                    result.get('parcel_id', 'unknown'),
-                    result.get('zoning', 'unknown'),
-                    str(e)
-                ))
-        
-        # Calculate average viable templates
-        if viable_template_counts:
-            batch_stats['average_viable_templates'] = round(
-                sum(viable_template_counts) / len(viable_template_counts), 1
+            batch_stats['_viable_total'] += formatted_result.get('meta', {}).get('templates_evaluated', 0)
+            batch_stats['_viable_count'] += 1
+            return formatted_result
+            
+        except Exception as e:
+            logger.error(f"Error formatting result for parcel {result.get('parcel_id', 'unknown')}: {e}")
+            return self._create_error_payload(
+                result.get('parcel_id', 'unknown'),
+                result.get('zoning', 'unknown'),
+                str(e)
             )
-        
-        return {
-            'version': self.version,
-            'batch_stats': batch_stats,
-            'results': formatted_results
-        }
+    
+    def _finish_batch_stats(self, batch_stats: Dict[str, Any]) -> Dict[str, Any]:
+        # Calculate average viable templates
+        viable_total = batch_stats.pop('_viable_total')
+        viable_count = batch_stats.pop('_viable_count')
+        if viable_count:
+            batch_stats['average_viable_templates'] = round(viable_total / viable_count, 1)
+        return batch_stats
 
 def format_multi_template_result(scoring_result: Dict[str, Any]) -> Dict[str, Any]:
     """
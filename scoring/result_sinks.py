@@ -0,0 +1,310 @@
+"""
+DealGenie Streaming Result Sinks
+
+Bounded-memory writers that batch scorers push results into one row (or one
+chunk) at a time. Rows are buffered up to flush_every rows / flush_interval
+seconds, then written and made durable, and a checkpoint sidecar records what
+has been flushed so an interrupted full-county rescore can resume from the last
+flushed APN instead of starting over.
+
+Key Design Patterns:
+- Bounded Buffer: at most flush_every rows are held in memory
+- Durable Flushes: data is fsynced before the checkpoint is atomically replaced
+- Resume: on restart the output is truncated back to the last checkpoint and
+  last_flushed_key tells the caller where to pick up
+- Flush Hook: before_flush runs ahead of every flush, so a wrapper that also
+  stores rows elsewhere can do so first; if it raises, the checkpoint stays put
+
+Formats:
+- CSV:     buffered csv.DictWriter, header written once
+- JSONL:   one JSON object per line (suited to nested formatter payloads)
+- Parquet: a dataset directory with one row group file per flush
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Callable
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SUFFIX = '.checkpoint.json'
+
+
+def checkpoint_path(path: str) -> str:
+    """Sidecar checkpoint file for a sink output path"""
+    return f"{path.rstrip(os.sep)}{CHECKPOINT_SUFFIX}"
+
+
+class ResultSink:
+    """Base class for buffered, checkpointed result writers"""
+
+    format_name = 'base'
+
+    def __init__(self, path: str, flush_every: int = 5000, flush_interval: Optional[float] = 30.0,
+                 key_field: str = 'apn', resume: bool = False):
+        """
+        Open a sink
+
+        Args:
+            path: Output path
+            flush_every: Flush once this many rows are buffered
+            flush_interval: Also flush when this many seconds passed since the last flush (None disables)
+            key_field: Row field recorded as the resume key
+            resume: Continue an interrupted run from its last checkpoint instead of overwriting
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.key_field = key_field
+        self.buffer: List[Dict[str, Any]] = []
+        self.rows_flushed = 0
+        self.last_flushed_key = None
+        self.state: Dict[str, Any] = {}
+        self.before_flush: Optional[Callable[[], None]] = None
+        self._last_flush_time = time.time()
+        self._closed = False
+
+        checkpoint = self._load_checkpoint() if resume else None
+        if checkpoint:
+            self.rows_flushed = checkpoint.get('rows_flushed', 0)
+            self.last_flushed_key = checkpoint.get('last_key')
+            self.state = checkpoint.get('state', {})
+            logger.info(f"Resuming {self.path} after {self.rows_flushed:,} rows (last key {self.last_flushed_key})")
+
+        self._open(resumed=checkpoint is not None)
+
+    # -- Format hooks -------------------------------------------------------
+
+    def _open(self, resumed: bool):
+        raise NotImplementedError
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    # -- Public API ---------------------------------------------------------
+
+    def write(self, row: Dict[str, Any]):
+        """Buffer a single row"""
+        self.buffer.append(row)
+        self._maybe_flush()
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]):
+        """Buffer a group of rows; a group is never split across flushes"""
+        self.buffer.extend(rows)
+        self._maybe_flush()
+
+    def flush(self):
+        """Write buffered rows durably and advance the checkpoint"""
+        if self.buffer:
+            if self.before_flush is not None:
+                self.before_flush()
+            rows = self.buffer
+            self.buffer = []
+            self._write_rows(rows)
+            self.rows_flushed += len(rows)
+            self.last_flushed_key = rows[-1].get(self.key_field, self.last_flushed_key)
+            self._save_checkpoint(complete=False)
+        self._last_flush_time = time.time()
+
+    def close(self):
+        """Flush remaining rows and mark the output complete"""
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._save_checkpoint(complete=True)
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep what was durably flushed; drop the partial buffer so resume is consistent
+            self.buffer = []
+            self._close()
+        return False
+
+    # -- Internals ----------------------------------------------------------
+
+    def _maybe_flush(self):
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+        elif self.flush_interval is not None and time.time() - self._last_flush_time >= self.flush_interval:
+            self.flush()
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(checkpoint_path(self.path), 'r') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get('format') != self.format_name:
+            logger.warning(f"Ignoring {self.format_name} resume: checkpoint is for {checkpoint.get('format')}")
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, complete: bool):
+        checkpoint = {
+            'format': self.format_name,
+            'rows_flushed': self.rows_flushed,
+            'last_key': self.last_flushed_key,
+            'complete': complete,
+            'state': self.state,
+        }
+        tmp_path = f"{checkpoint_path(self.path)}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, checkpoint_path(self.path))
+
+
+class _TextFileSink(ResultSink):
+    """Shared append/truncate handling for line-oriented text formats"""
+
+    def _open(self, resumed: bool):
+        if resumed and os.path.exists(self.path):
+            # Drop anything written after the last durable flush
+            os.truncate(self.path, self.state.get('byte_offset', 0))
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+        else:
+            self.state = {}
+            self.rows_flushed = 0
+            self.last_flushed_key = None
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.state['byte_offset'] = self._file.tell()
+
+    def _close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class CSVResultSink(_TextFileSink):
+    """Buffered CSV writer; the header comes from the first row"""
+
+    format_name = 'csv'
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        fieldnames = self.state.get('fieldnames')
+        if fieldnames is None:
+            fieldnames = list(rows[0].keys())
+            self.state['fieldnames'] = fieldnames
+            csv.DictWriter(self._file, fieldnames=fieldnames).writeheader()
+        csv.DictWriter(self._file, fieldnames=fieldnames).writerows(rows)
+        self._sync()
+
+
+class JSONLResultSink(_TextFileSink):
+    """One JSON document per line"""
+
+    format_name = 'jsonl'
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        self._file.write(''.join(json.dumps(row, default=str) + '\n' for row in rows))
+        self._sync()
+
+
+class ParquetResultSink(ResultSink):
+    """Parquet dataset directory written one row group file per flush"""
+
+    format_name = 'parquet'
+
+    def _open(self, resumed: bool):
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet output. Install with: pip install pyarrow")
+
+        if not resumed:
+            self.state = {}
+            self.rows_flushed = 0
+            self.last_flushed_key = None
+        self.state.setdefault('parts', 0)
+        os.makedirs(self.path, exist_ok=True)
+
+        # Remove parts written after the last checkpoint (or all parts when starting over)
+        for name in os.listdir(self.path):
+            if name.startswith('part-') and name.endswith('.parquet'):
+                if int(name[5:10]) >= self.state['parts']:
+                    os.remove(os.path.join(self.path, name))
+
+        self._schema = None
+        if self.state['parts']:
+            self._schema = pq.read_schema(self._part_path(0))
+
+    def _part_path(self, index: int) -> str:
+        return os.path.join(self.path, f"part-{index:05d}.parquet")
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        table = pa.Table.from_pylist(rows, schema=self._schema)
+        if self._schema is None:
+            self._schema = table.schema
+
+        part_path = self._part_path(self.state['parts'])
+        tmp_path = f"{part_path}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, part_path)
+        self.state['parts'] += 1
+
+
+SINK_FORMATS = {
+    '.csv': CSVResultSink,
+    '.jsonl': JSONLResultSink,
+    '.ndjson': JSONLResultSink,
+    '.parquet': ParquetResultSink,
+}
+
+
+def open_result_sink(path: str, **kwargs) -> ResultSink:
+    """
+    Open a sink chosen by output extension (.csv, .jsonl/.ndjson, .parquet)
+
+    Args:
+        path: Output path
+        **kwargs: Passed to the sink (flush_every, flush_interval, key_field, resume)
+
+    Returns:
+        ResultSink instance
+    """
+    extension = os.path.splitext(path.rstrip(os.sep))[1].lower()
+    sink_class = SINK_FORMATS.get(extension, CSVResultSink)
+    return sink_class(path, **kwargs)
+
+
+def skip_completed(items: Iterable[Any], last_key: Optional[str], key=lambda item: item) -> Iterator[Any]:
+    """
+    Yield the items that follow last_key (all items if last_key is None)
+
+    Args:
+        items: Ordered work items, in the same order as the interrupted run
+        last_key: Sink's last_flushed_key
+        key: Function mapping an item to its key (APN)
+    """
+    if last_key is None:
+        yield from items
+        return
+
+    iterator = iter(items)
+    for item in iterator:
+        if key(item) == last_key:
+            break
+    else:
+        logger.warning(f"Resume key {last_key} not found in input; nothing left to process")
+        return
+    yield from iterator
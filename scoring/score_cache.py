@@ -0,0 +1,309 @@
+"""
+DealGenie Score Result Cache
+
+Short-circuits calculate_score / process_multi_template when neither the parcel
+inputs nor the scoring configuration have changed since the last run.
+
+Cache Key: (APN, template, feature fingerprint, config fingerprint)
+- Feature fingerprint: SHA-256 of the canonical JSON feature vector
+- Config fingerprint: SHA-256 of the template weights, the zoning constraints YAML,
+  environment YAML and scoring_config.json files, and the scoring module sources. Editing any of them
+  changes the fingerprint, so stale entries simply stop matching. The file list is
+  resolved (constraints/*.yml globbed) on every lookup, and the digest is only
+  recomputed when a file's size or mtime changes.
+
+Tiers:
+- In-process BoundedCache (LRU) holding serialized results
+- Persistent SQLite table score_cache, one row per (APN, template), so a
+  rescore after restart still skips unchanged parcels
+
+Results are stored as JSON and a fresh copy is returned on every hit, so
+callers may mutate what they get back. Result timestamps are restamped on each
+hit so a served result reports when it was returned, not when first scored.
+
+Callers opt in: engine.calculate_score stays a pure function, and the cached
+entry points are ScoreCache.calculate_score / process_multi_template,
+DealGenieDatabase.score_parcel, score_parcel_multi_template(score_cache=...)
+and the --cache-db flags of cli/dg_score.py and cli/batch_score.py.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+from .bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+SCORING_DIR = Path(__file__).parent
+
+# Files whose contents determine scoring output (plus SCORING_CONFIG_GLOBS)
+SCORING_CONFIG_FILES = [
+    SCORING_DIR / "engine.py",
+    SCORING_DIR / "zoning_lookup.py",
+    SCORING_DIR / "zoning_engine.py",
+    SCORING_DIR / "multi_template_scorer.py",
+    SCORING_DIR / "multi_template_engine.py",
+    SCORING_DIR / "confidence_engine.py",
+    SCORING_DIR / "geographic_calibration.py",
+    SCORING_DIR / "business_logic_fixes.py",
+    SCORING_DIR.parent / "config" / "environment_v12.yml",
+    SCORING_DIR.parent / "config" / "scoring_config.json",
+]
+
+# (directory, pattern) pairs globbed at lookup time, so added constraint files count
+SCORING_CONFIG_GLOBS = [
+    (SCORING_DIR / "constraints", "*.yml"),
+]
+
+MULTI_TEMPLATE_KEY = '__multi_template__'
+
+# Result keys restamped when a cached result is served
+TIMESTAMP_KEYS = ('timestamp', 'processing_timestamp')
+
+_fingerprint_lock = threading.Lock()
+_config_fingerprint: Tuple[Optional[tuple], Optional[str]] = (None, None)
+
+
+def feature_fingerprint(features: Dict[str, Any]) -> str:
+    """Stable hash of a feature dictionary (key order independent)"""
+    payload = json.dumps(features, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _file_signature(path: Path) -> tuple:
+    try:
+        stat = path.stat()
+        return (str(path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return (str(path), None, None)
+
+
+def scoring_config_files() -> List[Path]:
+    """SCORING_CONFIG_FILES plus the current matches of SCORING_CONFIG_GLOBS"""
+    files = list(SCORING_CONFIG_FILES)
+    for directory, pattern in SCORING_CONFIG_GLOBS:
+        files.extend(sorted(Path(directory).glob(pattern)))
+    return files
+
+
+def scoring_config_fingerprint() -> str:
+    """
+    Hash of everything that determines a score besides the features.
+
+    The config files are listed on every call; the digest is recomputed only
+    when the list, a file's size or mtime, or the template weights change.
+    """
+    global _config_fingerprint
+    from .engine import TEMPLATE_WEIGHTS
+
+    files = scoring_config_files()
+    weights = json.dumps(TEMPLATE_WEIGHTS, sort_keys=True)
+    signature = (weights, tuple(_file_signature(path) for path in files))
+
+    with _fingerprint_lock:
+        if _config_fingerprint[0] == signature:
+            return _config_fingerprint[1]
+
+        digest = hashlib.sha256()
+        digest.update(weights.encode('utf-8'))
+        for path in files:
+            digest.update(str(path.name).encode('utf-8'))
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                digest.update(b'<missing>')
+
+        _config_fingerprint = (signature, digest.hexdigest())
+        return _config_fingerprint[1]
+
+
+def _restamp(value: Any, now: str) -> Any:
+    """Replace result timestamps (at any depth) with now"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in TIMESTAMP_KEYS and isinstance(item, str):
+                value[key] = now
+            else:
+                _restamp(item, now)
+    elif isinstance(value, list):
+        for item in value:
+            _restamp(item, now)
+    return value
+
+
+def _load_result(result_json: str) -> Dict[str, Any]:
+    return _restamp(json.loads(result_json), datetime.now().isoformat())
+
+
+class ScoreCache:
+    """Two-tier (LRU + SQLite) cache of scoring results"""
+
+    def __init__(self, db_path: Optional[str] = "data/dealgenie.db", max_entries: int = 10000):
+        """
+        Initialize score cache
+
+        Args:
+            db_path: SQLite database for the persistent tier (None = memory only)
+            max_entries: Maximum results held in the in-process LRU
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        # (apn, template) -> (feature_hash, config_hash, result_json)
+        self._memory = BoundedCache(max_entries=max_entries, name='score_cache')
+        self._lock = threading.RLock()
+        self._conn = None
+        self.stats = {'memory_hits': 0, 'persistent_hits': 0, 'misses': 0}
+
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS score_cache (
+                    apn VARCHAR(20) NOT NULL,
+                    template VARCHAR(50) NOT NULL,
+                    feature_hash CHAR(64) NOT NULL,
+                    config_hash CHAR(64) NOT NULL,
+                    result_json TEXT NOT NULL,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (apn, template)
+                )
+            ''')
+            self._conn.commit()
+
+    # -- Core lookups -------------------------------------------------------
+
+    def get(self, apn: str, template: str, features: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached result for unchanged inputs, or None
+
+        Args:
+            apn: Assessor Parcel Number
+            template: Development template (or MULTI_TEMPLATE_KEY)
+            features: Current parcel features
+        """
+        key = (str(apn), template)
+        feature_hash = feature_fingerprint(features)
+        config_hash = scoring_config_fingerprint()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] == feature_hash and entry[1] == config_hash:
+                self.stats['memory_hits'] += 1
+                return _load_result(entry[2])
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result_json FROM score_cache "
+                    "WHERE apn = ? AND template = ? AND feature_hash = ? AND config_hash = ?",
+                    (key[0], template, feature_hash, config_hash)
+                ).fetchone()
+                if row:
+                    self._memory.set(key, (feature_hash, config_hash, row[0]))
+                    self.stats['persistent_hits'] += 1
+                    return _load_result(row[0])
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, apn: str, template: str, features: Dict[str, Any], result: Dict[str, Any]):
+        """Store a result for the given inputs in both tiers"""
+        if result.get('error'):
+            return  # Never cache failures
+
+        key = (str(apn), template)
+        entry = (feature_fingerprint(features), scoring_config_fingerprint(),
+                 json.dumps(result, default=str))
+
+        with self._lock:
+            self._memory.set(key, entry)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO score_cache "
+                    "(apn, template, feature_hash, config_hash, result_json, cached_at) "
+                    "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                    (key[0], template, entry[0], entry[1], entry[2])
+                )
+                self._conn.commit()
+
+    def get_or_compute(
+        self,
+        apn: str,
+        template: str,
+        features: Dict[str, Any],
+        compute: Callable[[], Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return (result, cache_hit), computing and caching on a miss
+        """
+        cached = self.get(apn, template, features)
+        if cached is not None:
+            return cached, True
+
+        result = compute()
+        self.put(apn, template, features, result)
+        return result, False
+
+    # -- Scoring entry points -----------------------------------------------
+
+    def calculate_score(self, features: Dict[str, Any], template: str = 'multifamily') -> Tuple[Dict[str, Any], bool]:
+        """Cached scoring.engine.calculate_score; returns (result, cache_hit)"""
+        from .engine import calculate_score
+
+        apn = features.get('apn', 'unknown')
+        return self.get_or_compute(apn, template, features, lambda: calculate_score(features, template))
+
+    def process_multi_template(
+        self,
+        features: Dict[str, Any],
+        force_multi_template: bool = False,
+        scorer=None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Cached MultiTemplateScorer.process_multi_template; returns (result, cache_hit)"""
+        if scorer is None:
+            from .engine_registry import get_multi_template_scorer
+            scorer = get_multi_template_scorer()
+
+        apn = features.get('apn', features.get('parcel_id', 'unknown'))
+        template = f"{MULTI_TEMPLATE_KEY}{'force' if force_multi_template else ''}"
+        return self.get_or_compute(
+            apn, template, features, lambda: scorer.process_multi_template(features, force_multi_template)
+        )
+
+    # -- Maintenance --------------------------------------------------------
+
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier"""
+        hits = self.stats['memory_hits'] + self.stats['persistent_hits']
+        total = hits + self.stats['misses']
+        return hits / total if total else 0.0
+
+    def purge_stale(self) -> int:
+        """Delete persistent entries written under a different scoring config"""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM score_cache WHERE config_hash != ?", (scoring_config_fingerprint(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM score_cache")
+                self._conn.commit()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
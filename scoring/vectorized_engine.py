@@ -0,0 +1,297 @@
+"""
+DealGenie Vectorized Scoring Engine
+
+Columnar counterpart of scoring.engine.calculate_score. Scores every parcel in a
+features frame against every requested template with NumPy array operations and
+returns a (parcels x templates) score matrix plus per-component matrices.
+
+Parity Contract:
+- Results are numerically identical to calculate_score for the same inputs
+- Missing columns / null cells take the same defaults as features.get(...)
+- Floating-point operations are applied in the same order as the scalar engine
+- Final rounding uses Python's round() so half-way cases match exactly
+
+Performance Characteristics:
+- Zoning read from the precompiled zoning table once per distinct code, then gathered
+- All other components are whole-array expressions
+- Rescoring 369K parcels x 7 templates is bounded by memory bandwidth, not Python
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .engine import TEMPLATE_WEIGHTS
+from .zoning_lookup import get_zoning_table
+
+logger = logging.getLogger(__name__)
+
+ALL_TEMPLATES = ['multifamily', 'commercial', 'residential', 'industrial', 'retail', 'mixed_use', 'office']
+
+COMPONENTS = ['zoning', 'lot_size', 'transit', 'demographics', 'market']
+
+
+def _numeric_column(frame: pd.DataFrame, column: str, default: float) -> np.ndarray:
+    """Float column with the scalar engine's .get() default for missing/null cells."""
+    if column not in frame.columns:
+        return np.full(len(frame), float(default))
+    values = pd.to_numeric(frame[column], errors='coerce').astype('float64')
+    return values.fillna(float(default)).to_numpy()
+
+
+def _bool_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    """Truthiness of a column, treating missing/null cells as False."""
+    if column not in frame.columns:
+        return np.zeros(len(frame), dtype=bool)
+    return frame[column].map(lambda v: bool(v) if v is not None and v == v else False).to_numpy(dtype=bool)
+
+
+def _optional_column(frame: pd.DataFrame, column: str) -> Optional[np.ndarray]:
+    """Float column where null cells stay NaN (feature genuinely absent)."""
+    if column not in frame.columns:
+        return None
+    return pd.to_numeric(frame[column], errors='coerce').astype('float64').to_numpy()
+
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    """Element-wise Python round(x, 1); np.round differs on some half-way doubles."""
+    flat = np.fromiter((round(float(x), 1) for x in values.ravel()), dtype='float64', count=values.size)
+    return flat.reshape(values.shape)
+
+
+def zoning_component_matrix(zoning: np.ndarray, templates: Sequence[str]) -> np.ndarray:
+    """Zoning component scores, evaluated once per distinct zoning code."""
+    codes, uniques = pd.factorize(pd.Series(zoning), sort=False)
+    lookup = get_zoning_table()
+    table = np.array(
+        [[lookup.zoning_score(code, template) for template in templates] for code in uniques],
+        dtype='float64'
+    ).reshape(len(uniques), len(templates))
+    return table[codes]
+
+
+def lot_size_component(lot_size: np.ndarray) -> np.ndarray:
+    """Lot size component score (template independent)."""
+    return np.select(
+        [lot_size >= 20000, lot_size >= 10000, lot_size >= 7500, lot_size >= 5000],
+        [10.0, 8.0, 6.5, 5.0], default=3.0
+    )
+
+
+def market_component(price_psf: np.ndarray) -> np.ndarray:
+    """Market component score (template independent)."""
+    return np.select([price_psf < 400, price_psf < 600, price_psf < 800], [8.0, 6.5, 5.0], default=3.5)
+
+
+def base_demographics_component(income: np.ndarray, pop_density: np.ndarray) -> np.ndarray:
+    """Income/density demographics score before template crime adjustments."""
+    return np.select(
+        [
+            income > 120000,
+            income > 90000,
+            (income > 75000) & (pop_density > 10000),
+            (income > 60000) & (pop_density > 7500),
+            (income > 45000) & (pop_density > 5000),
+            income > 30000,
+        ],
+        [9.5, 8.5, 9.0, 7.5, 6.0, 4.5], default=3.0
+    )
+
+
+def demographics_component(
+    base_demo: np.ndarray, crime: np.ndarray, income: np.ndarray,
+    pop_density: np.ndarray, template: str
+) -> np.ndarray:
+    """Template-adjusted demographics score."""
+    if template in ['residential', 'retail']:
+        crime_penalty = np.select(
+            [crime > 1.8, crime > 1.5, crime > 1.2, crime > 0.8], [2.5, 2.0, 1.5, 0.5], default=0
+        )
+    elif template in ['commercial', 'multifamily']:
+        crime_penalty = np.select([crime > 1.8, crime > 1.5, crime > 1.2], [1.5, 1.0, 0.5], default=0)
+    else:
+        crime_penalty = np.where(crime > 2.0, 0.5, 0)
+
+    demo = np.maximum(1.0, base_demo - crime_penalty)
+
+    if template == 'residential':
+        demo = np.where(crime < 0.5, np.minimum(10.0, demo + 1.0),
+                        np.where(crime < 0.7, np.minimum(10.0, demo + 0.5), demo))
+        demo = np.where((pop_density < 8000) & (income > 80000), np.maximum(demo, 7.5), demo)
+
+    return demo
+
+
+def transit_component(transit: np.ndarray, highway_access: Optional[np.ndarray], template: str) -> np.ndarray:
+    """Template-adjusted transit score."""
+    if template == 'industrial':
+        default_highway = transit * 0.7
+        if highway_access is None:
+            highway = default_highway
+        else:
+            highway = np.where(np.isnan(highway_access), default_highway, highway_access)
+        return np.minimum(highway / 12, 10.0)
+    elif template == 'retail':
+        return np.minimum((transit * 1.2) / 10, 10.0)
+    return np.minimum(transit / 10, 10.0)
+
+
+def penalty_arrays(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Template-independent penalty terms from calculate_penalties, in the scalar
+    engine's insertion order (pollution is returned separately because it is
+    skipped for the industrial template).
+    """
+    n = len(frame)
+    zeros = np.zeros(n)
+
+    flood = _bool_column(frame, 'flood_risk') | _bool_column(frame, 'flood_zone')
+    crime = _numeric_column(frame, 'crime_factor', 1.0)
+    toxic = _numeric_column(frame, 'toxic_sites_nearby', 0)
+    superfund = _bool_column(frame, 'superfund_site_nearby')
+    noise = _numeric_column(frame, 'airport_noise_level', 0)
+    near_airport = _bool_column(frame, 'near_airport')
+    homeless_count = _numeric_column(frame, 'homeless_encampments_nearby', 0)
+    homeless_density = _numeric_column(frame, 'homeless_population_density', 0)
+    freeway = _numeric_column(frame, 'freeway_distance_ft', 5000)
+    industrial = _numeric_column(frame, 'industrial_facilities_nearby', 0)
+    aqi = _numeric_column(frame, 'air_quality_index', 50)
+
+    if 'seismic_risk_level' in frame.columns:
+        seismic = frame['seismic_risk_level'].fillna('moderate').to_numpy(dtype=object)
+    else:
+        seismic = np.full(n, 'moderate', dtype=object)
+
+    if 'utility_deficiencies' in frame.columns:
+        utility_count = frame['utility_deficiencies'].map(
+            lambda v: len(v) if isinstance(v, (list, tuple)) else 0
+        ).to_numpy(dtype='float64')
+    else:
+        utility_count = zeros
+
+    return {
+        'flood_zone': np.where(flood, 1.2, 0.0),
+        'high_crime': np.where(crime > 1.5, np.minimum(1.0, (crime - 1.0) * 1.0), 0.0),
+        'toxic_sites': np.where((toxic > 0) | superfund, np.minimum(2.0, 1.0 + (toxic * 0.3)), 0.0),
+        'airport_noise': np.where(noise > 65, np.minimum(0.6, (noise - 65) / 25),
+                                  np.where(near_airport, 0.3, 0.0)),
+        'homeless_concentration': np.where(
+            (homeless_count > 2) | (homeless_density > 50),
+            np.minimum(1.0, 0.3 + (homeless_count * 0.2) + (homeless_density / 150)), 0.0
+        ),
+        'freeway_noise': np.select([freeway < 500, freeway < 1000], [0.6, 0.3], default=0.0),
+        'pollution': np.where(
+            (industrial > 3) | (aqi > 100),
+            np.minimum(1.2, 0.3 + (industrial * 0.2) + np.maximum(0, (aqi - 100) / 60)), 0.0
+        ),
+        'seismic_risk': np.select([seismic == 'high', seismic == 'very_high'], [0.6, 1.0], default=0.0),
+        'infrastructure': np.where(utility_count > 0, np.minimum(1.0, utility_count * 0.3), 0.0),
+    }
+
+
+def calculate_scores_array(
+    features_frame: Union[pd.DataFrame, List[Dict[str, Any]]],
+    templates: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Score every parcel against every template in one vectorized pass.
+
+    Args:
+        features_frame: DataFrame (or list of feature dicts) with one parcel per row
+        templates: Templates to score (defaults to all seven)
+
+    Returns:
+        Dictionary with:
+        - 'templates': template order of the matrix columns
+        - 'apns': parcel identifiers (row order)
+        - 'score': (parcels x templates) final scores, equal to calculate_score()['score']
+        - 'base_score': rounded pre-penalty scores
+        - 'total_penalties': rounded penalty totals
+        - 'components': {component: (parcels x templates) matrix}
+        - 'penalties': {penalty: (parcels x templates) matrix}
+    """
+    if not isinstance(features_frame, pd.DataFrame):
+        features_frame = pd.DataFrame(list(features_frame))
+
+    templates = list(templates or ALL_TEMPLATES)
+    frame = features_frame.reset_index(drop=True)
+    n, t = len(frame), len(templates)
+
+    if 'zoning' in frame.columns:
+        zoning = frame['zoning'].where(frame['zoning'].notna(), 'R1').astype(str).to_numpy(dtype=object)
+    else:
+        zoning = np.full(n, 'R1', dtype=object)
+
+    lot_size = _numeric_column(frame, 'lot_size_sqft', 5000)
+    transit = _numeric_column(frame, 'transit_score', 50)
+    highway_access = _optional_column(frame, 'highway_access')
+    pop_density = _numeric_column(frame, 'population_density', 5000)
+    income = _numeric_column(frame, 'median_income', 50000)
+    crime = _numeric_column(frame, 'crime_factor', 1.0)
+    price_psf = _numeric_column(frame, 'price_per_sqft', 500)
+
+    # Template-independent components are computed once
+    lot_scores = lot_size_component(lot_size)
+    market_scores = market_component(price_psf)
+    base_demo = base_demographics_component(income, pop_density)
+    penalty_terms = penalty_arrays(frame)
+
+    components = {name: np.empty((n, t)) for name in COMPONENTS}
+    components['zoning'] = zoning_component_matrix(zoning, templates) if n else np.empty((0, t))
+    penalties = {name: np.zeros((n, t)) for name in penalty_terms}
+    raw_total = np.empty((n, t))
+    total_penalty = np.empty((n, t))
+
+    for j, template in enumerate(templates):
+        components['lot_size'][:, j] = lot_scores
+        components['transit'][:, j] = transit_component(transit, highway_access, template)
+        components['demographics'][:, j] = demographics_component(base_demo, crime, income, pop_density, template)
+        components['market'][:, j] = market_scores
+
+        # Weighted sum in the scalar engine's accumulation order
+        total = np.zeros(n)
+        for component, weight in TEMPLATE_WEIGHTS.get(template, TEMPLATE_WEIGHTS['multifamily']).items():
+            total = total + components[component][:, j] * weight
+        raw_total[:, j] = total
+
+        penalty_sum = np.zeros(n)
+        for name, values in penalty_terms.items():
+            if name == 'pollution' and template == 'industrial':
+                continue
+            penalties[name][:, j] = values
+            penalty_sum = penalty_sum + values
+        total_penalty[:, j] = penalty_sum
+
+    score = _round1(np.maximum(0.0, raw_total - total_penalty))
+
+    if 'apn' in frame.columns:
+        apns = frame['apn'].to_numpy()
+    else:
+        apns = frame['parcel_id'].to_numpy() if 'parcel_id' in frame.columns else np.arange(n)
+
+    return {
+        'templates': templates,
+        'apns': apns,
+        'score': score,
+        'base_score': _round1(score + total_penalty),
+        'total_penalties': _round1(total_penalty),
+        'components': components,
+        'penalties': penalties,
+    }
+
+
+def scores_frame(result: Dict[str, Any]) -> pd.DataFrame:
+    """Flatten a calculate_scores_array result into a long (apn, template) DataFrame."""
+    n, t = result['score'].shape
+    frame = pd.DataFrame({
+        'apn': np.repeat(result['apns'], t),
+        'template': np.tile(result['templates'], n),
+        'score': result['score'].ravel(),
+        'base_score': result['base_score'].ravel(),
+        'total_penalties': result['total_penalties'].ravel(),
+    })
+    for component, matrix in result['components'].items():
+        frame[f'{component}_component'] = matrix.ravel()
+    return frame
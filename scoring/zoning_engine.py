@@ -5,13 +5,23 @@ Implements zoning constraints logic including caps, plausibility floors,
 compatibility matrix, and fallback handling for unknown zoning codes.
 """
 
-import yaml
 import logging
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from .zoning_lookup import ZoningLookupTable
+from .engine_registry import load_yaml_config, get_zoning_engine
+
 logger = logging.getLogger(__name__)
 
+
+def default_constraints_path() -> Path:
+    """LA-enhanced constraints if present, otherwise zoning_v12.yml"""
+    la_enhanced_path = Path(__file__).parent / "constraints" / "zoning_la_enhanced.yml"
+    if la_enhanced_path.exists():
+        return la_enhanced_path
+    return Path(__file__).parent / "constraints" / "zoning_v12.yml"
+
 class ZoningConstraintsEngine:
     """Handles zoning constraints and compatibility logic"""
     
@@ -24,11 +34,7 @@ class ZoningConstraintsEngine:
         """
         if config_path is None:
             # Try LA-enhanced config first, fallback to v12
-            la_enhanced_path = Path(__file__).parent / "constraints" / "zoning_la_enhanced.yml"
-            if la_enhanced_path.exists():
-                config_path = la_enhanced_path
-            else:
-                config_path = Path(__file__).parent / "constraints" / "zoning_v12.yml"
+            config_path = default_constraints_path()
         
         self.config = self._load_config(config_path)
         self.score_caps = self.config.get('score_caps', {})
@@ -36,11 +42,15 @@ class ZoningConstraintsEngine:
         self.compatibility_matrix = self.config.get('compatibility_matrix', {})
         self.default_unknown = self.config.get('default_unknown', {})
         
+        # Precompiled per-code caps/compatibility shared with the scoring hot path
+        self.lookup = ZoningLookupTable(
+            self.score_caps, self.plausibility_floors, self.compatibility_matrix, self.default_unknown
+        )
+        
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load zoning constraints configuration from YAML"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(config_path)
             logger.info(f"Loaded zoning constraints from {config_path}")
             return config
         except Exception as e:
@@ -71,8 +81,7 @@ class ZoningConstraintsEngine:
         Returns:
             Maximum score cap for this combination
         """
-        template_caps = self.score_caps.get(template, {})
-        return template_caps.get(zoning, self.default_unknown['score_cap'])
+        return self.lookup.score_cap(template, zoning)
     
     def get_plausibility_floor(self, template: str) -> float:
         """
@@ -84,7 +93,7 @@ class ZoningConstraintsEngine:
         Returns:
             Minimum plausible score for this template
         """
-        return self.plausibility_floors.get(template, self.default_unknown['plausibility_floor'])
+        return self.lookup.plausibility_floor(template)
     
     def is_compatible(self, template: str, zoning: str) -> bool:
         """
@@ -97,8 +106,7 @@ class ZoningConstraintsEngine:
         Returns:
             True if combination is viable/compatible
         """
-        template_compat = self.compatibility_matrix.get(template, {})
-        return template_compat.get(zoning, self.default_unknown['compatible'])
+        return self.lookup.is_compatible(template, zoning)
     
     def apply_constraints(
         self, 
@@ -188,5 +196,5 @@ def apply_zoning_constraints(
     Returns:
         Tuple of (constrained_score, applied_constraints)
     """
-    engine = ZoningConstraintsEngine(config_path)
+    engine = get_zoning_engine(config_path)
     return engine.apply_constraints(raw_score, template, zoning)
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+DealGenie Zoning Classification Table
+
+Precompiled, memoized lookup of everything the scoring hot path derives from a
+zoning code: the template-specific zoning component score, the development
+potential zoning bonus, and the YAML score caps / compatibility flags used by
+ZoningConstraintsEngine.
+
+Architecture Decision: Classify Once Per Distinct Code
+- LA parcels carry only a few hundred distinct zoning codes
+- The substring rules below run once per (code) and are cached in a ZoningProfile
+- calculate_score, CSVFeatureMatrix._calculate_development_potential,
+  ZoningConstraintsEngine and the vectorized engine all read the same profiles,
+  so a parcel costs one dict lookup per template instead of a list scan
+
+Key Design Patterns:
+- Rules Stay Readable: classification logic is kept as the original if-chains
+- Lazy Compilation: codes seen in the YAML constraints are compiled up front,
+  any other code (e.g. 'C2-1VL') is compiled on first sight and memoized in a
+  BoundedCache, so malformed codes from API input cannot grow the table forever
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+from .bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+# Templates with dedicated zoning rules; any other template uses the fallback rule
+RULE_TEMPLATES = ['multifamily', 'commercial', 'residential', 'industrial', 'retail', 'mixed_use', 'office']
+FALLBACK_TEMPLATE = None
+
+
+def zoning_rule_score(zoning: str, template: str) -> float:
+    """
+    Template-specific zoning component score (0-10) from the scoring rules.
+    
+    Args:
+        zoning: Property zoning code (substring matched, e.g. 'C2-1VL')
+        template: Development template
+    
+    Returns:
+        Zoning component score
+    """
+    if template == 'industrial':
+        industrial_zones = ['M2', 'M1', 'MR1', 'MR2', 'M3']
+        mixed_industrial = ['C2', 'C4', 'CM']
+        if any(zone in zoning for zone in industrial_zones):
+            return 9.0
+        elif any(zone in zoning for zone in mixed_industrial):
+            return 6.5
+        else:
+            return 3.0
+            
+    elif template == 'retail':
+        prime_retail_zones = ['C2', 'C4', 'C1', 'C1.5']  # Removed CM from prime
+        mixed_zones_for_retail = ['CM', 'RAS3', 'RAS4']    # CM moved to mixed category
+        poor_retail_zones = ['R3', 'R4', 'R5']
+        if any(zone in zoning for zone in prime_retail_zones):
+            return 9.0
+        elif any(zone in zoning for zone in mixed_zones_for_retail):
+            return 7.0  # CM now gets 7.0 instead of 9.0 for retail
+        elif any(zone in zoning for zone in poor_retail_zones):
+            return 5.0
+        else:
+            return 4.0
+            
+    elif template == 'residential':
+        # Residential template - strongly favors R1, RE, RS
+        single_family_zones = ['R1', 'RE', 'RS', 'RA']
+        medium_density_zones = ['R2', 'RD']
+        high_density_zones = ['R3', 'R4', 'R5']
+        commercial_zones = ['C1', 'C2', 'C4']
+        
+        if any(zone in zoning for zone in single_family_zones):
+            return 10.0  # Perfect for residential
+        elif any(zone in zoning for zone in medium_density_zones):
+            return 7.5
+        elif any(zone in zoning for zone in high_density_zones):
+            return 5.0
+        elif any(zone in zoning for zone in commercial_zones):
+            return 3.0  # Poor for residential
+        else:
+            return 2.0
+            
+    elif template == 'multifamily':
+        # Multifamily template - favors high-density residential
+        high_density_zones = ['R5', 'R4', 'R3', 'RAS3', 'RAS4']
+        mixed_use_zones = ['C2', 'C4', 'CM']
+        medium_density_zones = ['R2', 'RD']
+        low_density_zones = ['R1', 'RE', 'RS']
+        
+        if any(zone in zoning for zone in high_density_zones):
+            return 10.0  # Perfect for multifamily
+        elif any(zone in zoning for zone in mixed_use_zones):
+            return 8.5
+        elif any(zone in zoning for zone in medium_density_zones):
+            return 6.5
+        elif any(zone in zoning for zone in low_density_zones):
+            return 3.0  # Poor for multifamily
+        else:
+            return 2.0
+            
+    elif template == 'commercial':
+        # Commercial template - favors office/business zones
+        office_zones = ['C1', 'C1.5', 'CM', 'P']
+        mixed_commercial = ['C2', 'C4']
+        high_density_residential = ['R4', 'R5', 'RAS3', 'RAS4']
+        low_density_zones = ['R1', 'R2', 'R3']
+        
+        if any(zone in zoning for zone in office_zones):
+            return 10.0  # Perfect for commercial
+        elif any(zone in zoning for zone in mixed_commercial):
+            return 8.0
+        elif any(zone in zoning for zone in high_density_residential):
+            return 6.0
+        elif any(zone in zoning for zone in low_density_zones):
+            return 3.0
+        else:
+            return 2.0
+            
+    elif template == 'mixed_use':
+        # Mixed-use template - favors CM, CR, RAS zones
+        perfect_mixed_zones = ['CM', 'CR', 'RAS3', 'RAS4']
+        good_mixed_zones = ['C2', 'C4', 'R4', 'R5']
+        moderate_zones = ['C1', 'R3', 'M1']
+        poor_zones = ['R1', 'R2', 'M2', 'M3']
+        
+        if any(zone in zoning for zone in perfect_mixed_zones):
+            return 10.0  # Perfect for mixed-use
+        elif any(zone in zoning for zone in good_mixed_zones):
+            return 8.0
+        elif any(zone in zoning for zone in moderate_zones):
+            return 5.5
+        elif any(zone in zoning for zone in poor_zones):
+            return 3.0
+        else:
+            return 2.0
+            
+    elif template == 'office':
+        # Office template - favors C1, C2, LAX zones
+        prime_office_zones = ['C1', 'C1.5', 'C2', 'LAX']
+        good_office_zones = ['C4', 'CM', 'P']
+        moderate_zones = ['R4', 'R5', 'RAS3', 'RAS4']
+        poor_zones = ['R1', 'R2', 'R3', 'M1', 'M2']
+        
+        if any(zone in zoning for zone in prime_office_zones):
+            return 10.0  # Perfect for office
+        elif any(zone in zoning for zone in good_office_zones):
+            return 8.0
+        elif any(zone in zoning for zone in moderate_zones):
+            return 5.5
+        elif any(zone in zoning for zone in poor_zones):
+            return 3.0
+        else:
+            return 2.0
+            
+    else:
+        # Fallback for any other templates
+        high_density_zones = ['R5', 'R4', 'R3', 'C2', 'C4', 'RAS3', 'RAS4']
+        medium_density_zones = ['R2', 'RD', 'C1', 'C1.5']
+        
+        if any(zone in zoning for zone in high_density_zones):
+            return 9.0
+        elif any(zone in zoning for zone in medium_density_zones):
+            return 7.0
+        else:
+            return 5.0
+
+
+def development_zoning_bonus(zoning: str) -> float:
+    """Zoning bonus used by the development potential score (upper-cased match)."""
+    zoning = str(zoning).upper()
+    if any(z in zoning for z in ['R5', 'R4', 'C2', 'C4']):
+        return 2.0
+    elif any(z in zoning for z in ['R3', 'RAS']):
+        return 1.5
+    elif 'R2' in zoning:
+        return 0.5
+    return 0.0
+
+
+@dataclass
+class ZoningProfile:
+    """Precomputed scoring attributes for a single zoning code"""
+    code: str
+    zoning_scores: Dict[Optional[str], float]   # template -> zoning component (None = fallback rule)
+    development_bonus: float                    # Development potential zoning bonus
+    score_caps: Dict[str, float] = field(default_factory=dict)   # template -> YAML score cap
+    compatible: Dict[str, bool] = field(default_factory=dict)    # template -> YAML compatibility
+
+
+class ZoningLookupTable:
+    """Memoized zoning code -> ZoningProfile table"""
+    
+    def __init__(self, score_caps: Optional[Dict[str, Dict[str, float]]] = None,
+                 plausibility_floors: Optional[Dict[str, float]] = None,
+                 compatibility_matrix: Optional[Dict[str, Dict[str, bool]]] = None,
+                 default_unknown: Optional[Dict[str, Any]] = None,
+                 max_dynamic_codes: int = 4096):
+        """
+        Build the table from zoning constraint configuration
+        
+        Args:
+            score_caps: template -> {zoning: cap} from the constraints YAML
+            plausibility_floors: template -> minimum plausible score
+            compatibility_matrix: template -> {zoning: compatible}
+            default_unknown: Fallback cap/floor/compatibility for unknown codes
+            max_dynamic_codes: LRU bound on profiles for codes not in the configuration
+        """
+        self.score_caps = score_caps or {}
+        self.plausibility_floors = plausibility_floors or {}
+        self.compatibility_matrix = compatibility_matrix or {}
+        self.default_unknown = default_unknown or {'score_cap': 5.0, 'plausibility_floor': 1.0, 'compatible': False}
+        self._profiles: Dict[str, ZoningProfile] = {}
+        self._dynamic_profiles = BoundedCache(max_entries=max_dynamic_codes, name='zoning_profiles')
+        
+        known_codes = set()
+        for table in list(self.score_caps.values()) + list(self.compatibility_matrix.values()):
+            known_codes.update(table or {})
+        for code in known_codes:
+            self._profiles[code] = self._build_profile(code)
+    
+    def _build_profile(self, code: str) -> ZoningProfile:
+        zoning_scores = {template: zoning_rule_score(code, template) for template in RULE_TEMPLATES}
+        zoning_scores[FALLBACK_TEMPLATE] = zoning_rule_score(code, FALLBACK_TEMPLATE)
+        return ZoningProfile(
+            code=code,
+            zoning_scores=zoning_scores,
+            development_bonus=development_zoning_bonus(code),
+            score_caps={t: caps[code] for t, caps in self.score_caps.items() if caps and code in caps},
+            compatible={t: compat[code] for t, compat in self.compatibility_matrix.items() if compat and code in compat},
+        )
+    
+    def profile(self, code: str) -> ZoningProfile:
+        """Return the (memoized) profile for a zoning code"""
+        profile = self._profiles.get(code)
+        if profile is None:
+            profile = self._dynamic_profiles.get_or_set(code, lambda: self._build_profile(code))
+        return profile
+    
+    def zoning_score(self, code: str, template: str) -> float:
+        """Zoning component score for a code/template pair"""
+        scores = self.profile(code).zoning_scores
+        if template in scores:
+            return scores[template]
+        return scores[FALLBACK_TEMPLATE]
+    
+    def development_bonus(self, code: str) -> float:
+        """Development potential zoning bonus for a code"""
+        return self.profile(code).development_bonus
+    
+    def score_cap(self, template: str, code: str) -> float:
+        """YAML score cap, or the unknown-zoning default"""
+        return self.profile(code).score_caps.get(template, self.default_unknown['score_cap'])
+    
+    def is_compatible(self, template: str, code: str) -> bool:
+        """YAML compatibility flag, or the unknown-zoning default"""
+        return self.profile(code).compatible.get(template, self.default_unknown['compatible'])
+    
+    def plausibility_floor(self, template: str) -> float:
+        """Minimum plausible score for a template"""
+        return self.plausibility_floors.get(template, self.default_unknown['plausibility_floor'])
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Counters for profiles of codes outside the configuration"""
+        return self._dynamic_profiles.stats()
+    
+    def __len__(self) -> int:
+        return len(self._profiles) + len(self._dynamic_profiles)
+
+
+_default_table = None
+
+
+def get_zoning_table() -> ZoningLookupTable:
+    """
+    Table of the shared default ZoningConstraintsEngine
+
+    Fetched from the engine registry on every call, so an edited constraints
+    YAML (which rebuilds the engine) reaches the scalar, vectorized and
+    parallel scoring paths as well as ZoningConstraintsEngine itself.
+    """
+    global _default_table
+    from .engine_registry import get_zoning_engine
+
+    table = get_zoning_engine().lookup
+    if table is not _default_table:
+        _default_table = table
+        logger.info(f"Compiled zoning lookup table with {len(table)} codes")
+    return table
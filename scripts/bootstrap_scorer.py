@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scoring.engine import calculate_score
 from features.feature_matrix import get_feature_matrix
+from features.batch_features import get_feature_matrix_batch, feature_records
 
 # Test APNs - use known APNs from database
 TOP_APNS = [
@@ -29,11 +30,12 @@ TOP_APNS = [
     '5149021900',  # 789 S BROADWAY
 ]
 
-def generate_bootstrap_report(apn: str, index: int) -> None:
+def generate_bootstrap_report(apn: str, index: int, features: dict = None) -> None:
     """Generate HTML and JSON reports for a property"""
     
     # Get features and calculate score
-    features = get_feature_matrix(apn)
+    if features is None:
+        features = get_feature_matrix(apn)
     score_result = calculate_score(features, 'multifamily')
     
     # Save JSON report
@@ -215,10 +217,16 @@ def main():
     # Ensure output directory exists
     os.makedirs('out', exist_ok=True)
     
+    # Extract features for every property in one pass over the parcel data
+    features_by_apn = {
+        features['apn']: features
+        for features in feature_records(get_feature_matrix_batch(TOP_APNS))
+    }
+    
     # Generate reports for each property
     for i, apn in enumerate(TOP_APNS):
         try:
-            generate_bootstrap_report(apn, i)
+            generate_bootstrap_report(apn, i, features_by_apn.get(apn))
         except Exception as e:
             print(f"  [{i+1:2d}/10] APN {apn}: Error - {e}")
     
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Feature cache encoding benchmark: JSON text versus binary feature vectors.
+
+Compares, on generated feature dictionaries shaped like CSVFeatureMatrix output:
+- Decode cost per cached vector (json.loads versus decode_features)
+- get_cached_features latency on a database holding each encoding
+- Bytes per vector and feature_cache database size
+
+Usage:
+    python scripts/feature_cache_benchmark.py --entries 20000 --reads 5000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database_manager import DealGenieDatabase
+from features.csv_feature_matrix import CSVFeatureMatrix
+from features.feature_codec import encode_features, decode_features
+
+SCHEMA_PATH = Path(__file__).parent.parent / 'db' / 'sqlite_schema.sql'
+
+CACHE_QUERY = '''
+    SELECT feature_vector FROM feature_cache
+    WHERE apn = ? AND template = ?
+    AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+    ORDER BY computed_at DESC LIMIT 1
+'''
+
+
+def generate_features(count: int) -> List[Dict[str, Any]]:
+    """Default CSVFeatureMatrix features with per-parcel values"""
+    rng = random.Random(42)
+    template = CSVFeatureMatrix.__new__(CSVFeatureMatrix)._get_default_features('0000-000-000')
+    entries = []
+    for i in range(count):
+        features = dict(template)
+        features.update({
+            'apn': f'{5000 + i // 1000:04d}-{i % 1000:03d}-{i % 97:03d}',
+            'site_address': f'{rng.randrange(100, 20000)} Sunset Blvd',
+            'lot_size_sqft': rng.uniform(2500, 40000), 'building_sqft': rng.uniform(800, 20000),
+            'assessed_value': rng.randrange(200000, 5000000), 'year_built': rng.randrange(1900, 2020),
+            'latitude': 34.0 + rng.random() * 0.3, 'longitude': -118.5 + rng.random() * 0.3,
+            'price_per_sqft': rng.uniform(150, 1200), 'far': rng.uniform(0.1, 4.0),
+            'development_potential': rng.uniform(0, 10), 'transit_score': rng.randrange(20, 100),
+        })
+        entries.append(features)
+    return entries
+
+
+def build_database(path: str, features: List[Dict[str, Any]], legacy: bool):
+    """Feature cache holding binary vectors, or JSON text as older versions wrote"""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+
+    db = DealGenieDatabase(path)
+    db.store_parcels_bulk((f['apn'], {'zoning': 'R3'}) for f in features)
+    db.cache_features_bulk((f['apn'], 'multifamily', f) for f in features)
+    if legacy:
+        conn = sqlite3.connect(path)
+        conn.executemany("UPDATE feature_cache SET feature_vector = ? WHERE apn = ?",
+                         [(json.dumps(f), f['apn']) for f in features])
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+    db.connections.close()
+
+
+def time_per_call(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="DealGenie feature cache encoding benchmark")
+    parser.add_argument('--entries', type=int, default=20000, help='Cached feature vectors')
+    parser.add_argument('--reads', type=int, default=5000, help='get_cached_features calls per encoding')
+    args = parser.parse_args()
+
+    features = generate_features(args.entries)
+    json_blobs = [json.dumps(f) for f in features]
+    binary_blobs = [encode_features(f) for f in features]
+
+    print(f"Feature vectors: {args.entries:,} x {len(features[0])} features")
+    print(f"   - JSON:   {sum(map(len, json_blobs)) / len(json_blobs):6.0f} bytes/vector, "
+          f"decode {time_per_call(json.loads, json_blobs):5.2f} us")
+    print(f"   - Binary: {sum(map(len, binary_blobs)) / len(binary_blobs):6.0f} bytes/vector, "
+          f"decode {time_per_call(decode_features, binary_blobs):5.2f} us")
+
+    rng = random.Random(7)
+    apns = [rng.choice(features)['apn'] for _ in range(args.reads)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, legacy in (('JSON', True), ('Binary', False)):
+            path = os.path.join(temp_dir, f'{label.lower()}.db')
+            build_database(path, features, legacy)
+            conn = sqlite3.connect(path)
+            cache_bytes = conn.execute("SELECT SUM(LENGTH(feature_vector)) FROM feature_cache").fetchone()[0]
+            conn.close()
+
+            # The get_cached_features query, decoded as each version did (the real
+            # method would migrate JSON rows on their first read)
+            decode = json.loads if legacy else decode_features
+            conn = DealGenieDatabase(path).get_connection()
+            read = lambda apn: decode(conn.execute(CACHE_QUERY, (apn, 'multifamily')).fetchone()[0])
+            latency = time_per_call(read, apns)
+            conn.close_connection()
+
+            print(f"\n{label} feature_cache")
+            print(f"   - Database file: {os.path.getsize(path) / 1e6:6.2f} MB "
+                  f"(feature vectors {cache_bytes / 1e6:.2f} MB)")
+            print(f"   - Cached read: {latency:6.1f} us/call")
+
+    print("\n✅ Benchmark complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,7 @@ import os
 sys.path.append('.')
 
 from features.feature_matrix import get_feature_matrix
+from features.batch_features import get_feature_matrix_batch, feature_records
 from scoring.engine import calculate_score
 import json
 import time
@@ -339,13 +340,20 @@ def main():
     
     print(f"📊 Generating {target_reports} sample reports...")
     
+    # Extract features for all report APNs in one pass over the parcel data
+    report_apns = [sample_apns[i % len(sample_apns)] for i in range(target_reports)]
+    features_by_apn = {
+        features['apn']: features
+        for features in feature_records(get_feature_matrix_batch(report_apns))
+    }
+    
     for i in range(target_reports):
         try:
             apn = sample_apns[i % len(sample_apns)]
             template = templates[i % len(templates)]
             
             # Get features and calculate score
-            features = get_feature_matrix(apn)
+            features = features_by_apn.get(apn) or get_feature_matrix(apn)
             score_result = calculate_score(features, template)
             
             # Generate HTML report
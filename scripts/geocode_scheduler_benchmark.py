@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Geocode batch scheduler benchmark: fixed batches with gather + 0.5s pauses
+(the previous geocode_batch) versus the rate-limit-aware provider work queue.
+
+Providers are stand-ins that pace themselves with their real token buckets and
+answer after a simulated latency, so throughput is measured against each
+provider's rate ceiling without network calls.
+
+Usage:
+    python scripts/geocode_scheduler_benchmark.py --addresses 300 --nominatim-rps 20 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from geocoding.geocoder import (
+    GeocodeProvider, GeocodeResult, GeocodeStatus, HierarchicalGeocoder, RateLimiter
+)
+
+
+def stand_in_geocoder(nominatim_rps: float, google_rps: float, latency_ms: float) -> HierarchicalGeocoder:
+    """HierarchicalGeocoder whose providers sleep instead of calling their APIs"""
+    geocoder = HierarchicalGeocoder(google_api_key='benchmark', redis_url="redis://localhost:1")
+    geocoder.cache.redis_client = None
+
+    for provider, rps, name in ((geocoder.nominatim, nominatim_rps, GeocodeProvider.NOMINATIM),
+                                (geocoder.google, google_rps, GeocodeProvider.GOOGLE)):
+        provider.rate_limiter = RateLimiter(requests_per_second=rps)
+
+        def geocode(address, wait_for_token=False, provider=provider, name=name):
+            async def respond():
+                if wait_for_token:
+                    await provider.rate_limiter.acquire_wait()
+                elif not provider.rate_limiter.acquire():
+                    return GeocodeResult(status=GeocodeStatus.RATE_LIMITED, provider=name)
+                await asyncio.sleep(latency_ms / 1000)
+                return GeocodeResult(latitude=34.05, longitude=-118.25, status=GeocodeStatus.SUCCESS, provider=name)
+            return respond()
+
+        provider.geocode = geocode
+    return geocoder
+
+
+async def fixed_batches(geocoder: HierarchicalGeocoder, addresses, batch_size=10, max_concurrent=5):
+    """The previous geocode_batch: gather each batch, pause 0.5s, RATE_LIMITED on an empty bucket"""
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def one(address):
+        async with semaphore:
+            for provider, key in ((geocoder.nominatim, 'nominatim_success'), (geocoder.google, 'google_success')):
+                for attempt in range(3):
+                    result = await provider.geocode(address)
+                    if result.status == GeocodeStatus.SUCCESS:
+                        geocoder.stats[key] += 1
+                        return result
+                    if result.status == GeocodeStatus.RATE_LIMITED and attempt < 2:
+                        await asyncio.sleep(provider.rate_limiter.time_until_available())
+                        continue
+                    break
+            return GeocodeResult(status=GeocodeStatus.FAILED)
+
+    results = []
+    for i in range(0, len(addresses), batch_size):
+        results += await asyncio.gather(*(one(a) for a in addresses[i:i + batch_size]))
+        if i + batch_size < len(addresses):
+            await asyncio.sleep(0.5)
+    return results
+
+
+def report(label: str, geocoder: HierarchicalGeocoder, results, elapsed: float, ceiling: float):
+    successes = sum(r.status == GeocodeStatus.SUCCESS for r in results)
+    rate = len(results) / elapsed
+    print(f"   - {label:28s} {elapsed:6.1f}s, {rate:6.1f} addresses/sec ({rate / ceiling:4.0%} of Nominatim ceiling), "
+          f"{successes}/{len(results)} ok, Google {geocoder.stats['google_success']}")
+
+
+async def benchmark(args):
+    addresses = [f"{100 + i} S Broadway, Los Angeles, CA 90012" for i in range(args.addresses)]
+    print(f"\n{args.addresses} uncached addresses, Nominatim {args.nominatim_rps:g} req/s, "
+          f"Google {args.google_rps:g} req/s, latency {args.latency_ms:g} ms")
+
+    cases = (
+        ('Fixed batches + 0.5s pause', lambda g: fixed_batches(g, addresses)),
+        ('Work queue, no spill', lambda g: g.geocode_batch(addresses, use_cache=False,
+                                                           google_spill_backlog_seconds=None)),
+        (f'Work queue, spill > {args.spill_seconds:g}s', lambda g: g.geocode_batch(
+            addresses, use_cache=False, google_spill_backlog_seconds=args.spill_seconds)),
+    )
+    for label, run in cases:
+        geocoder = stand_in_geocoder(args.nominatim_rps, args.google_rps, args.latency_ms)
+        start = time.perf_counter()
+        results = await run(geocoder)
+        report(label, geocoder, results, time.perf_counter() - start, args.nominatim_rps)
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="DealGenie geocode batch scheduler benchmark")
+    parser.add_argument('--addresses', type=int, default=300, help='Uncached addresses per run')
+    parser.add_argument('--nominatim-rps', type=float, default=20.0, help='Nominatim rate limit')
+    parser.add_argument('--google-rps', type=float, default=50.0, help='Google rate limit')
+    parser.add_argument('--latency-ms', type=float, default=80.0, help='Simulated provider latency')
+    parser.add_argument('--spill-seconds', type=float, default=5.0, help='Backlog that spills to Google')
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args))
+    print("\n✅ Benchmark complete!")
+
+
+if __name__ == '__main__':
+    main()
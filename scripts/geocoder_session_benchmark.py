@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Geocoder HTTP session benchmark: a new aiohttp session per address versus the
+providers' pooled keep-alive session.
+
+Runs a local stand-in for the Nominatim search endpoint (plain HTTP, so only the
+TCP handshake is saved; against the real HTTPS APIs a new session also pays a
+TLS handshake per address) and geocodes the same batch both ways.
+
+Usage:
+    python scripts/geocoder_session_benchmark.py --addresses 2000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import aiohttp
+from aiohttp import web
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from geocoding.geocoder import NominatimGeocoder, RateLimiter
+
+
+async def start_stand_in_server(latency_ms: float) -> web.AppRunner:
+    """Local Nominatim-shaped search endpoint"""
+    async def search(request):
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return web.json_response([{
+            'lat': '34.0522265', 'lon': '-118.2436596', 'type': 'house', 'importance': 0.5,
+            'display_name': request.query['q'], 'address': {'city': 'Los Angeles'}
+        }])
+
+    app = web.Application()
+    app.router.add_get('/search', search)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    return runner
+
+
+async def run_batch(geocode, addresses, concurrency: int) -> float:
+    """Addresses per second with `concurrency` requests in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(address):
+        async with semaphore:
+            await geocode(address)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(address) for address in addresses))
+    return len(addresses) / (time.perf_counter() - start)
+
+
+async def benchmark(addresses: int, concurrency: int, latency_ms: float):
+    runner = await start_stand_in_server(latency_ms)
+    base_url = f"http://127.0.0.1:{runner.addresses[0][1]}/search"
+    batch = [f"{i} S Broadway, Los Angeles, CA 90012" for i in range(addresses)]
+
+    async def per_request_session(address):
+        # The pre-pooling request pattern: one ClientSession per address
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{base_url}?{urlencode({'q': address, 'format': 'json'})}",
+                                   headers={'User-Agent': 'DealGenie/1.0'}) as response:
+                return await response.json()
+
+    geocoder = NominatimGeocoder()
+    geocoder.base_url = base_url
+    geocoder.rate_limiter = RateLimiter(requests_per_second=1e9, burst_size=10 ** 9)
+
+    try:
+        before = await run_batch(per_request_session, batch, concurrency)
+        after = await run_batch(geocoder.geocode, batch, concurrency)
+    finally:
+        await geocoder.close()
+        await runner.cleanup()
+
+    print(f"\nBatch of {addresses:,} addresses, concurrency {concurrency}, "
+          f"server latency {latency_ms:g} ms")
+    print(f"   - Session per address: {before:8,.0f} addresses/sec")
+    print(f"   - Pooled session:      {after:8,.0f} addresses/sec")
+    print(f"   - Throughput improvement: {after / before:.1f}x")
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="DealGenie geocoder HTTP session benchmark")
+    parser.add_argument('--addresses', type=int, default=2000, help='Addresses per run')
+    parser.add_argument('--concurrency', type=int, default=10, help='Requests in flight')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated server latency')
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.addresses, args.concurrency, args.latency_ms))
+    print("\n✅ Benchmark complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Local parcel geocoder benchmark: index build time and per-address lookup latency
+for exact parcel hits, interpolated house numbers and misses.
+
+Generates a street grid of parcels shaped like search_idx_parcel rows (or reads
+a real parcel table with --db) and geocodes free-form variants of the addresses.
+
+Usage:
+    python scripts/local_geocoder_benchmark.py --parcels 200000 --lookups 20000
+    python scripts/local_geocoder_benchmark.py --db search_idx_parcel.db
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from geocoding.geocoder import GeocodeStatus, LocalParcelGeocoder
+
+STREETS = ['N Highland Ave', 'S Broadway', 'W Sunset Blvd', 'E Olympic Blvd', 'S Vermont Ave',
+           'N Western Ave', 'W Pico Blvd', 'S Figueroa St', 'W 3rd St', 'N La Brea Ave']
+SPELLED_OUT = {'N ': 'North ', 'S ': 'South ', 'E ': 'East ', 'W ': 'West ',
+               'Ave': 'Avenue', 'Blvd': 'Boulevard', 'St': 'Street'}
+
+
+def build_grid(geocoder: LocalParcelGeocoder, parcels: int, rng: random.Random) -> list:
+    """Parcels every 10-30 house numbers along each street, 8 ZIP codes per street"""
+    addresses = []
+    per_street = parcels // len(STREETS)
+    for s, street in enumerate(STREETS):
+        number = 100
+        for i in range(per_street):
+            number += rng.choice((10, 20, 30)) + (i % 2)
+            zip_code = f"900{10 + s * 8 + i * 8 // per_street:02d}"
+            lat, lon = 34.0 + s * 0.02 + number * 1e-5, -118.3 + s * 0.01
+            geocoder.add(f"{number} {street}", lat, lon, zip_code)
+            addresses.append((number, street, zip_code))
+    geocoder.finalize()
+    return addresses
+
+
+def spelled_out(street: str) -> str:
+    for short, long in SPELLED_OUT.items():
+        street = street.replace(short, long)
+    return street
+
+
+def time_lookups(geocoder: LocalParcelGeocoder, addresses) -> tuple:
+    start = time.perf_counter()
+    hits = sum(geocoder.geocode(a).status == GeocodeStatus.SUCCESS for a in addresses)
+    return (time.perf_counter() - start) / len(addresses) * 1e6, hits / len(addresses)
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="DealGenie local parcel geocoder benchmark")
+    parser.add_argument('--parcels', type=int, default=200000, help='Synthetic parcels to index')
+    parser.add_argument('--lookups', type=int, default=20000, help='Addresses geocoded per case')
+    parser.add_argument('--db', help='Index a real parcel database instead of the synthetic grid')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+    if args.db:
+        geocoder = LocalParcelGeocoder.from_sqlite(args.db)
+        build_seconds = time.perf_counter() - start
+        print(f"\nIndexed {len(geocoder):,} addresses from {args.db} in {build_seconds:.1f}s")
+        if not len(geocoder):
+            print("❌ No parcel table with addresses and coordinates found")
+            return
+        sample = rng.sample(list(geocoder.addresses), min(args.lookups, len(geocoder)))
+        latency, hit_rate = time_lookups(geocoder, sample)
+        print(f"   - Indexed addresses: {latency:6.1f} us/address, {hit_rate:.1%} resolved")
+        print("\n✅ Benchmark complete!")
+        return
+
+    geocoder = LocalParcelGeocoder()
+    parcels = build_grid(geocoder, args.parcels, rng)
+    build_seconds = time.perf_counter() - start
+    print(f"\nIndexed {len(geocoder):,} parcel addresses in {build_seconds:.1f}s")
+
+    sample = [rng.choice(parcels) for _ in range(args.lookups)]
+    cases = {
+        'Exact (USPS form)': [f"{n} {street.upper()}, LOS ANGELES, CA {z}" for n, street, z in sample],
+        'Exact (spelled out, unit)': [f"{n} {spelled_out(street)} Apt 2, Los Angeles, CA {z}"
+                                      for n, street, z in sample],
+        'Interpolated': [f"{n + 2} {street}, Los Angeles, CA {z}" for n, street, z in sample],
+        'Miss (unknown street)': [f"{n} Nowhere Ln, Los Angeles, CA {z}" for n, street, z in sample],
+    }
+    for label, addresses in cases.items():
+        latency, hit_rate = time_lookups(geocoder, addresses)
+        print(f"   - {label:26s} {latency:6.1f} us/address, {hit_rate:6.1%} resolved")
+
+    stats = geocoder.stats
+    print(f"\nExact {stats['exact']:,}, interpolated {stats['interpolated']:,}, misses {stats['misses']:,}")
+    print("\n✅ Benchmark complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Per-request latency of DealGenie SQLite reads with and without connection reuse.
+
+Compares, on a generated parcels database:
+- DealGenieDatabase-style reads: sqlite3.connect + PRAGMAs + query + close per
+  call (the old get_connection) versus the cached per-thread connection
+- Search-service reads: sqlite3.connect per request on the event loop versus
+  AsyncSQLiteConnectionManager (read-only, worker threads)
+
+Usage:
+    python scripts/sqlite_connection_benchmark.py --parcels 20000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.connection_manager import AsyncSQLiteConnectionManager, get_connection_manager
+from db.database_manager import DealGenieDatabase
+
+SCHEMA_PATH = Path(__file__).parent.parent / 'db' / 'sqlite_schema.sql'
+
+PARCEL_QUERY = "SELECT * FROM parcels WHERE apn = ?"
+SEARCH_QUERY = '''
+    SELECT apn, address, zoning, lot_size_sqft FROM parcels
+    WHERE centroid_lat BETWEEN ? AND ? AND centroid_lon BETWEEN ? AND ?
+    LIMIT 50
+'''
+
+
+def build_database(path: str, parcels: int):
+    """Create a schema-complete database with generated parcels"""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+
+    rng = random.Random(42)
+    db = DealGenieDatabase(path)
+    db.store_parcels_bulk((f'BENCH-{i:06d}', {
+        'site_address': f'{i} Main St', 'zoning': rng.choice(['R3', 'C2', 'M1', 'R1']),
+        'lot_size_sqft': rng.uniform(3000, 30000), 'site_zip': '90012',
+        'latitude': 34.0 + rng.random() * 0.2, 'longitude': -118.4 + rng.random() * 0.2,
+    }) for i in range(parcels))
+    db.connections.close()
+
+
+def legacy_connection(path: str) -> sqlite3.Connection:
+    """The pre-pooling DealGenieDatabase.get_connection"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        'mean_us': statistics.mean(latencies) * 1e6,
+        'p50_us': latencies[len(latencies) // 2] * 1e6,
+        'p95_us': latencies[int(len(latencies) * 0.95)] * 1e6,
+    }
+
+
+def time_requests(request: Callable[[int], None], requests: int) -> Dict[str, float]:
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        request(i)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+def benchmark_database_reads(path: str, parcels: int, requests: int) -> Dict[str, Dict[str, float]]:
+    apns = [f'BENCH-{random.randrange(parcels):06d}' for _ in range(requests)]
+
+    def before(i: int):
+        conn = legacy_connection(path)
+        try:
+            conn.execute(PARCEL_QUERY, (apns[i],)).fetchone()
+        finally:
+            conn.close()
+
+    manager = get_connection_manager(path, row_factory=sqlite3.Row)
+
+    def after(i: int):
+        conn = manager.connection()
+        try:
+            conn.execute(PARCEL_QUERY, (apns[i],)).fetchone()
+        finally:
+            conn.close()
+
+    return {'before': time_requests(before, requests), 'after': time_requests(after, requests)}
+
+
+def benchmark_search_requests(path: str, requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    boxes = []
+    for _ in range(requests):
+        lat, lon = 34.0 + random.random() * 0.18, -118.4 + random.random() * 0.18
+        boxes.append((lat, lat + 0.02, lon, lon + 0.02))
+
+    async def run(handler) -> Dict[str, float]:
+        # Latency one request at a time, then throughput with `concurrency` requests in flight
+        latencies = []
+        for box in boxes:
+            start = time.perf_counter()
+            await handler(box)
+            latencies.append(time.perf_counter() - start)
+        stats = summarize(latencies)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request(box):
+            async with semaphore:
+                await handler(box)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request(box) for box in boxes))
+        stats['requests_per_second'] = len(boxes) / (time.perf_counter() - start)
+        return stats
+
+    async def before(box):
+        # What the week3 endpoints did: connect and query on the event loop
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute(SEARCH_QUERY, box).fetchall()
+        finally:
+            conn.close()
+
+    search_db = AsyncSQLiteConnectionManager(path)
+
+    async def after(box):
+        await search_db.fetchall(SEARCH_QUERY, box)
+
+    try:
+        return {'before': asyncio.run(run(before)), 'after': asyncio.run(run(after))}
+    finally:
+        search_db.close()
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]]):
+    print(f"\n{title}")
+    for label, stats in results.items():
+        line = (f"   - {label:6s}: mean {stats['mean_us']:8.1f} us   p50 {stats['p50_us']:8.1f} us   "
+                f"p95 {stats['p95_us']:8.1f} us")
+        if 'requests_per_second' in stats:
+            line += f"   {stats['requests_per_second']:,.0f} req/sec concurrent"
+        print(line)
+    speedup = results['before']['mean_us'] / results['after']['mean_us']
+    print(f"   - Mean latency improvement: {speedup:.1f}x")
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="DealGenie SQLite connection reuse benchmark")
+    parser.add_argument('--parcels', type=int, default=20000, help='Parcels in the generated database')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent async search requests')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'benchmark.db')
+        print(f"Building benchmark database with {args.parcels:,} parcels...")
+        build_database(path, args.parcels)
+
+        print_results("DealGenieDatabase point reads (per call)",
+                      benchmark_database_reads(path, args.parcels, args.requests))
+        print_results(f"Search endpoint reads (async, concurrency {args.concurrency})",
+                      benchmark_search_requests(path, args.requests, args.concurrency))
+
+    print("\n✅ Benchmark complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -42,7 +42,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from normalization.address_parser import AddressParser
-from geocoding import HierarchicalGeocoder
+from geocoding import HierarchicalGeocoder, DEFAULT_GEOCODE_CACHE_PATH
 
 # Configure logging
 logging.basicConfig(
@@ -242,7 +242,9 @@ class LAPermitsExtractor:
         self.rate_limiter = RateLimiter(api_config=self.api_config)
         self.circuit_breaker = CircuitBreaker()
         self.address_parser = AddressParser()
-        self.geocoder = HierarchicalGeocoder(user_agent="DealGenie ETL Pipeline/1.0")
+        # Embedded cache tier so reruns don't re-geocode addresses without Redis
+        self.geocoder = HierarchicalGeocoder(user_agent="DealGenie ETL Pipeline/1.0",
+                                             cache_path=DEFAULT_GEOCODE_CACHE_PATH)
         
         # Track extraction state
         self.extraction_id = None
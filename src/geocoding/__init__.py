@@ -10,6 +10,9 @@ from .geocoder import (
     GeocodeResult,
     GeocodeStatus,
     GeocodeProvider,
+    GeocodeCache,
+    LocalParcelGeocoder,
+    DEFAULT_GEOCODE_CACHE_PATH,
     geocode_address,
     geocode_addresses
 )
@@ -19,6 +22,9 @@ __all__ = [
     'GeocodeResult', 
     'GeocodeStatus',
     'GeocodeProvider',
+    'GeocodeCache',
+    'LocalParcelGeocoder',
+    'DEFAULT_GEOCODE_CACHE_PATH',
     'geocode_address',
     'geocode_addresses'
 ]
@@ -3,18 +3,33 @@
 DealGenie Hierarchical Geocoding Service
 Implements robust geocoding with multiple providers, caching, rate limiting,
 and batch processing for Los Angeles real estate data.
+
+Each provider owns one long-lived aiohttp session (keep-alive connection pool,
+per-host limit, DNS cache, timeouts), created on first use and closed through
+HierarchicalGeocoder's async context manager:
+
+    async with HierarchicalGeocoder() as geocoder:
+        results = await geocoder.geocode_batch(addresses)
 """
 
 import asyncio
+import bisect
+import dataclasses
 import hashlib
 import json
 import logging
+import math
+import re
+import sqlite3
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple, Union, Any
 from enum import Enum
 import threading
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 
 # HTTP and async imports
 import aiohttp
@@ -30,8 +45,18 @@ except ImportError:
     REDIS_AVAILABLE = False
     logging.warning("Redis not available. Install with: pip install redis")
 
+# Shared in-process cache primitive (repository root holds the scoring package)
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from scoring.bounded_cache import BoundedCache
+from db.connection_manager import get_connection_manager
+
+# USPS address normalization (sibling package under src/)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from normalization.address_parser import AddressParser, ParsedAddress
+
 class GeocodeProvider(Enum):
     """Geocoding service providers."""
+    LOCAL = "local"
     NOMINATIM = "nominatim"
     GOOGLE = "google"
     CACHE = "cache"
@@ -81,6 +106,17 @@ class GeocodeResult:
             result['provider'] = self.provider.value
         result['status'] = self.status.value
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GeocodeResult':
+        """Rebuild a result from to_dict() output (enums and timestamp restored)."""
+        data = dict(data)
+        data['status'] = GeocodeStatus(data.get('status', GeocodeStatus.FAILED.value))
+        if data.get('provider') is not None:
+            data['provider'] = GeocodeProvider(data['provider'])
+        if isinstance(data.get('timestamp'), str):
+            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        return cls(**data)
 
 class CircuitBreaker:
     """Circuit breaker pattern for geocoding services."""
@@ -154,14 +190,185 @@ class RateLimiter:
             if self.tokens >= 1:
                 return 0.0
             return (1 - self.tokens) / self.rate
+    
+    async def acquire_wait(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until tokens are available, then take them.
+        
+        Tokens are reserved up front (the bucket may go negative), so concurrent
+        waiters are spaced exactly 1/rate apart instead of waking together and
+        racing for the same token.
+        
+        Args:
+            timeout: Longest wait in seconds (None = wait as long as needed)
+            
+        Returns:
+            False if the wait would exceed timeout (nothing is reserved)
+        """
+        with self._lock:
+            now = time.time()
+            self.tokens = min(self.burst_size, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            
+            wait = max(0.0, (tokens - self.tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return False
+            self.tokens -= tokens
+        
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+# Connection pool and timeout settings for provider HTTP sessions
+HTTP_CLIENT_OPTIONS = {
+    'limit': 100,               # Open connections across all hosts
+    'limit_per_host': 10,       # Open connections to one provider host
+    'ttl_dns_cache': 300,       # Seconds a DNS lookup is reused
+    'keepalive_timeout': 30.0,  # Seconds an idle connection stays in the pool
+    'connect_timeout': 5.0,     # Seconds to establish a connection
+    'total_timeout': 15.0,      # Seconds for a whole request
+}
+
+class ProviderHTTPSession:
+    """Lazily created aiohttp session whose connections are reused across requests."""
+    
+    def __init__(self, headers: Optional[Dict[str, str]] = None, **options):
+        self.headers = headers or {}
+        self.options = {**HTTP_CLIENT_OPTIONS, **options}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating it on first use in the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and (self._session.closed or self._loop is not loop):
+            # Sessions are bound to the loop that created them (e.g. repeated asyncio.run)
+            self._session = None
+        
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.options['limit'],
+                limit_per_host=self.options['limit_per_host'],
+                ttl_dns_cache=self.options['ttl_dns_cache'],
+                keepalive_timeout=self.options['keepalive_timeout']
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=self.options['total_timeout'],
+                connect=self.options['connect_timeout']
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                                  headers=self.headers)
+            self._loop = loop
+        return self._session
+    
+    async def close(self):
+        """Close the session and its pooled connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed and self._loop is asyncio.get_running_loop():
+            await session.close()
+
+# Nominatim backlog (seconds of queued work at its rate) above which batches
+# also send queued addresses to Google
+GOOGLE_SPILL_BACKLOG_SECONDS = 300.0
+
+# Embedded cache file used by batch/ETL runs, so reruns skip addresses already geocoded
+DEFAULT_GEOCODE_CACHE_PATH = "data/geocode_cache.db"
+
+# SQLite limits bound parameters per statement (999 on older builds)
+SQLITE_MAX_PARAMS = 900
+
+class DiskGeocodeCache:
+    """
+    Embedded on-disk geocode cache (SQLite in WAL mode) with per-entry TTL.
+    
+    Stores the same serialized results as the other tiers; expired rows are
+    skipped on read and purged when the cache is opened.
+    """
+    
+    def __init__(self, db_path: str = DEFAULT_GEOCODE_CACHE_PATH, ttl_seconds: int = 7 * 24 * 3600):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # WAL readers never block the writer; synchronous=NORMAL fsyncs only at checkpoints
+        self.connections = get_connection_manager(db_path, pragmas={'synchronous': 'NORMAL'})
+        
+        with self.connections.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("DELETE FROM geocode_cache WHERE expires_at <= ?", (time.time(),))
+    
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Serialized results for the keys present and unexpired."""
+        found = {}
+        now = time.time()
+        conn = self.connections.connection()
+        try:
+            for i in range(0, len(keys), SQLITE_MAX_PARAMS):
+                chunk = keys[i:i + SQLITE_MAX_PARAMS]
+                rows = conn.execute(
+                    f"SELECT cache_key, result_json FROM geocode_cache "
+                    f"WHERE cache_key IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now)
+                )
+                found.update(rows)
+        finally:
+            conn.close()
+        return found
+    
+    def set_many(self, items: Dict[str, str]):
+        """Store serialized results in one transaction."""
+        expires_at = time.time() + self.ttl_seconds
+        with self.connections.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO geocode_cache (cache_key, result_json, expires_at) VALUES (?, ?, ?)",
+                [(key, data, expires_at) for key, data in items.items()]
+            )
+    
+    def __len__(self) -> int:
+        conn = self.connections.connection()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM geocode_cache WHERE expires_at > ?",
+                                (time.time(),)).fetchone()[0]
+        finally:
+            conn.close()
 
 class GeocodeCache:
-    """Redis-based geocoding cache with TTL."""
+    """
+    Tiered geocoding cache: bounded in-process LRU, then an optional embedded
+    SQLite store, then Redis when reachable.
+    
+    Hits are promoted into the faster tiers; writes go to every tier. Without
+    Redis (batch and laptop runs) the disk tier keeps results across reruns.
+    """
+    
+    TIERS = ('memory', 'disk', 'redis')
     
     def __init__(self, redis_url: str = "redis://localhost:6379", 
-                 ttl_seconds: int = 7 * 24 * 3600):  # 1 week default
+                 ttl_seconds: int = 7 * 24 * 3600,  # 1 week default
+                 memory_max_entries: int = 10000,
+                 disk_path: Optional[str] = None):
+        """
+        Args:
+            disk_path: SQLite file for the embedded tier (None disables it),
+                e.g. DEFAULT_GEOCODE_CACHE_PATH
+        """
         self.ttl_seconds = ttl_seconds
         self.redis_client = None
+        # Serialized results, so every hit returns a fresh GeocodeResult
+        self.memory = BoundedCache(max_entries=memory_max_entries, ttl_seconds=ttl_seconds, name='geocode')
+        self.disk = None
+        self.reset_stats()
+        
+        if disk_path:
+            try:
+                self.disk = DiskGeocodeCache(disk_path, ttl_seconds)
+            except sqlite3.Error as e:
+                logging.warning(f"Disk geocode cache unavailable at {disk_path}: {e}")
         
         if REDIS_AVAILABLE:
             try:
@@ -175,67 +382,182 @@ class GeocodeCache:
         else:
             logging.warning("Redis not available for caching")
     
+    @staticmethod
+    def normalize(address: str) -> str:
+        """Cache identity of an address: case and whitespace runs are ignored."""
+        return ' '.join(address.lower().split())
+    
     def _make_key(self, address: str) -> str:
         """Generate cache key from address."""
-        normalized = address.lower().strip()
-        hash_obj = hashlib.md5(normalized.encode('utf-8'))
+        hash_obj = hashlib.md5(self.normalize(address).encode('utf-8'))
         return f"geocode:{hash_obj.hexdigest()}"
     
+    def _decode(self, cached_data: str) -> GeocodeResult:
+        """Rebuild a cached result from its JSON form."""
+        result = GeocodeResult.from_dict(json.loads(cached_data))
+        result.cached = True
+        result.provider = GeocodeProvider.CACHE
+        return result
+    
+    def _encode(self, result: GeocodeResult) -> str:
+        # Don't cache the cached flag
+        cache_result = GeocodeResult(**asdict(result))
+        cache_result.cached = False
+        cache_result.timestamp = datetime.now()
+        return json.dumps(cache_result.to_dict())
+    
+    def _lookup(self, keys: List[str]) -> Dict[str, str]:
+        """Serialized results for keys, tier by tier, promoting lower-tier hits."""
+        self.lookups += len(keys)
+        found = {}
+        missing = []
+        for key in keys:
+            cached_data = self.memory.get(key)
+            if cached_data:
+                found[key] = cached_data
+            else:
+                missing.append(key)
+        self.tier_hits['memory'] += len(found)
+        
+        if missing and self.disk is not None:
+            try:
+                disk_found = self.disk.get_many(missing)
+            except sqlite3.Error as e:
+                logging.error(f"Disk cache get error: {e}")
+                disk_found = {}
+            self.tier_hits['disk'] += len(disk_found)
+            for key, cached_data in disk_found.items():
+                self.memory.set(key, cached_data)
+            found.update(disk_found)
+            missing = [key for key in missing if key not in disk_found]
+        
+        if missing and self.redis_client:
+            if len(missing) == 1:
+                values = [self.redis_client.get(missing[0])]
+            else:
+                values = self.redis_client.mget(missing)
+            redis_found = {key: value for key, value in zip(missing, values) if value}
+            self.tier_hits['redis'] += len(redis_found)
+            for key, cached_data in redis_found.items():
+                self.memory.set(key, cached_data)
+            if redis_found and self.disk is not None:
+                self.disk.set_many(redis_found)
+            found.update(redis_found)
+        
+        self.misses += len(keys) - len(found)
+        return found
+    
     def get(self, address: str) -> Optional[GeocodeResult]:
-        """Retrieve cached geocoding result."""
-        if not self.redis_client:
-            return None
-            
+        """Retrieve cached geocoding result (in-process tier first, then disk, then Redis)."""
+        key = self._make_key(address)
+        
         try:
-            key = self._make_key(address)
-            cached_data = self.redis_client.get(key)
-            
+            cached_data = self._lookup([key]).get(key)
             if cached_data:
-                data = json.loads(cached_data)
-                result = GeocodeResult(**data)
-                result.cached = True
-                result.provider = GeocodeProvider.CACHE
-                return result
+                return self._decode(cached_data)
         except Exception as e:
             logging.error(f"Cache get error: {e}")
         
         return None
     
+    def get_many(self, addresses: List[str]) -> Dict[str, GeocodeResult]:
+        """
+        Retrieve cached results for many addresses with one query per tier.
+        
+        Returns:
+            Cached results keyed by the addresses that hit
+        """
+        keys = {address: self._make_key(address) for address in addresses}
+        
+        try:
+            found = self._lookup(list(dict.fromkeys(keys.values())))
+            return {address: self._decode(found[key]) for address, key in keys.items() if key in found}
+        except Exception as e:
+            logging.error(f"Cache get error: {e}")
+            return {}
+    
     def set(self, address: str, result: GeocodeResult):
         """Store geocoding result in cache."""
-        if not self.redis_client or result.status != GeocodeStatus.SUCCESS:
-            return
-            
+        self.set_many({address: result})
+    
+    def set_many(self, results: Dict[str, GeocodeResult]):
+        """Store successful results in every tier (one transaction / pipeline per tier)."""
         try:
-            key = self._make_key(address)
-            # Don't cache the cached flag
-            cache_result = GeocodeResult(**asdict(result))
-            cache_result.cached = False
-            cache_result.timestamp = datetime.now()
+            items = {self._make_key(address): self._encode(result)
+                     for address, result in results.items() if result.status == GeocodeStatus.SUCCESS}
+            if not items:
+                return
             
-            data = json.dumps(cache_result.to_dict())
-            self.redis_client.setex(key, self.ttl_seconds, data)
+            for key, data in items.items():
+                self.memory.set(key, data)
+            if self.disk is not None:
+                self.disk.set_many(items)
+            if self.redis_client:
+                if len(items) == 1:
+                    key, data = next(iter(items.items()))
+                    self.redis_client.setex(key, self.ttl_seconds, data)
+                else:
+                    pipeline = self.redis_client.pipeline(transaction=False)
+                    for key, data in items.items():
+                        pipeline.setex(key, self.ttl_seconds, data)
+                    pipeline.execute()
         except Exception as e:
             logging.error(f"Cache set error: {e}")
+    
+    def reset_stats(self):
+        """Zero the per-tier hit counters."""
+        self.lookups = 0
+        self.misses = 0
+        self.tier_hits = {tier: 0 for tier in self.TIERS}
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hits and hit rate per tier (as a share of all lookups)."""
+        enabled = {'memory': True, 'disk': self.disk is not None, 'redis': self.redis_client is not None}
+        return {
+            'lookups': self.lookups,
+            'misses': self.misses,
+            'tiers': {
+                tier: {
+                    'enabled': enabled[tier],
+                    'hits': self.tier_hits[tier],
+                    'hit_rate': self.tier_hits[tier] / self.lookups if self.lookups else 0.0,
+                }
+                for tier in self.TIERS
+            },
+        }
 
 class NominatimGeocoder:
     """OpenStreetMap Nominatim geocoding service."""
     
-    def __init__(self, user_agent: str = "DealGenie/1.0"):
+    # Requests in flight during batches; throughput is still capped by rate_limiter
+    max_concurrent = 2
+    
+    def __init__(self, user_agent: str = "DealGenie/1.0", http_options: Optional[Dict[str, Any]] = None):
         self.base_url = "https://nominatim.openstreetmap.org/search"
         self.user_agent = user_agent
         self.rate_limiter = RateLimiter(requests_per_second=1.0)  # Nominatim limit
         self.circuit_breaker = CircuitBreaker(failure_threshold=3)
+        self.http = ProviderHTTPSession(headers={'User-Agent': user_agent}, **(http_options or {}))
+    
+    async def close(self):
+        """Close the pooled HTTP session."""
+        await self.http.close()
         
-    async def geocode(self, address: str) -> GeocodeResult:
-        """Geocode address using Nominatim."""
+    async def geocode(self, address: str, wait_for_token: bool = False) -> GeocodeResult:
+        """
+        Geocode address using Nominatim.
+        
+        Args:
+            wait_for_token: Wait for the rate limiter instead of returning RATE_LIMITED
+        """
         if not self.circuit_breaker.call_allowed():
             return GeocodeResult(
                 status=GeocodeStatus.CIRCUIT_OPEN,
                 provider=GeocodeProvider.NOMINATIM
             )
         
-        if not self.rate_limiter.acquire():
+        acquired = await self.rate_limiter.acquire_wait() if wait_for_token else self.rate_limiter.acquire()
+        if not acquired:
             return GeocodeResult(
                 status=GeocodeStatus.RATE_LIMITED,
                 provider=GeocodeProvider.NOMINATIM
@@ -254,48 +576,43 @@ class NominatimGeocoder:
                 'countrycodes': 'us'
             }
             
-            headers = {
-                'User-Agent': self.user_agent
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}?{urlencode(params)}", 
-                                     headers=headers) as response:
-                    
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    if response.status == 429:
-                        self.circuit_breaker.record_failure()
-                        return GeocodeResult(
-                            status=GeocodeStatus.RATE_LIMITED,
-                            provider=GeocodeProvider.NOMINATIM,
-                            response_time_ms=response_time
-                        )
-                    
-                    if response.status != 200:
-                        self.circuit_breaker.record_failure()
-                        return GeocodeResult(
-                            status=GeocodeStatus.FAILED,
-                            provider=GeocodeProvider.NOMINATIM,
-                            response_time_ms=response_time
-                        )
-                    
-                    data = await response.json()
-                    
-                    if not data:
-                        return GeocodeResult(
-                            status=GeocodeStatus.FAILED,
-                            provider=GeocodeProvider.NOMINATIM,
-                            response_time_ms=response_time
-                        )
-                    
-                    result = self._parse_nominatim_response(data[0])
-                    result.response_time_ms = response_time
-                    result.provider = GeocodeProvider.NOMINATIM
-                    
-                    self.circuit_breaker.record_success()
-                    return result
-                    
+            session = await self.http.get_session()
+            async with session.get(f"{self.base_url}?{urlencode(params)}") as response:
+                
+                response_time = (time.time() - start_time) * 1000
+                
+                if response.status == 429:
+                    self.circuit_breaker.record_failure()
+                    return GeocodeResult(
+                        status=GeocodeStatus.RATE_LIMITED,
+                        provider=GeocodeProvider.NOMINATIM,
+                        response_time_ms=response_time
+                    )
+                
+                if response.status != 200:
+                    self.circuit_breaker.record_failure()
+                    return GeocodeResult(
+                        status=GeocodeStatus.FAILED,
+                        provider=GeocodeProvider.NOMINATIM,
+                        response_time_ms=response_time
+                    )
+                
+                data = await response.json()
+                
+                if not data:
+                    return GeocodeResult(
+                        status=GeocodeStatus.FAILED,
+                        provider=GeocodeProvider.NOMINATIM,
+                        response_time_ms=response_time
+                    )
+                
+                result = self._parse_nominatim_response(data[0])
+                result.response_time_ms = response_time
+                result.provider = GeocodeProvider.NOMINATIM
+                
+                self.circuit_breaker.record_success()
+                return result
+                
         except asyncio.TimeoutError:
             self.circuit_breaker.record_failure()
             return GeocodeResult(
@@ -355,16 +672,29 @@ class NominatimGeocoder:
 class GoogleGeocoder:
     """Google Maps Geocoding API service."""
     
-    def __init__(self, api_key: str):
+    # Requests in flight during batches (matches HTTP_CLIENT_OPTIONS limit_per_host)
+    max_concurrent = 10
+    
+    def __init__(self, api_key: str, http_options: Optional[Dict[str, Any]] = None):
         self.api_key = api_key
         self.base_url = "https://maps.googleapis.com/maps/api/geocode/json"
         self.rate_limiter = RateLimiter(requests_per_second=50.0)  # Google limit
         self.circuit_breaker = CircuitBreaker(failure_threshold=5)
         self.daily_quota = 0  # Track daily usage
         self.quota_limit = 25000  # Adjust based on plan
+        self.http = ProviderHTTPSession(**(http_options or {}))
+    
+    async def close(self):
+        """Close the pooled HTTP session."""
+        await self.http.close()
+        
+    async def geocode(self, address: str, wait_for_token: bool = False) -> GeocodeResult:
+        """
+        Geocode address using Google Maps API.
         
-    async def geocode(self, address: str) -> GeocodeResult:
-        """Geocode address using Google Maps API."""
+        Args:
+            wait_for_token: Wait for the rate limiter instead of returning RATE_LIMITED
+        """
         if not self.circuit_breaker.call_allowed():
             return GeocodeResult(
                 status=GeocodeStatus.CIRCUIT_OPEN,
@@ -377,7 +707,8 @@ class GoogleGeocoder:
                 provider=GeocodeProvider.GOOGLE
             )
         
-        if not self.rate_limiter.acquire():
+        acquired = await self.rate_limiter.acquire_wait() if wait_for_token else self.rate_limiter.acquire()
+        if not acquired:
             return GeocodeResult(
                 status=GeocodeStatus.RATE_LIMITED,
                 provider=GeocodeProvider.GOOGLE
@@ -393,51 +724,51 @@ class GoogleGeocoder:
                 'region': 'us'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}?{urlencode(params)}") as response:
-                    
-                    response_time = (time.time() - start_time) * 1000
-                    self.daily_quota += 1
-                    
-                    if response.status == 429:
-                        self.circuit_breaker.record_failure()
-                        return GeocodeResult(
-                            status=GeocodeStatus.RATE_LIMITED,
-                            provider=GeocodeProvider.GOOGLE,
-                            response_time_ms=response_time
-                        )
-                    
-                    if response.status != 200:
-                        self.circuit_breaker.record_failure()
-                        return GeocodeResult(
-                            status=GeocodeStatus.FAILED,
-                            provider=GeocodeProvider.GOOGLE,
-                            response_time_ms=response_time
-                        )
-                    
-                    data = await response.json()
-                    
-                    if data['status'] == 'OVER_QUERY_LIMIT':
-                        return GeocodeResult(
-                            status=GeocodeStatus.QUOTA_EXCEEDED,
-                            provider=GeocodeProvider.GOOGLE,
-                            response_time_ms=response_time
-                        )
-                    
-                    if data['status'] != 'OK' or not data.get('results'):
-                        return GeocodeResult(
-                            status=GeocodeStatus.FAILED,
-                            provider=GeocodeProvider.GOOGLE,
-                            response_time_ms=response_time
-                        )
-                    
-                    result = self._parse_google_response(data['results'][0])
-                    result.response_time_ms = response_time
-                    result.provider = GeocodeProvider.GOOGLE
-                    
-                    self.circuit_breaker.record_success()
-                    return result
-                    
+            session = await self.http.get_session()
+            async with session.get(f"{self.base_url}?{urlencode(params)}") as response:
+                
+                response_time = (time.time() - start_time) * 1000
+                self.daily_quota += 1
+                
+                if response.status == 429:
+                    self.circuit_breaker.record_failure()
+                    return GeocodeResult(
+                        status=GeocodeStatus.RATE_LIMITED,
+                        provider=GeocodeProvider.GOOGLE,
+                        response_time_ms=response_time
+                    )
+                
+                if response.status != 200:
+                    self.circuit_breaker.record_failure()
+                    return GeocodeResult(
+                        status=GeocodeStatus.FAILED,
+                        provider=GeocodeProvider.GOOGLE,
+                        response_time_ms=response_time
+                    )
+                
+                data = await response.json()
+                
+                if data['status'] == 'OVER_QUERY_LIMIT':
+                    return GeocodeResult(
+                        status=GeocodeStatus.QUOTA_EXCEEDED,
+                        provider=GeocodeProvider.GOOGLE,
+                        response_time_ms=response_time
+                    )
+                
+                if data['status'] != 'OK' or not data.get('results'):
+                    return GeocodeResult(
+                        status=GeocodeStatus.FAILED,
+                        provider=GeocodeProvider.GOOGLE,
+                        response_time_ms=response_time
+                    )
+                
+                result = self._parse_google_response(data['results'][0])
+                result.response_time_ms = response_time
+                result.provider = GeocodeProvider.GOOGLE
+                
+                self.circuit_breaker.record_success()
+                return result
+                
         except asyncio.TimeoutError:
             self.circuit_breaker.record_failure()
             return GeocodeResult(
@@ -491,6 +822,210 @@ class GoogleGeocoder:
             match_type='exact' if confidence > 0.8 else 'partial'
         )
 
+# Parcel tables with coordinates, tried in order by LocalParcelGeocoder.from_sqlite,
+# and the column names each logical field may have
+LOCAL_INDEX_TABLES = ('search_idx_parcel', 'unified_property_data', 'parcels')
+LOCAL_INDEX_COLUMNS = {
+    'address': ('site_address', 'address'),
+    'zip': ('zip_code', 'site_zip', 'zip'),
+    'lat': ('latitude', 'centroid_lat', 'lat'),
+    'lon': ('longitude', 'centroid_lon', 'lon'),
+}
+
+class LocalParcelGeocoder:
+    """
+    Offline geocoder over parcel addresses that already carry coordinates.
+    
+    Addresses are keyed on the street line of AddressParser's USPS format
+    (unit removed), so "1234 North Highland Avenue Apt 3" and "1234 N HIGHLAND AVE"
+    resolve to the same parcel. Lookups are dictionary hits; a house number
+    without a parcel of its own is interpolated between the nearest parcels on
+    the same side of the same street.
+    """
+    
+    EXACT_CONFIDENCE = 0.95
+    INTERPOLATED_CONFIDENCE = 0.85
+    MAX_INTERPOLATION_SPAN = 400     # House numbers between the bracketing parcels
+    MAX_SEGMENT_METERS = 1500.0      # Bracketing parcels farther apart are different streets
+    MAX_DUPLICATE_METERS = 250.0     # Same address in several parcels (condos, lots)
+    
+    def __init__(self, parser: Optional[AddressParser] = None):
+        self.parser = parser or AddressParser(use_libpostal=False)
+        # "1234 N HIGHLAND AVE" -> [(lat, lon, zip)]
+        self.addresses: Dict[str, List[Tuple[float, float, Optional[str]]]] = {}
+        # ("N HIGHLAND AVE", zip or None, parity) -> sorted [(house number, lat, lon)]
+        self.segments: Dict[Tuple[str, Optional[str], int], List[Tuple[int, float, float]]] = {}
+        self._segment_numbers: Dict[Tuple[str, Optional[str], int], List[int]] = {}
+        self.stats = {'exact': 0, 'interpolated': 0, 'misses': 0}
+    
+    def _keys(self, parsed: ParsedAddress) -> Optional[Tuple[str, str, int]]:
+        """(address key, street key, house number) from a parsed address"""
+        if not parsed.house_number or not parsed.street_name:
+            return None
+        number = re.match(r'\d+', parsed.house_number)
+        if not number:
+            return None
+        street_only = dataclasses.replace(parsed, unit_designator=None, unit_number=None, city=None)
+        address_key = street_only.to_usps_format()
+        street_key = dataclasses.replace(street_only, house_number=None).to_usps_format()
+        return address_key, street_key, int(number.group())
+    
+    def add(self, address: str, latitude: float, longitude: float, postal_code: Optional[str] = None) -> bool:
+        """
+        Index one parcel address.
+        
+        Returns:
+            False if the address has no house number and street
+        """
+        parsed = self.parser.parse(address)
+        keys = self._keys(parsed)
+        if keys is None or latitude is None or longitude is None:
+            return False
+        address_key, street_key, number = keys
+        zip5 = (postal_code or parsed.postal_code or '')[:5] or None
+        
+        self.addresses.setdefault(address_key, []).append((latitude, longitude, zip5))
+        for segment_zip in {zip5, None}:
+            self.segments.setdefault((street_key, segment_zip, number % 2), []).append((number, latitude, longitude))
+        return True
+    
+    def finalize(self):
+        """Sort street segments for interpolation (call after the last add())."""
+        for key, points in self.segments.items():
+            points.sort()
+            self._segment_numbers[key] = [point[0] for point in points]
+    
+    @classmethod
+    def from_sqlite(cls, db_path: str, tables: Tuple[str, ...] = LOCAL_INDEX_TABLES,
+                    parser: Optional[AddressParser] = None) -> 'LocalParcelGeocoder':
+        """
+        Build the index from the first parcel table in db_path that has an
+        address column and coordinates.
+        
+        Args:
+            db_path: SQLite database (e.g. search_idx_parcel.db or data/dealgenie.db)
+            tables: Candidate tables, see LOCAL_INDEX_TABLES
+        """
+        geocoder = cls(parser)
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            for table in tables:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                chosen = {field: next((c for c in candidates if c in columns), None)
+                          for field, candidates in LOCAL_INDEX_COLUMNS.items()}
+                if not (chosen['address'] and chosen['lat'] and chosen['lon']):
+                    continue
+                
+                zip_column = chosen['zip'] or 'NULL'
+                rows = conn.execute(f"""
+                    SELECT {chosen['address']}, {zip_column}, {chosen['lat']}, {chosen['lon']} FROM {table}
+                    WHERE {chosen['address']} IS NOT NULL
+                      AND {chosen['lat']} IS NOT NULL AND {chosen['lon']} IS NOT NULL
+                """)
+                indexed = sum(geocoder.add(address, lat, lon, str(zip_code) if zip_code else None)
+                              for address, zip_code, lat, lon in rows)
+                logging.info(f"Local geocoder indexed {indexed} addresses from {table}")
+                break
+        finally:
+            conn.close()
+        geocoder.finalize()
+        return geocoder
+    
+    @staticmethod
+    def _distance_meters(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+        # Equirectangular approximation; accurate to well under 1% at LA scale
+        x = math.radians(b[1] - a[1]) * math.cos(math.radians((a[0] + b[0]) / 2))
+        y = math.radians(b[0] - a[0])
+        return 6371000.0 * math.hypot(x, y)
+    
+    def _exact(self, address_key: str, zip5: Optional[str]) -> Optional[Tuple[float, float]]:
+        candidates = self.addresses.get(address_key)
+        if not candidates:
+            return None
+        if zip5:
+            in_zip = [c for c in candidates if c[2] == zip5]
+            candidates = in_zip or candidates
+        first = candidates[0][:2]
+        if any(self._distance_meters(first, c[:2]) > self.MAX_DUPLICATE_METERS for c in candidates[1:]):
+            return None  # Same street address in different cities; let the network providers decide
+        return first
+    
+    def _interpolate(self, street_key: str, number: int, zip5: Optional[str]) -> Optional[Tuple[float, float, int]]:
+        segment = (street_key, zip5, number % 2)
+        numbers = self._segment_numbers.get(segment)
+        if not numbers and zip5:
+            segment = (street_key, None, number % 2)
+            numbers = self._segment_numbers.get(segment)
+        if not numbers:
+            return None
+        
+        position = bisect.bisect_left(numbers, number)
+        if position == 0 or position == len(numbers):
+            return None  # Outside the indexed range; no extrapolation
+        if numbers[position] == number:
+            return None  # Indexed but rejected by _exact as ambiguous; a neighbour is no better
+        low_number, low_lat, low_lon = self.segments[segment][position - 1]
+        high_number, high_lat, high_lon = self.segments[segment][position]
+        span = high_number - low_number
+        if span > self.MAX_INTERPOLATION_SPAN or \
+           self._distance_meters((low_lat, low_lon), (high_lat, high_lon)) > self.MAX_SEGMENT_METERS:
+            return None
+        
+        t = (number - low_number) / span
+        return low_lat + t * (high_lat - low_lat), low_lon + t * (high_lon - low_lon), span
+    
+    def geocode_parsed(self, parsed: ParsedAddress) -> GeocodeResult:
+        """Geocode an address already parsed by AddressParser."""
+        start_time = time.perf_counter()
+        keys = self._keys(parsed)
+        if keys is None:
+            self.stats['misses'] += 1
+            return GeocodeResult(status=GeocodeStatus.FAILED, provider=GeocodeProvider.LOCAL)
+        address_key, street_key, number = keys
+        zip5 = parsed.postal_code[:5] if parsed.postal_code else None
+        
+        location = self._exact(address_key, zip5)
+        if location:
+            self.stats['exact'] += 1
+            latitude, longitude = location
+            confidence, precision = self.EXACT_CONFIDENCE, 'rooftop'
+        else:
+            interpolated = self._interpolate(street_key, number, zip5)
+            if not interpolated:
+                self.stats['misses'] += 1
+                return GeocodeResult(status=GeocodeStatus.FAILED, provider=GeocodeProvider.LOCAL,
+                                     response_time_ms=(time.perf_counter() - start_time) * 1000)
+            self.stats['interpolated'] += 1
+            latitude, longitude, span = interpolated
+            # Wider gaps between known parcels mean a less certain position
+            confidence = self.INTERPOLATED_CONFIDENCE - 0.2 * span / self.MAX_INTERPOLATION_SPAN
+            precision = 'interpolated'
+        
+        return GeocodeResult(
+            latitude=latitude,
+            longitude=longitude,
+            formatted_address=parsed.to_usps_format().replace('\n', ', '),
+            confidence_score=confidence,
+            provider=GeocodeProvider.LOCAL,
+            status=GeocodeStatus.SUCCESS,
+            street_number=parsed.house_number,
+            street_name=street_key,
+            city=parsed.city,
+            state=parsed.state,
+            postal_code=zip5,
+            country='US',
+            precision=precision,
+            match_type='exact' if confidence > 0.8 else 'partial',
+            response_time_ms=(time.perf_counter() - start_time) * 1000
+        )
+    
+    def geocode(self, address: str) -> GeocodeResult:
+        """Geocode an address from the parcel index (no network)."""
+        return self.geocode_parsed(self.parser.parse(address))
+    
+    def __len__(self) -> int:
+        return len(self.addresses)
+
 class HierarchicalGeocoder:
     """
     Main geocoding service with hierarchical provider fallback,
@@ -499,29 +1034,54 @@ class HierarchicalGeocoder:
     
     def __init__(self, google_api_key: Optional[str] = None,
                  redis_url: str = "redis://localhost:6379",
-                 user_agent: str = "DealGenie/1.0"):
-        
+                 user_agent: str = "DealGenie/1.0",
+                 http_options: Optional[Dict[str, Any]] = None,
+                 local_geocoder: Optional[Union[str, 'LocalParcelGeocoder']] = None,
+                 cache_path: Optional[str] = None):
+        """
+        Args:
+            local_geocoder: LocalParcelGeocoder, or a SQLite path to build one from,
+                tried before the cache and the network providers
+            cache_path: SQLite file for the embedded cache tier (e.g.
+                DEFAULT_GEOCODE_CACHE_PATH); None keeps results in memory and Redis only
+        """
         self.logger = logging.getLogger(__name__)
-        self.cache = GeocodeCache(redis_url)
-        self.nominatim = NominatimGeocoder(user_agent)
-        self.google = GoogleGeocoder(google_api_key) if google_api_key else None
+        if isinstance(local_geocoder, (str, Path)):
+            local_geocoder = LocalParcelGeocoder.from_sqlite(str(local_geocoder))
+        self.local = local_geocoder
+        self.cache = GeocodeCache(redis_url, disk_path=cache_path)
+        self.nominatim = NominatimGeocoder(user_agent, http_options)
+        self.google = GoogleGeocoder(google_api_key, http_options) if google_api_key else None
         
         # Statistics
         self.stats = {
             'total_requests': 0,
+            'local_success': 0,
             'cache_hits': 0,
             'nominatim_success': 0,
             'google_success': 0,
             'failures': 0
         }
     
+    async def __aenter__(self) -> 'HierarchicalGeocoder':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the providers' pooled HTTP sessions."""
+        await self.nominatim.close()
+        if self.google:
+            await self.google.close()
+    
     async def geocode(self, address: str, 
                      use_cache: bool = True,
                      max_retries: int = 2) -> GeocodeResult:
         """
         Geocode a single address with hierarchical fallback.
         
-        Flow: Cache → Nominatim → Google (if available)
+        Flow: Local parcels (if configured) → Cache → Nominatim → Google (if available)
         """
         if not address or not address.strip():
             return GeocodeResult(status=GeocodeStatus.FAILED)
@@ -529,6 +1089,13 @@ class HierarchicalGeocoder:
         self.stats['total_requests'] += 1
         address = address.strip()
         
+        # Parcel index answers in-process; its results are not worth a cache entry
+        if self.local:
+            local_result = self.local.geocode(address)
+            if local_result.status == GeocodeStatus.SUCCESS:
+                self.stats['local_success'] += 1
+                return local_result
+        
         # Try cache first
         if use_cache:
             cached_result = self.cache.get(address)
@@ -536,14 +1103,19 @@ class HierarchicalGeocoder:
                 self.stats['cache_hits'] += 1
                 return cached_result
         
+        result = await self._geocode_providers(address, max_retries)
+        if use_cache and result.status == GeocodeStatus.SUCCESS:
+            self.cache.set(address, result)
+        return result
+    
+    async def _geocode_providers(self, address: str, max_retries: int = 2) -> GeocodeResult:
+        """Nominatim, then Google (if available); no cache reads or writes."""
         # Try Nominatim first (free)
         for attempt in range(max_retries + 1):
-            result = await self.nominatim.geocode(address)
+            result = await self.nominatim.geocode(address, wait_for_token=True)
             
             if result.status == GeocodeStatus.SUCCESS:
                 self.stats['nominatim_success'] += 1
-                if use_cache:
-                    self.cache.set(address, result)
                 return result
             
             if result.status == GeocodeStatus.RATE_LIMITED and attempt < max_retries:
@@ -556,12 +1128,10 @@ class HierarchicalGeocoder:
         # Fallback to Google if available
         if self.google:
             for attempt in range(max_retries + 1):
-                result = await self.google.geocode(address)
+                result = await self.google.geocode(address, wait_for_token=True)
                 
                 if result.status == GeocodeStatus.SUCCESS:
                     self.stats['google_success'] += 1
-                    if use_cache:
-                        self.cache.set(address, result)
                     return result
                 
                 if result.status == GeocodeStatus.RATE_LIMITED and attempt < max_retries:
@@ -578,51 +1148,194 @@ class HierarchicalGeocoder:
     async def geocode_batch(self, addresses: List[str],
                            batch_size: int = 10,
                            max_concurrent: int = 5,
-                           use_cache: bool = True) -> List[GeocodeResult]:
+                           use_cache: bool = True,
+                           google_spill_backlog_seconds: Optional[float] = GOOGLE_SPILL_BACKLOG_SECONDS
+                           ) -> List[GeocodeResult]:
         """
         Geocode multiple addresses efficiently with batching and concurrency control.
+        
+        Addresses are deduplicated on their cache key and resolved in a pre-pass
+        (local parcels, then one bulk lookup per cache tier, off the event loop);
+        only the misses go to the providers (see _schedule_providers).
+        
+        Args:
+            batch_size: Successful provider results per bulk cache write
+            max_concurrent: Cap on each provider's requests in flight
+            google_spill_backlog_seconds: Queued work, in seconds at Nominatim's
+                rate, above which Google also takes queued addresses (None = Google
+                only sees Nominatim failures)
+            
+        Returns:
+            One result per input address, in input order
         """
         if not addresses:
             return []
         
         self.logger.info(f"Starting batch geocoding of {len(addresses)} addresses")
         
+        # Deduplicate: cache key -> first spelling seen
+        unique: Dict[str, str] = {}
+        for address in addresses:
+            if address and address.strip():
+                unique.setdefault(GeocodeCache.normalize(address), address.strip())
+        self.stats['total_requests'] += len(unique)
+        resolved: Dict[str, GeocodeResult] = {}
+        
+        if self.local:
+            for key, address in unique.items():
+                local_result = self.local.geocode(address)
+                if local_result.status == GeocodeStatus.SUCCESS:
+                    resolved[key] = local_result
+            self.stats['local_success'] += len(resolved)
+        
+        pending = [key for key in unique if key not in resolved]
+        if use_cache and pending:
+            # Disk and Redis round-trips are blocking calls; keep them off the event loop
+            cached = await asyncio.to_thread(self.cache.get_many, pending)
+            self.stats['cache_hits'] += len(cached)
+            resolved.update(cached)
+            pending = [key for key in pending if key not in resolved]
+        
+        self.logger.info(f"{len(unique) - len(pending)}/{len(unique)} unique addresses resolved "
+                         f"without providers")
+        
+        if pending:
+            resolved.update(await self._schedule_providers(
+                {key: unique[key] for key in pending}, max_concurrent, batch_size if use_cache else 0,
+                google_spill_backlog_seconds
+            ))
+        
+        # Fan results back out to the input order; repeated addresses get their own copy
         results = []
-        semaphore = asyncio.Semaphore(max_concurrent)
+        seen = set()
+        for address in addresses:
+            if not address or not address.strip():
+                results.append(GeocodeResult(status=GeocodeStatus.FAILED))
+                continue
+            key = GeocodeCache.normalize(address)
+            result = resolved[key]
+            results.append(dataclasses.replace(result) if key in seen else result)
+            seen.add(key)
         
-        async def geocode_with_semaphore(addr: str) -> GeocodeResult:
-            async with semaphore:
-                return await self.geocode(addr, use_cache=use_cache)
+        success_count = sum(1 for r in results if r.status == GeocodeStatus.SUCCESS)
+        self.logger.info(f"Batch geocoding complete: {success_count}/{len(addresses)} successful")
         
-        # Process in batches to manage memory and rate limits
-        for i in range(0, len(addresses), batch_size):
-            batch = addresses[i:i + batch_size]
-            
-            # Create tasks for this batch
-            tasks = [geocode_with_semaphore(addr) for addr in batch]
-            
-            # Execute batch
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Handle results and exceptions
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Error geocoding '{batch[j]}': {result}")
-                    results.append(GeocodeResult(status=GeocodeStatus.FAILED))
+        return results
+    
+    async def _schedule_providers(self, addresses: Dict[str, str], max_concurrent: int,
+                                  write_batch_size: int,
+                                  google_spill_backlog_seconds: Optional[float]) -> Dict[str, GeocodeResult]:
+        """
+        Geocode cache misses through a continuous work queue.
+        
+        Each provider runs its own workers (up to its max_concurrent) that await
+        its token bucket, so every provider stays at its rate ceiling with no
+        gaps between batches. Nominatim failures go to Google; Google also takes
+        queued addresses while the Nominatim backlog exceeds
+        google_spill_backlog_seconds. Successes are written to the cache every
+        write_batch_size results (0 = no writes) without pausing the workers.
+        
+        Returns:
+            Results keyed like addresses
+        """
+        queue = deque(addresses)       # Waiting for Nominatim
+        fallback = deque()             # Failed on Nominatim, waiting for Google
+        spilled = set()                # Taken by Google before Nominatim saw them
+        retries = defaultdict(int)     # RATE_LIMITED responses per address
+        max_retries = 2
+        results: Dict[str, GeocodeResult] = {}
+        unwritten: Dict[str, GeocodeResult] = {}
+        writes = []
+        work_changed = asyncio.Event()
+        nominatim_workers = min(max_concurrent, self.nominatim.max_concurrent)
+        active = {'nominatim': nominatim_workers}
+        
+        def write_back():
+            writes.append(asyncio.create_task(asyncio.to_thread(self.cache.set_many, dict(unwritten))))
+            unwritten.clear()
+        
+        def finish(key: str, result: GeocodeResult):
+            results[key] = result
+            if result.status == GeocodeStatus.SUCCESS and write_batch_size:
+                unwritten[addresses[key]] = result
+                if len(unwritten) >= write_batch_size:
+                    write_back()
+            if len(results) % 100 == 0:
+                self.logger.info(f"Completed {len(results)}/{len(addresses)} provider geocodes")
+        
+        def fail(key: str):
+            self.stats['failures'] += 1
+            finish(key, GeocodeResult(status=GeocodeStatus.FAILED))
+        
+        def push(target: deque, key: str):
+            target.append(key)
+            work_changed.set()
+        
+        def spill_to_google() -> bool:
+            return (google_spill_backlog_seconds is not None and
+                    len(queue) / self.nominatim.rate_limiter.rate > google_spill_backlog_seconds)
+        
+        async def call(provider, key: str) -> GeocodeResult:
+            try:
+                return await provider.geocode(addresses[key], wait_for_token=True)
+            except Exception as e:
+                self.logger.error(f"Error geocoding '{addresses[key]}': {e}")
+                return GeocodeResult(status=GeocodeStatus.FAILED)
+        
+        async def nominatim_worker():
+            while queue:
+                key = queue.popleft()
+                result = await call(self.nominatim, key)
+                
+                if result.status == GeocodeStatus.SUCCESS:
+                    self.stats['nominatim_success'] += 1
+                    finish(key, result)
+                elif result.status == GeocodeStatus.RATE_LIMITED and retries[key] < max_retries:
+                    retries[key] += 1
+                    push(queue, key)
+                elif self.google and key not in spilled:
+                    push(fallback, key)
                 else:
-                    results.append(result)
+                    fail(key)
             
-            # Progress logging
-            completed = len(results)
-            self.logger.info(f"Completed {completed}/{len(addresses)} geocodes")
-            
-            # Brief pause between batches to respect rate limits
-            if i + batch_size < len(addresses):
-                await asyncio.sleep(0.5)
+            active['nominatim'] -= 1
+            work_changed.set()
         
-        success_count = sum(1 for r in results if r.status == GeocodeStatus.SUCCESS)
-        self.logger.info(f"Batch geocoding complete: {success_count}/{len(addresses)} successful")
+        async def google_worker():
+            while True:
+                if fallback:
+                    key = fallback.popleft()
+                elif queue and spill_to_google():
+                    key = queue.popleft()
+                    spilled.add(key)
+                elif queue or active['nominatim']:
+                    work_changed.clear()
+                    await work_changed.wait()
+                    continue
+                else:
+                    return
+                
+                result = await call(self.google, key)
+                
+                if result.status == GeocodeStatus.SUCCESS:
+                    self.stats['google_success'] += 1
+                    finish(key, result)
+                elif result.status == GeocodeStatus.RATE_LIMITED and retries[key] < max_retries:
+                    retries[key] += 1
+                    push(fallback, key)
+                elif key in spilled and active['nominatim']:
+                    push(queue, key)  # Nominatim has not tried it yet
+                else:
+                    fail(key)
         
+        workers = [nominatim_worker() for _ in range(nominatim_workers)]
+        if self.google:
+            workers += [google_worker() for _ in range(min(max_concurrent, self.google.max_concurrent))]
+        await asyncio.gather(*workers)
+        
+        if unwritten:
+            write_back()
+        await asyncio.gather(*writes)
         return results
     
     def get_stats(self) -> Dict[str, Any]:
@@ -634,21 +1347,26 @@ class HierarchicalGeocoder:
         return {
             **self.stats,
             'cache_hit_rate': self.stats['cache_hits'] / total,
-            'success_rate': (self.stats['nominatim_success'] + self.stats['google_success']) / total,
+            'local_hit_rate': self.stats['local_success'] / total,
+            'success_rate': (self.stats['local_success'] + self.stats['nominatim_success'] +
+                             self.stats['google_success']) / total,
             'nominatim_circuit_breaker_state': self.nominatim.circuit_breaker.state,
             'google_circuit_breaker_state': self.google.circuit_breaker.state if self.google else None,
-            'google_daily_quota_used': self.google.daily_quota if self.google else 0
+            'google_daily_quota_used': self.google.daily_quota if self.google else 0,
+            'cache_tiers': self.cache.stats()['tiers']
         }
     
     def reset_stats(self):
         """Reset statistics counters."""
         self.stats = {
             'total_requests': 0,
+            'local_success': 0,
             'cache_hits': 0,
             'nominatim_success': 0,
             'google_success': 0,
             'failures': 0
         }
+        self.cache.reset_stats()
 
 # Convenience functions for synchronous usage
 def geocode_address(address: str, google_api_key: Optional[str] = None) -> GeocodeResult:
@@ -656,7 +1374,8 @@ def geocode_address(address: str, google_api_key: Optional[str] = None) -> Geoco
     geocoder = HierarchicalGeocoder(google_api_key=google_api_key)
     
     async def _geocode():
-        return await geocoder.geocode(address)
+        async with geocoder:
+            return await geocoder.geocode(address)
     
     return asyncio.run(_geocode())
 
@@ -667,7 +1386,8 @@ def geocode_addresses(addresses: List[str],
     geocoder = HierarchicalGeocoder(google_api_key=google_api_key)
     
     async def _batch_geocode():
-        return await geocoder.geocode_batch(addresses, batch_size=batch_size)
+        async with geocoder:
+            return await geocoder.geocode_batch(addresses, batch_size=batch_size)
     
     return asyncio.run(_batch_geocode())
 
@@ -715,6 +1435,8 @@ def demo():
                 print(f"  {key}: {value:.3f}")
             else:
                 print(f"  {key}: {value}")
+        
+        await geocoder.close()
     
     asyncio.run(run_demo())
 
@@ -140,7 +140,7 @@ class AddressParser:
         address = re.sub(r'\s+', ' ', address.strip())
         
         # Common cleanup patterns for LA addresses
-        address = re.sub(r'[^\w\s\-\#\.\/]', ' ', address)  # Keep basic punctuation
+        address = re.sub(r'[^\w\s\-\#\.\/,]', ' ', address)  # Keep basic punctuation
         address = re.sub(r'\.{2,}', '.', address)  # Multiple periods to single
         address = re.sub(r'\s+', ' ', address.strip())  # Final whitespace cleanup
         
@@ -255,29 +255,29 @@ class AddressParser:
             remaining = remaining[:city_match.start()].strip()
             result.confidence_score += 0.1
         
-        # 7. Extract street suffix
+        # 7. Extract unit designation (if not already found with #)
+        if not result.unit_number:
+            unit_match = re.search(r'\b(APT|APARTMENT|STE|SUITE|UNIT|BLDG|BUILDING|FL|FLOOR|RM|ROOM)\.?\s+([A-Z0-9\-]+)\s*$', remaining)
+            if unit_match:
+                result.unit_designator = self._standardize_unit_designator(unit_match.group(1))
+                result.unit_number = unit_match.group(2)
+                remaining = remaining[:unit_match.start()].strip()
+                result.confidence_score += 0.1
+        
+        # 8. Extract street suffix
         suffix_match = re.search(r'\b(ST|AVE|BLVD|DR|LN|CT|PL|RD|WAY|CIR|TER|TRL|PKWY|PLZ|STREET|AVENUE|BOULEVARD|DRIVE|LANE|COURT|PLACE|ROAD|CIRCLE|TERRACE|TRAIL|PARKWAY|PLAZA)\.?\s*$', remaining)
         if suffix_match:
             result.street_suffix = self._standardize_street_suffix(suffix_match.group(1))
             remaining = remaining[:suffix_match.start()].strip()
             result.confidence_score += 0.15
         
-        # 8. Extract post-directional
+        # 9. Extract post-directional
         post_dir_match = re.search(r'\b(N|S|E|W|NE|NW|SE|SW|NORTH|SOUTH|EAST|WEST|NORTHEAST|NORTHWEST|SOUTHEAST|SOUTHWEST)\.?\s*$', remaining)
         if post_dir_match:
             result.post_directional = self._standardize_directional(post_dir_match.group(1))
             remaining = remaining[:post_dir_match.start()].strip()
             result.confidence_score += 0.05
         
-        # 9. Extract unit designation (if not already found with #)
-        if not result.unit_number:
-            unit_match = re.search(r'\b(APT|APARTMENT|STE|SUITE|UNIT|BLDG|BUILDING|FL|FLOOR|RM|ROOM)\.?\s+([A-Z0-9\-]+)\s*$', remaining)
-            if unit_match:
-                result.unit_designator = self._standardize_unit_designator(unit_match.group(1))
-                result.unit_number = unit_match.group(2)
-                remaining = remaining[:unit_match.start()].strip()
-                result.confidence_score += 0.1
-        
         # 10. What's left should be street name
         if remaining:
             result.street_name = self._clean_street_name(remaining)
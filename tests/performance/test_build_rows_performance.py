@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Array-Backed BatchProcessor.build_rows
+
+Checks that the columnar implementation returns exactly the DataFrame the
+original dict-per-row implementation produced, and measures throughput and
+peak memory on 100K parcels x 7 templates.
+"""
+
+import random
+import time
+import tracemalloc
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+
+from scoring.batch_processor import BatchProcessor
+from scoring.block_group_stats import build_block_group_stats
+from scoring.zoning_engine import ZoningConstraintsEngine
+
+ALL_TEMPLATES = ['retail', 'office', 'multifamily', 'residential', 'commercial', 'industrial', 'mixed_use']
+
+
+def generate_parcels(count: int, seed: int = 42) -> list:
+    """Generate realistic parcel feature dictionaries"""
+    rng = random.Random(seed)
+    zoning_types = ['R1', 'R2', 'R3', 'C1', 'C2', 'C4', 'CM', 'M1', 'LAX']
+    return [{
+        'apn': f'ROWS-{i:06d}',
+        'zoning': rng.choice(zoning_types),
+        'census_geoid': f"060372{rng.randint(0, 40):03d}0{rng.randint(1, 4)}",
+        'lot_size_sqft': rng.randint(5000, 50000),
+        'transit_score': rng.randint(20, 90),
+        'population_density': rng.randint(1000, 15000),
+        'median_income': rng.randint(30000, 120000),
+        'price_per_sqft': rng.randint(200, 1200),
+        'crime_factor': rng.uniform(0.3, 2.0),
+    } for i in range(count)]
+
+
+def reference_build_rows(processor: BatchProcessor, parcels: list, templates: list,
+                         census_block_group: str = None) -> pd.DataFrame:
+    """Original dict-per-row implementation, kept here as the parity oracle"""
+    per_parcel_stats = census_block_group is None and bool(processor.stats_table)
+    if census_block_group is None:
+        census_block_group = processor.get_census_block_group(parcels[0])
+    z_score_stats = None if per_parcel_stats else processor.calculate_z_scores(parcels, census_block_group)
+
+    rows = []
+    for parcel_idx, parcel in enumerate(parcels):
+        zoning = parcel.get('zoning', 'R1')
+        parcel_block_group = census_block_group
+        if per_parcel_stats:
+            parcel_block_group, z_score_stats = processor.stats_table.lookup(parcel)
+        base_row = {
+            'parcel_id': parcel.get('apn', f'parcel_{parcel_idx}'),
+            'zoning': zoning,
+            'census_block_group': parcel_block_group
+        }
+        for feature in processor.feature_columns:
+            raw_value = parcel.get(feature, 0)
+            stats = z_score_stats.get(feature, {'mean': 0, 'std': 1})
+            base_row[feature] = raw_value
+            base_row[f'{feature}_zscore'] = (raw_value - stats['mean']) / stats['std']
+        for template in templates:
+            template_row = base_row.copy()
+            template_row['template'] = template
+            template_row['template_zoning_compatible'] = processor.zoning_engine.is_compatible(template, zoning)
+            template_row['template_score_cap'] = processor.zoning_engine.get_score_cap(template, zoning)
+            template_row['template_plausibility_floor'] = processor.zoning_engine.get_plausibility_floor(template)
+            rows.append(template_row)
+    return pd.DataFrame(rows)
+
+
+class TestBuildRowsPerformance(unittest.TestCase):
+    """Parity and throughput for the columnar build_rows"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.zoning_engine = ZoningConstraintsEngine()
+        cls.parcels = generate_parcels(100000)
+        cls.stats_table = build_block_group_stats([pd.DataFrame(cls.parcels)])
+    
+    def test_parity_with_dict_implementation(self):
+        """Same schema, dtypes and values as the dict-per-row implementation"""
+        sample = self.parcels[:500]
+        for stats_table in (None, self.stats_table):
+            processor = BatchProcessor(self.zoning_engine, stats_table=stats_table)
+            for templates in (ALL_TEMPLATES, ['retail', 'industrial']):
+                pd.testing.assert_frame_equal(
+                    processor.build_rows(sample, templates),
+                    reference_build_rows(processor, sample, templates)
+                )
+        
+        processor = BatchProcessor(self.zoning_engine, stats_table=self.stats_table)
+        pd.testing.assert_frame_equal(
+            processor.build_rows(sample, ALL_TEMPLATES, 'CBG_34.05_-118.25'),
+            reference_build_rows(processor, sample, ALL_TEMPLATES, 'CBG_34.05_-118.25')
+        )
+    
+    def test_100k_parcels_throughput_and_memory(self):
+        """100K parcels x 7 templates: columnar vs dict-per-row"""
+        processor = BatchProcessor(self.zoning_engine, stats_table=self.stats_table)
+        
+        def measure(build):
+            tracemalloc.start()
+            start = time.perf_counter()
+            frame = build()
+            elapsed = time.perf_counter() - start
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            return frame, elapsed, peak_mb
+        
+        frame, array_time, array_peak = measure(lambda: processor.build_rows(self.parcels, ALL_TEMPLATES))
+        _, dict_time, dict_peak = measure(lambda: reference_build_rows(processor, self.parcels, ALL_TEMPLATES))
+        
+        print(f"\n📊 build_rows on {len(self.parcels):,} parcels x {len(ALL_TEMPLATES)} templates "
+              f"({len(frame):,} rows)")
+        print(f"   Columnar: {array_time:.2f}s, peak {array_peak:.0f} MB")
+        print(f"   Dict rows: {dict_time:.2f}s, peak {dict_peak:.0f} MB")
+        print(f"   Speedup: {dict_time / array_time:.1f}x, memory {dict_peak / array_peak:.1f}x lower")
+        
+        self.assertEqual(len(frame), len(self.parcels) * len(ALL_TEMPLATES))
+        self.assertLess(array_time, dict_time)
+        self.assertLess(array_peak, dict_peak)
+
+
+if __name__ == '__main__':
+    unittest.main()
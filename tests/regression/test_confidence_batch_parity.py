@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Parity tests: ConfidenceEngine.calculate_confidence_batch vs calculate_overall_confidence
+
+Every (parcel, template) confidence and component from the batch path must equal
+the scalar path exactly, including parcels with missing or zero-valued fields.
+"""
+
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from scoring.confidence_engine import ConfidenceEngine
+from scoring.zoning_engine import ZoningConstraintsEngine
+
+TEMPLATES = ['multifamily', 'commercial', 'residential', 'industrial', 'retail', 'mixed_use', 'office']
+ZONINGS = ['R1', 'R3', 'RD1.5', 'C2', 'C4', 'CM', 'M1', 'M2', 'LAX', 'PF', 'C2-1VL', '']
+
+
+def synthetic_parcels(count: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    parcels = []
+    for i in range(count):
+        parcel = {
+            'apn': f'CONF-{i:05d}',
+            'zoning': rng.choice(ZONINGS),
+            'lot_size_sqft': rng.choice([0, 2500, 7500.0, 12000, 45000]),
+            'transit_score': rng.choice([0, 35, 55.5, 80, 95]),
+            'population_density': rng.choice([800, 6000, 12500.0]),
+            'median_income': rng.choice([32000, 54999, 55000, 80000, 100000, 150000]),
+            'price_per_sqft': rng.choice([250, 399.99, 400, 600, 900, 1200]),
+        }
+        for field in list(parcel)[1:]:
+            if rng.random() < 0.1:
+                del parcel[field]  # Genuinely missing
+        parcels.append(parcel)
+    return parcels
+
+
+class TestConfidenceBatchParity(unittest.TestCase):
+    """Batch confidence equals the scalar engine for every cell"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = ConfidenceEngine()
+        cls.zoning_engine = ZoningConstraintsEngine()
+        cls.parcels = synthetic_parcels(400)
+        rng = random.Random(5)
+        cls.scores = np.array([
+            [rng.choice([float('nan'), round(rng.uniform(0, 10), 1)]) for _ in TEMPLATES]
+            for _ in cls.parcels
+        ])
+        cls.frame = pd.DataFrame(cls.parcels)
+        cls.zoning = [parcel.get('zoning', 'R1') for parcel in cls.parcels]
+    
+    def test_matches_scalar_path(self):
+        """Confidence, components and levels match calculate_overall_confidence"""
+        batch = self.engine.calculate_confidence_batch(
+            self.scores, self.frame, self.zoning, TEMPLATES, self.zoning_engine
+        )
+        
+        compared = 0
+        for i, parcel in enumerate(self.parcels):
+            row_scores = sorted((s for s in self.scores[i] if not math.isnan(s)), reverse=True)
+            secondary = row_scores[1] if len(row_scores) > 1 else 0.0
+            self.assertEqual(batch['secondary_score'][i], secondary)
+            
+            for j, template in enumerate(TEMPLATES):
+                if math.isnan(self.scores[i, j]):
+                    self.assertTrue(math.isnan(batch['confidence'][i, j]))
+                    continue
+                
+                confidence, analysis = self.engine.calculate_overall_confidence(
+                    self.scores[i, j], secondary, parcel, template, self.zoning[i], self.zoning_engine
+                )
+                components = analysis['components']
+                self.assertEqual(batch['confidence'][i, j], confidence, f"{parcel['apn']} {template}")
+                self.assertEqual(round(batch['base_confidence'][i, j], 3), analysis['base_confidence'])
+                self.assertEqual(round(batch['score_margin'][i, j], 3), components['score_margin']['confidence'])
+                self.assertEqual(round(batch['data_coverage'][i, j], 3), components['data_coverage']['confidence'])
+                self.assertEqual(round(batch['zoning_compatibility'][i, j], 3),
+                                 components['zoning_compatibility']['confidence'])
+                self.assertEqual(round(batch['score_quality'][i, j], 3), components['score_quality']['confidence'])
+                self.assertEqual(batch['confidence_level'][i, j], analysis['confidence_level'])
+                self.assertEqual(batch['neighborhood_tier'][i],
+                                 analysis['geographic_adjustment']['neighborhood_tier'])
+                compared += 1
+        
+        self.assertGreater(compared, 1000)
+    
+    def test_explicit_secondary_scores(self):
+        """Caller-supplied secondary scores are used as-is"""
+        secondary = np.full(len(self.parcels), 5.0)
+        batch = self.engine.calculate_confidence_batch(
+            self.scores, self.frame, self.zoning, TEMPLATES, self.zoning_engine, secondary
+        )
+        i, j = np.argwhere(~np.isnan(self.scores))[0]
+        confidence, _ = self.engine.calculate_overall_confidence(
+            self.scores[i, j], 5.0, self.parcels[i], TEMPLATES[j], self.zoning[i], self.zoning_engine
+        )
+        self.assertEqual(batch['confidence'][i, j], confidence)
+    
+    def test_shape_mismatch_rejected(self):
+        with self.assertRaises(ValueError):
+            self.engine.calculate_confidence_batch(
+                self.scores[:, :3], self.frame, self.zoning, TEMPLATES, self.zoning_engine
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
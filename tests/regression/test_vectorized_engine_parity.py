@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Parity Tests for the Vectorized Scoring Engine
+
+Ensures calculate_scores_array reproduces calculate_score exactly for every
+parcel fixture used by the scoring regression suite, plus a seeded set of
+synthetic parcels that exercise every penalty and crime branch.
+"""
+
+import ast
+import random
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.engine import calculate_score
+from scoring.vectorized_engine import calculate_scores_array, scores_frame, ALL_TEMPLATES
+
+REGRESSION_FIXTURES = Path(__file__).parent / 'test_scoring_regression.py'
+
+
+def load_regression_fixtures():
+    """Collect the literal parcel dicts defined in the scoring regression suite"""
+    tree = ast.parse(REGRESSION_FIXTURES.read_text())
+    fixtures = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Dict):
+            try:
+                value = ast.literal_eval(node)
+            except ValueError:
+                continue
+            if isinstance(value, dict) and 'zoning' in value:
+                fixtures.append(value)
+    return fixtures
+
+
+def synthetic_parcels(count=400, seed=1337):
+    """Seeded parcels covering zoning variants, penalties and missing fields"""
+    rng = random.Random(seed)
+    zonings = ['R1-1', 'R2', 'RD1.5', 'R3-1', 'R4P', 'R5', 'RAS3', 'RAS4', 'RE40', 'RS', 'RA',
+               'C1', 'C1.5', 'C2-1VL', 'C4', 'CM', 'CR', 'P', 'LAX', 'M1', 'M2', 'M3', 'MR1',
+               'A1', 'OS', 'PF', 'UNKNOWN']
+    parcels = []
+    for i in range(count):
+        parcel = {
+            'apn': f'SYN{i:04d}',
+            'zoning': rng.choice(zonings),
+            'lot_size_sqft': rng.choice([1000, 4999, 5000, 7500, 9999.5, 10000, 19999, 20000, 45000]),
+            'transit_score': rng.uniform(0, 120),
+            'population_density': rng.choice([800, 5001, 7501, 8000, 10001, 16000]),
+            'median_income': rng.choice([25000, 30001, 45001, 60001, 75001, 80001, 90001, 120001]),
+            'crime_factor': rng.choice([0.3, 0.5, 0.69, 0.8, 0.81, 1.21, 1.51, 1.81, 2.01, 2.5]),
+            'price_per_sqft': rng.uniform(100, 1200),
+            'flood_risk': rng.random() < 0.2,
+            'toxic_sites_nearby': rng.choice([0, 0, 1, 3]),
+            'superfund_site_nearby': rng.random() < 0.1,
+            'airport_noise_level': rng.choice([40, 45, 66, 70, 95]),
+            'near_airport': rng.random() < 0.2,
+            'homeless_encampments_nearby': rng.choice([0, 2, 3, 6]),
+            'homeless_population_density': rng.choice([0, 25, 51, 200]),
+            'freeway_distance_ft': rng.choice([300, 500, 999, 2000]),
+            'industrial_facilities_nearby': rng.choice([0, 1, 4, 8]),
+            'air_quality_index': rng.choice([45, 75, 101, 160]),
+            'seismic_risk_level': rng.choice(['low', 'moderate', 'high', 'very_high']),
+            'utility_deficiencies': rng.choice([[], ['water'], ['water', 'sewer', 'power', 'gas']]),
+        }
+        if rng.random() < 0.3:
+            parcel['highway_access'] = rng.uniform(20, 95)
+        for optional in ['crime_factor', 'price_per_sqft', 'population_density', 'seismic_risk_level']:
+            if rng.random() < 0.1:
+                del parcel[optional]
+        parcels.append(parcel)
+    return parcels
+
+
+class TestVectorizedEngineParity(unittest.TestCase):
+    """Vectorized scores must equal scalar calculate_score bit for bit"""
+    
+    def assert_parity(self, parcels):
+        result = calculate_scores_array(parcels, ALL_TEMPLATES)
+        self.assertEqual(result['score'].shape, (len(parcels), len(ALL_TEMPLATES)))
+        
+        for i, parcel in enumerate(parcels):
+            for j, template in enumerate(ALL_TEMPLATES):
+                expected = calculate_score(parcel, template)
+                label = f"{parcel.get('apn')} / {template}"
+                self.assertEqual(result['score'][i, j], expected['score'], label)
+                self.assertEqual(result['base_score'][i, j], expected['base_score'], label)
+                self.assertEqual(result['total_penalties'][i, j], expected['total_penalties'], label)
+                for component, value in expected['component_scores'].items():
+                    self.assertEqual(result['components'][component][i, j], value, f"{label} {component}")
+                for penalty, matrix in result['penalties'].items():
+                    self.assertEqual(matrix[i, j], expected['penalties'].get(penalty, 0.0), f"{label} {penalty}")
+    
+    def test_regression_fixture_parity(self):
+        """Every regression-suite parcel scores identically"""
+        fixtures = load_regression_fixtures()
+        self.assertGreater(len(fixtures), 10)
+        self.assert_parity(fixtures)
+    
+    def test_synthetic_parcel_parity(self):
+        """Seeded synthetic parcels score identically across all branches"""
+        self.assert_parity(synthetic_parcels())
+    
+    def test_scores_frame_layout(self):
+        """Long-format frame has one row per parcel-template pair"""
+        parcels = synthetic_parcels(count=5)
+        frame = scores_frame(calculate_scores_array(parcels, ['retail', 'office']))
+        self.assertEqual(len(frame), 10)
+        self.assertEqual(list(frame['template'][:2]), ['retail', 'office'])
+        self.assertEqual(frame['apn'][0], 'SYN0000')
+
+
+if __name__ == '__main__':
+    unittest.main()
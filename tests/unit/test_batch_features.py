@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for vectorized batch feature extraction
+
+Tests that get_feature_matrix_batch matches CSVFeatureMatrix.get_feature_matrix
+row for row, from both the CSV and the columnar store.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from features.csv_feature_matrix import CSVFeatureMatrix
+from features import columnar_store
+from features.batch_features import (
+    get_feature_matrix_batch, iter_feature_matrix_batches, feature_records, parse_numeric_series
+)
+
+import pandas as pd
+
+
+class TestBatchFeatures(unittest.TestCase):
+    """Test suite for batch feature extraction"""
+    
+    def setUp(self):
+        """Write a parcel CSV fixture with awkward formats"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'parcels.csv')
+        header = ['apn', 'site_address', 'zoning_code', 'lot_parcel_area', 'zip_code',
+                  'building_square_footage', 'building_year_built', 'divTab4_assessed_improvement_val',
+                  'divTab7_flood_zone', 'divTab7_airport_hazard', 'divTab3_hillside_area']
+        self.rows = [
+            ['4306026007', '123 MAIN ST', 'R3-1', '7,500.0 (sq ft)', '90035', '3200', '1962', '$950,000', '', 'No', ''],
+            ['5306050014', '45 BROADWAY', 'C2-1', '12000', '90028', '', 'n/a', '', 'Zone AE', 'Yes', 'Yes'],
+            ['2031007060', ' 9 ELM ST ', 'R1-1', '', '91303', '1800', '', '400000', 'Outside Flood Zone', '', ''],
+            ['2031007061', '', '', 'about 0.5 (ac)', '90210', 'unknown', '1990.7', 'N/A', '', '', ''],
+            ['4306026007', 'DUPLICATE', 'M1-1', '1', '90001', '1', '1', '1', '', '', ''],
+        ]
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(self.rows)
+        self.apns = ['2031007060', '4306026007', 'MISSING001', '5306050014', '2031007061']
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def _assert_parity(self, frame):
+        matrix = CSVFeatureMatrix(self.csv_path)
+        self.assertEqual(list(frame['apn']), self.apns)
+        for record in feature_records(frame):
+            expected = matrix.get_feature_matrix(record['apn'])
+            self.assertEqual(set(record), set(expected), record['apn'])
+            for key, value in expected.items():
+                self.assertEqual(record[key], value, f"{record['apn']}.{key}")
+    
+    def test_csv_batch_matches_scalar(self):
+        """CSV single-pass batch equals per-APN extraction"""
+        frame = get_feature_matrix_batch(self.apns, csv_path=self.csv_path)
+        self._assert_parity(frame)
+        self.assertEqual(list(frame['found']), [True, True, False, True, True])
+    
+    @unittest.skipUnless(columnar_store.HAS_PYARROW, "pyarrow not installed")
+    def test_store_batch_matches_scalar(self):
+        """Columnar-store batch equals per-APN extraction"""
+        columnar_store.build_columnar_store(self.csv_path)
+        frame = get_feature_matrix_batch(self.apns, csv_path=self.csv_path)
+        self._assert_parity(frame)
+    
+    def test_many_apns(self):
+        """Thousands of APNs (found and missing) come back in request order in linear time"""
+        csv_path = os.path.join(self.tmp_dir, 'many.csv')
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['apn', 'site_address', 'zoning_code', 'lot_parcel_area', 'zip_code'])
+            writer.writerows([f'{i:010d}', f'{i} MAIN ST', 'R3-1', '7500', '90035'] for i in range(4000))
+        apns = [f'{i:010d}' for i in range(5000)][::-1]
+        
+        start = time.time()
+        frame = get_feature_matrix_batch(apns, csv_path=csv_path)
+        elapsed = time.time() - start
+        
+        self.assertEqual(list(frame['apn']), apns)
+        self.assertEqual(int(frame['found'].sum()), 4000)
+        self.assertLess(elapsed, 10.0)
+    
+    def test_iterator_streams_all_parcels(self):
+        """Iterator without APNs yields every distinct parcel once"""
+        frames = list(iter_feature_matrix_batches(None, chunk_size=2, csv_path=self.csv_path))
+        apns = [apn for frame in frames for apn in frame['apn']]
+        self.assertEqual(sorted(apns), sorted({row[0] for row in self.rows}))
+    
+    def test_parse_numeric_series(self):
+        """Vectorized numeric parsing matches the scalar parser"""
+        values = ['4,648.0 (sq ft)', '$1,200', '', 'null', 'abc', '12 34', '0.25 (ac)', '-7']
+        parsed = parse_numeric_series(pd.Series(values), 9.0)
+        for value, result in zip(values, parsed):
+            self.assertEqual(result, CSVFeatureMatrix.parse_numeric(value, 9.0), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
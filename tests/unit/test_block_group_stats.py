@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Census Geography Z-Score Statistics
+"""
+
+import os
+import random
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+
+from scoring.block_group_stats import (
+    BlockGroupStatsTable, build_block_group_stats, geography_keys, normalize_tract_geoid,
+    Z_SCORE_FEATURES, REGIONAL_DEFAULTS
+)
+from scoring.batch_processor import BatchProcessor
+from scoring.zoning_engine import ZoningConstraintsEngine
+
+
+def make_parcels(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    parcels = []
+    for i in range(count):
+        parcels.append({
+            'apn': f'BG-{i:05d}',
+            'zoning': rng.choice(['R1', 'R3', 'C2', 'M1']),
+            'census_geoid': f"20{rng.randint(1, 3):02d}.{rng.choice(['00', '01'])}000000",
+            'lot_size_sqft': float(rng.randint(3000, 40000)),
+            'transit_score': float(rng.randint(20, 95)),
+            'population_density': float(rng.randint(1000, 15000)),
+            'median_income': float(rng.randint(30000, 150000)),
+            'price_per_sqft': float(rng.randint(200, 1200)),
+            'crime_factor': rng.uniform(0.3, 2.0),
+        })
+    return parcels
+
+
+class TestBlockGroupStats(unittest.TestCase):
+    """Test full-universe statistics, incremental updates and persistence"""
+    
+    def setUp(self):
+        self.parcels = make_parcels(300)
+        self.frame = pd.DataFrame(self.parcels)
+        self.table = build_block_group_stats([self.frame.iloc[:120], self.frame.iloc[120:]])
+    
+    def assert_tables_match(self, expected: BlockGroupStatsTable, actual: BlockGroupStatsTable):
+        self.assertEqual(set(expected._accumulators), set(actual._accumulators))
+        for level, geoid in expected._accumulators:
+            for feature, stats in expected.get_stats(level, geoid).items():
+                other = actual.get_stats(level, geoid)[feature]
+                self.assertEqual(stats['count'], other['count'])
+                self.assertAlmostEqual(stats['mean'], other['mean'], places=6)
+                self.assertAlmostEqual(stats['std'], other['std'], places=4)
+    
+    def test_geography_keys(self):
+        """ZIMAS tract numbers normalize to 06037 + 6-digit tract; block groups need their own source"""
+        self.assertEqual(normalize_tract_geoid('1380.00000000'), '06037138000')
+        self.assertEqual(normalize_tract_geoid('2011.02'), '06037201102')
+        self.assertEqual(normalize_tract_geoid(2011.1), '06037201110')
+        self.assertEqual(normalize_tract_geoid('06037201100'), '06037201100')
+        self.assertIsNone(normalize_tract_geoid('06037000000'))  # Feature default
+        self.assertIsNone(normalize_tract_geoid('unknown'))
+        
+        self.assertEqual(geography_keys({'census_geoid': '1380.00000000'}), (None, '06037138000'))
+        self.assertEqual(geography_keys({'census_geoid': '060372011002'}), (None, '06037201100'))
+        self.assertEqual(geography_keys({'census_block_group': '060372011002'}), ('060372011002', '06037201100'))
+        self.assertEqual(geography_keys({}), (None, None))
+    
+    def test_chunked_build_matches_groupby(self):
+        """Statistics equal a pandas groupby over the whole universe"""
+        grouped = self.frame.groupby(self.frame['census_geoid'].map(normalize_tract_geoid))
+        self.assertEqual({key for key in self.table._accumulators}, {('tract', tract) for tract in grouped.groups})
+        for tract, group in grouped:
+            stats = self.table.get_stats('tract', tract)
+            for feature in Z_SCORE_FEATURES:
+                self.assertEqual(stats[feature]['count'], len(group))
+                self.assertAlmostEqual(stats[feature]['mean'], group[feature].mean(), places=6)
+                self.assertAlmostEqual(stats[feature]['std'], group[feature].std(ddof=1), places=4)
+    
+    def test_block_group_column_matches_parcel_adds(self):
+        """An explicit census_block_group column adds block-group entries, same as per-parcel adds"""
+        parcels = [dict(parcel, census_geoid=None,
+                        census_block_group=f"0603720{i % 3 + 1:02d}00{i % 2 + 1}")
+                   for i, parcel in enumerate(self.parcels[:40])]
+        table = BlockGroupStatsTable()
+        for parcel in parcels:
+            table.add_parcel(parcel)
+        
+        built = build_block_group_stats([pd.DataFrame(parcels)])
+        self.assert_tables_match(table, built)
+        levels = [level for level, _ in built._accumulators]
+        self.assertEqual((levels.count('block_group'), levels.count('tract')), (6, 3))
+    
+    def test_incremental_update_matches_rebuild(self):
+        """Changing, adding and removing parcels equals rebuilding from scratch"""
+        changed = [dict(parcel) for parcel in self.parcels]
+        changed[5]['median_income'] = 999999.0
+        changed[6]['census_geoid'] = '2099.01000000'
+        new_parcel = dict(changed[7], apn='BG-NEW', lot_size_sqft=12345.0)
+        
+        for old, new in ((self.parcels[5], changed[5]), (self.parcels[6], changed[6]),
+                         (None, new_parcel), (self.parcels[9], None)):
+            self.table.update_parcel(old, new)
+        
+        expected_parcels = changed[:9] + changed[10:] + [new_parcel]
+        self.assert_tables_match(build_block_group_stats([pd.DataFrame(expected_parcels)]), self.table)
+    
+    def test_save_and_load_roundtrip(self):
+        """Persisted statistics reload identically; incremental saves write only changes"""
+        db_path = os.path.join(tempfile.mkdtemp(), 'stats.db')
+        self.assertEqual(self.table.save(db_path, full=True), len(self.table))
+        self.assert_tables_match(self.table, BlockGroupStatsTable.load(db_path))
+        
+        changed = dict(self.parcels[0], price_per_sqft=5000.0)
+        self.table.update_parcel(self.parcels[0], changed)
+        self.assertEqual(self.table.save(db_path), 1)  # Its tract
+        self.assert_tables_match(self.table, BlockGroupStatsTable.load(db_path))
+    
+    def test_lookup_falls_back_to_tract_then_regional(self):
+        """Sparse block groups use tract statistics; unknown geographies use defaults"""
+        table = BlockGroupStatsTable(min_count=2)
+        table.add_parcel(dict(self.parcels[0], census_block_group='060372011001', census_geoid=None))
+        table.add_parcel(dict(self.parcels[1], census_block_group='060372011002', census_geoid=None))
+        table.add_parcel(dict(self.parcels[2], census_block_group='060372011002', census_geoid=None))
+        
+        label, _ = table.lookup({'census_block_group': '060372011001'})
+        self.assertEqual(label, 'TRACT_06037201100')
+        label, _ = table.lookup({'census_block_group': '060372011002'})
+        self.assertEqual(label, 'BG_060372011002')
+        label, _ = table.lookup({'census_geoid': '2011.00000000'})
+        self.assertEqual(label, 'TRACT_06037201100')
+        
+        label, stats = table.lookup({'census_geoid': '9999.99'})
+        self.assertEqual(label, 'REGIONAL')
+        self.assertEqual(stats['median_income']['mean'], REGIONAL_DEFAULTS['median_income']['mean'])
+
+
+class TestBatchProcessorStats(unittest.TestCase):
+    """Test build_rows normalization with and without a statistics table"""
+    
+    def setUp(self):
+        self.parcels = make_parcels(200)
+        self.table = build_block_group_stats([pd.DataFrame(self.parcels)])
+        self.processor = BatchProcessor(ZoningConstraintsEngine(), stats_table=self.table)
+    
+    def test_zscores_independent_of_batch_composition(self):
+        """A parcel's z-scores are the same whatever batch it is built in"""
+        target = self.parcels[0]
+        alone = self.processor.build_rows([target], ['retail'])
+        mixed = self.processor.build_rows(self.parcels[:50], ['retail'])
+        
+        row_alone = alone.iloc[0]
+        row_mixed = mixed[mixed['parcel_id'] == target['apn']].iloc[0]
+        label, stats = self.table.lookup(target)
+        self.assertEqual(row_alone['census_block_group'], label)
+        for feature in Z_SCORE_FEATURES:
+            self.assertAlmostEqual(row_alone[f'{feature}_zscore'], row_mixed[f'{feature}_zscore'])
+            expected = (target[feature] - stats[feature]['mean']) / stats[feature]['std']
+            self.assertAlmostEqual(row_alone[f'{feature}_zscore'], expected)
+    
+    def test_batch_fallback_not_cached(self):
+        """Without a table, batch-derived statistics do not leak into later calls"""
+        processor = BatchProcessor(ZoningConstraintsEngine())
+        first = processor.calculate_z_scores(self.parcels[:10], 'CBG_34.05_-118.25')
+        second = processor.calculate_z_scores(self.parcels[10:20], 'CBG_34.05_-118.25')
+        self.assertNotEqual(first['median_income']['mean'], second['median_income']['mean'])
+        self.assertEqual(len(processor.census_block_cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
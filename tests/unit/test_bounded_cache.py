@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Bounded In-Process Cache
+"""
+
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.bounded_cache import BoundedCache
+from scoring.batch_processor import BatchProcessor
+from scoring.zoning_lookup import ZoningLookupTable
+from scoring.zoning_engine import ZoningConstraintsEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestBoundedCache(unittest.TestCase):
+    """Test eviction, expiry and counters"""
+    
+    def test_lru_eviction_by_entries(self):
+        """The least recently used entry is evicted first"""
+        cache = BoundedCache(max_entries=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)  # 'b' is now least recent
+        cache['c'] = 3
+        
+        self.assertNotIn('b', cache)
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+        self.assertEqual(cache.stats()['evictions'], 1)
+    
+    def test_eviction_by_bytes(self):
+        """Total size stays within max_bytes; oversized values are not stored"""
+        cache = BoundedCache(max_entries=None, max_bytes=100, sizeof=len)
+        cache['a'] = 'x' * 40
+        cache['b'] = 'y' * 40
+        cache['c'] = 'z' * 40
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('a', cache)
+        self.assertLessEqual(cache.stats()['bytes'], 100)
+        
+        cache['huge'] = 'h' * 500
+        self.assertNotIn('huge', cache)
+        self.assertEqual(len(cache), 2)
+    
+    def test_ttl_expiry(self):
+        """Entries expire after their TTL and count as misses"""
+        clock = FakeClock()
+        cache = BoundedCache(ttl_seconds=10, clock=clock)
+        cache['a'] = 1
+        cache.set('b', 2, ttl_seconds=100)
+        
+        clock.now = 11
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expirations']), (1, 1, 1))
+        with self.assertRaises(KeyError):
+            cache['a']
+    
+    def test_get_or_set(self):
+        """The factory runs only on a miss"""
+        cache = BoundedCache()
+        calls = []
+        for _ in range(3):
+            cache.get_or_set('k', lambda: calls.append(1) or 'value')
+        self.assertEqual(len(calls), 1)
+        self.assertAlmostEqual(cache.stats()['hit_rate'], 2 / 3)
+
+
+class TestCacheIntegration(unittest.TestCase):
+    """Test the caches that use BoundedCache"""
+    
+    def test_census_block_cache_bounded(self):
+        """BatchProcessor keeps at most cache_max_entries block groups"""
+        processor = BatchProcessor(ZoningConstraintsEngine(), cache_max_entries=2)
+        for i in range(5):
+            processor.census_block_cache[f'CBG_{i}'] = {'lot_size_sqft': {'mean': 1, 'std': 1, 'count': 2}}
+        
+        stats = processor.cache_stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 3)
+        processor.clear_cache()
+        self.assertEqual(len(processor.census_block_cache), 0)
+    
+    def test_dynamic_zoning_profiles_bounded(self):
+        """Codes outside the configuration are bounded; configured codes are pinned"""
+        table = ZoningLookupTable(score_caps={'retail': {'C2': 9.0}}, max_dynamic_codes=3)
+        for i in range(10):
+            table.score_cap('retail', f'X{i}')
+        
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.score_cap('retail', 'C2'), 9.0)
+        self.assertEqual(table.cache_stats()['evictions'], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the columnar (Arrow IPC) parcel feature store
+
+Tests that features served from the memory-mapped store are identical to the
+CSV extraction path and that stale stores are rejected.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from features.csv_feature_matrix import CSVFeatureMatrix
+from features import columnar_store
+from features.columnar_store import build_columnar_store, open_feature_store, ColumnarFeatureMatrix
+
+
+@unittest.skipUnless(columnar_store.HAS_PYARROW, "pyarrow not installed")
+class TestColumnarStore(unittest.TestCase):
+    """Test suite for the columnar parcel store"""
+    
+    def setUp(self):
+        """Write a small parcel CSV fixture and convert it"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'parcels.csv')
+        header = ['apn', 'site_address', 'zoning_code', 'lot_parcel_area', 'zip_code',
+                  'building_square_footage', 'divTab4_assessed_improvement_val',
+                  'divTab7_flood_zone', 'divTab7_airport_hazard', 'divTab7_oil_well_adjacency']
+        self.rows = [
+            ['4306026007', '123 MAIN ST', 'R3-1', '7,500.0 (sq ft)', '90035', '3200', '$950,000', '', 'No', ''],
+            ['5306050014', '45 BROADWAY', 'C2-1', '12000', '90028', '', '', 'Zone AE', 'Yes', 'Within 500 ft'],
+            ['2031007060', '9 ELM ST', 'R1-1', '', '91303', '1800', '400000', 'Outside Flood Zone', '', ''],
+        ]
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(self.rows)
+        self.store_path = build_columnar_store(self.csv_path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def test_store_matches_csv_features(self):
+        """Every APN produces identical features from CSV and store"""
+        csv_matrix = CSVFeatureMatrix(self.csv_path)
+        store = ColumnarFeatureMatrix(self.store_path, self.csv_path)
+        for row in self.rows:
+            self.assertEqual(store.get_feature_matrix(row[0]), csv_matrix.get_feature_matrix(row[0]))
+    
+    def test_numeric_columns_are_typed(self):
+        """Numeric fields are stored already parsed"""
+        store = ColumnarFeatureMatrix(self.store_path, self.csv_path)
+        self.assertEqual(str(store.table.schema.field('lot_size_sqft').type), 'double')
+        self.assertEqual(str(store.table.schema.field('year_built').type), 'int32')
+        self.assertEqual(store.get_base_features('4306026007')['assessed_value'], 950000.0)
+    
+    def test_unknown_apn_uses_defaults(self):
+        """Missing APNs fall back to default features like the CSV path"""
+        store = ColumnarFeatureMatrix(self.store_path, self.csv_path)
+        self.assertEqual(store.get_feature_matrix('0000000000')['zoning'], 'R3')
+    
+    def test_inherited_raw_row_access(self):
+        """Inherited CSV row lookups work from the store, with or without a CSV"""
+        store = ColumnarFeatureMatrix(self.store_path, self.csv_path)
+        self.assertEqual(set(store.ensure_apn_index()), {row[0] for row in self.rows})
+        row = store.find_apn_data('5306050014')
+        self.assertEqual(store.get_column_value(row, 'site_address'), '45 BROADWAY')
+        
+        store_only = ColumnarFeatureMatrix(self.store_path)
+        self.assertIsNone(store_only.find_apn_data('5306050014'))
+        self.assertEqual(store_only.ensure_apn_index(), {})
+        self.assertEqual(store_only.get_feature_matrix('5306050014')['zoning'], 'C2-1')
+    
+    def test_stale_store_rejected(self):
+        """open_feature_store ignores a store built from an older CSV"""
+        self.assertIsNotNone(open_feature_store(self.csv_path))
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(['9999999999', '1 NEW ST', 'M1-1', '20000', '90021', '', '', '', '', ''])
+        self.assertIsNone(open_feature_store(self.csv_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the SQLite Connection Manager
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from db.connection_manager import (
+    SQLiteConnectionManager, AsyncSQLiteConnectionManager, get_connection_manager
+)
+from db.database_manager import DealGenieDatabase
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+
+
+class TestSQLiteConnectionManager(unittest.TestCase):
+    """Test connection reuse, configuration and release semantics"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'pool.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("INSERT INTO items (name) VALUES ('first')")
+        conn.commit()
+        conn.close()
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def manager(self, **options) -> SQLiteConnectionManager:
+        manager = SQLiteConnectionManager(self.db_path, **options)
+        self.managers.append(manager)
+        return manager
+
+    def test_reuses_connection_per_thread(self):
+        manager = self.manager()
+        first = manager.connection()
+        first.close()
+        self.assertIs(manager.connection(), first)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(manager.connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], first)
+        self.assertEqual(manager.stats()['connections_opened'], 2)
+        self.assertEqual(manager.stats()['connections_reused'], 1)
+
+    def test_pragmas_applied_once(self):
+        manager = self.manager(pragmas={'synchronous': 'NORMAL'}, row_factory=sqlite3.Row)
+        conn = manager.connection()
+        self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+        self.assertEqual(conn.execute("SELECT name FROM items").fetchone()['name'], 'first')
+
+    def test_release_rolls_back_uncommitted_writes(self):
+        manager = self.manager()
+        conn = manager.connection()
+        conn.execute("INSERT INTO items (name) VALUES ('uncommitted')")
+        conn.close()
+        self.assertEqual(manager.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0], 1)
+
+        with manager.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('committed')")
+        self.assertEqual(manager.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0], 2)
+
+    def test_nested_release_keeps_open_transaction(self):
+        manager = self.manager()
+        outer = manager.connection()
+        outer.execute("INSERT INTO items (name) VALUES ('pending')")
+        inner = manager.connection()
+        self.assertIs(inner, outer)
+        inner.close()
+        self.assertTrue(outer.in_transaction)
+        outer.close()
+        self.assertEqual(manager.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0], 1)
+
+    def test_read_only_rejects_writes(self):
+        conn = self.manager(read_only=True).connection()
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 1)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO items (name) VALUES ('blocked')")
+
+    def test_connections_of_exited_threads_are_closed(self):
+        manager = self.manager()
+        for _ in range(3):
+            thread = threading.Thread(target=manager.connection)
+            thread.start()
+            thread.join()
+        manager.connection()
+        self.assertEqual(manager.stats()['connections_open'], 1)
+
+    def test_async_manager(self):
+        search_db = AsyncSQLiteConnectionManager(self.db_path, max_workers=2)
+        self.managers.append(search_db)
+
+        async def requests():
+            return await asyncio.gather(*(search_db.fetchone("SELECT name FROM items WHERE id = ?", (1,))
+                                          for _ in range(10)))
+
+        self.assertEqual(asyncio.run(requests()), [('first',)] * 10)
+        self.assertLessEqual(search_db.manager.stats()['connections_opened'], 2)
+
+    def test_database_manager_shares_connections(self):
+        db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+
+        db = DealGenieDatabase(db_path)
+        self.managers.append(db.connections)
+        self.assertIs(db.connections, DealGenieDatabase(db_path).connections)
+        self.assertIs(db.connections, get_connection_manager(db_path, row_factory=sqlite3.Row))
+
+        db.store_parcel('POOL-1', {'zoning': 'R3'})
+        self.assertEqual(db.get_parcel('POOL-1')['zoning'], 'R3')
+        self.assertEqual(db.connections.stats()['connections_opened'], 1)
+
+
+    def test_database_methods_inside_caller_transaction(self):
+        db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+
+        db = DealGenieDatabase(db_path)
+        self.managers.append(db.connections)
+        conn = db.get_connection()
+        conn.execute("BEGIN")
+        db.store_parcels_bulk([('NEST-1', {'zoning': 'R3'})], conn=conn)
+        db.store_scores_bulk([('NEST-1', 'retail', {'score': 7.5, 'component_scores': {}})], conn=conn)
+        # A floor above every entry forces top() to rebuild its board
+        conn.execute("INSERT OR REPLACE INTO score_leaderboard_floor VALUES ('*', 'all', '*', 9.0)")
+
+        self.assertEqual(db.get_parcel('NEST-1')['zoning'], 'R3')
+        self.assertEqual([row['apn'] for row in db.get_top_opportunities()], ['NEST-1'])
+        self.assertTrue(conn.in_transaction)
+
+        conn.rollback()
+        conn.close()
+        self.assertIsNone(db.get_parcel('NEST-1'))
+        self.assertEqual(db.get_top_opportunities(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
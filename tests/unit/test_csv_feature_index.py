@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the CSVFeatureMatrix APN byte-offset index
+
+Tests index construction, seek-based lookups, quoted multi-line fields and
+rebuilds when the underlying CSV changes.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from features.csv_feature_matrix import CSVFeatureMatrix
+
+
+class TestCSVFeatureIndex(unittest.TestCase):
+    """Test suite for APN index lookups"""
+    
+    def setUp(self):
+        """Write a small parcel CSV fixture"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'parcels.csv')
+        self.rows = [
+            ['apn', 'site_address', 'zoning_code', 'lot_parcel_area', 'zip_code'],
+            ['4306026007', '123 MAIN ST', 'R3-1', '7,500.0 (sq ft)', '90035'],
+            ['5306050014', '"QUOTED" AVE\nUNIT 2', 'C2-1', '12000', '90028'],
+            ['2031007060', '9 ELM ST, REAR', 'R1-1', '6000', '91303'],
+        ]
+        self._write_rows(self.rows)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def _write_rows(self, rows):
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+    
+    def test_lookup_matches_linear_scan(self):
+        """Indexed lookups return the same rows as a full scan"""
+        matrix = CSVFeatureMatrix(self.csv_path)
+        for row in self.rows[1:]:
+            self.assertEqual(matrix.find_apn_data(row[0]), row)
+            self.assertEqual(matrix._scan_for_apn(row[0]), row)
+    
+    def test_missing_apn(self):
+        """Unknown APNs return None without scanning"""
+        matrix = CSVFeatureMatrix(self.csv_path)
+        self.assertIsNone(matrix.find_apn_data('0000000000'))
+    
+    def test_index_persisted_and_reused(self):
+        """Sidecar index is written once and reused by new instances"""
+        CSVFeatureMatrix(self.csv_path).find_apn_data('4306026007')
+        self.assertTrue(os.path.exists(self.csv_path + '.apnidx.json'))
+        
+        matrix = CSVFeatureMatrix(self.csv_path)
+        self.assertTrue(matrix._load_apn_index())
+        self.assertEqual(len(matrix.apn_offsets), 3)
+    
+    def test_index_rebuilt_when_csv_changes(self):
+        """Changing the CSV invalidates the persisted index"""
+        matrix = CSVFeatureMatrix(self.csv_path)
+        matrix.find_apn_data('4306026007')
+        
+        new_row = ['9999999999', '1 NEW ST', 'M1-1', '20000', '90021']
+        self._write_rows(self.rows + [new_row])
+        
+        self.assertEqual(matrix.find_apn_data('9999999999'), new_row)
+        self.assertEqual(CSVFeatureMatrix(self.csv_path).find_apn_data('2031007060'), self.rows[3])
+    
+    def test_feature_extraction_uses_index(self):
+        """get_feature_matrix parses fields from the indexed row"""
+        features = CSVFeatureMatrix(self.csv_path).get_feature_matrix('4306026007')
+        self.assertEqual(features['zoning'], 'R3-1')
+        self.assertEqual(features['lot_size_sqft'], 7500.0)
+        self.assertEqual(features['site_zip'], '90035')
+
+
+if __name__ == '__main__':
+    unittest.main()
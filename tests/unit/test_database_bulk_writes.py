@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the DealGenieDatabase Bulk Write Path
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from db.database_manager import DealGenieDatabase
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+SCORE_COLUMNS = ('apn, template, overall_score, grade, location_score, infrastructure_score, zoning_score, '
+                 'market_score, development_score, financial_score, explanation, recommendations, '
+                 'computation_time_ms, feature_cache_hit')
+
+
+def score_result(i: int):
+    return {
+        'score': round(3.0 + (i % 7) * 0.9, 2),
+        'component_scores': {'zoning': 8.0, 'lot_size': 5.0 + i % 3, 'transit': 6.0, 'demographics': 7.0},
+        'explanation': f'Parcel {i}',
+        'recommendations': ['Verify entitlements'],
+    }
+
+
+class TestBulkWrites(unittest.TestCase):
+    """Test that bulk writes store exactly what the single-row methods store"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = {}
+        for name in ('single', 'bulk'):
+            self.paths[name] = os.path.join(self.temp_dir, f'{name}.db')
+            conn = sqlite3.connect(self.paths[name])
+            conn.executescript(SCHEMA_PATH.read_text())
+            conn.close()
+        self.single = DealGenieDatabase(self.paths['single'])
+        self.bulk = DealGenieDatabase(self.paths['bulk'])
+
+        self.parcels = [(f'BW-{i:03d}', {
+            'site_address': f'{i} Spring St', 'site_zip': '90012', 'council_district': 'CD 14',
+            'zoning': ['R3-1', 'C2', 'RAS4-1'][i % 3], 'lot_size_sqft': 6000 + i,
+        }) for i in range(25)]
+        self.scores = [(apn, template, score_result(i), 10 + i, i % 2 == 0)
+                       for i, (apn, _) in enumerate(self.parcels) for template in ('multifamily', 'retail')]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def query(self, name: str, sql: str):
+        conn = sqlite3.connect(self.paths[name])
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def test_matches_single_row_writes(self):
+        """Parcels, scores and leaderboards match the per-row methods"""
+        for apn, features in self.parcels:
+            self.assertTrue(self.single.store_parcel(apn, features))
+        for entry in self.scores:
+            self.assertTrue(self.single.store_score(*entry))
+
+        parcel_stats = self.bulk.store_parcels_bulk(iter(self.parcels), batch_size=7)
+        score_stats = self.bulk.store_scores_bulk(iter(self.scores), batch_size=7)
+        self.assertEqual(parcel_stats['rows'], len(self.parcels))
+        self.assertEqual(score_stats['rows'], len(self.scores))
+        self.assertGreater(score_stats['rows_per_second'], 0)
+
+        for sql in (f"SELECT {SCORE_COLUMNS} FROM parcel_scores ORDER BY id",
+                    "SELECT apn, address, zip_code, council_district, zoning, lot_size_sqft FROM parcels ORDER BY apn",
+                    "SELECT code, category FROM zoning_codes ORDER BY code"):
+            self.assertEqual(self.query('single', sql), self.query('bulk', sql))
+        self.assertEqual(self.single.get_top_opportunities(template='retail', limit=10),
+                         self.bulk.get_top_opportunities(template='retail', limit=10))
+
+    def test_unlisted_zoning_code_is_registered(self):
+        self.bulk.store_parcels_bulk(self.parcels)
+        self.assertEqual(self.query('bulk', "SELECT category FROM zoning_codes WHERE code = 'RAS4-1'"),
+                         [('mixed',)])
+
+    def test_cache_features_bulk(self):
+        self.bulk.store_parcels_bulk(self.parcels)
+        stats = self.bulk.cache_features_bulk([
+            ('BW-000', 'multifamily', {'lot_size_sqft': 6000}),
+            ('BW-001', 'multifamily', {'lot_size_sqft': 6001}, {'median_household_income': 72000}),
+        ])
+        self.assertEqual(stats['rows'], 2)
+        self.assertEqual(self.bulk.get_cached_features('BW-001', 'multifamily'), {'lot_size_sqft': 6001})
+        self.assertEqual(self.query('bulk', "SELECT median_income FROM feature_cache WHERE apn = 'BW-001'"),
+                         [(72000.0,)])
+
+    def test_failure_rolls_back_whole_batch(self):
+        """A constraint failure part way through raises and leaves nothing behind"""
+        self.bulk.store_parcels_bulk(self.parcels)
+        scores = self.scores[:10] + [('UNKNOWN', 'retail', score_result(0))]
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.bulk.store_scores_bulk(scores, batch_size=4)
+        self.assertEqual(self.query('bulk', "SELECT COUNT(*) FROM parcel_scores"), [(0,)])
+
+    def test_joins_caller_transaction(self):
+        """With conn given, rows commit or roll back with the caller's transaction"""
+        conn = sqlite3.connect(self.paths['bulk'])
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            self.bulk.store_parcels_bulk(self.parcels, conn=conn)
+            self.bulk.store_scores_bulk(self.scores, conn=conn)
+            conn.rollback()
+        finally:
+            conn.close()
+        self.assertEqual(self.query('bulk', "SELECT COUNT(*) FROM parcel_scores"), [(0,)])
+        self.assertEqual(self.query('bulk', "SELECT COUNT(*) FROM parcels"), [(0,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
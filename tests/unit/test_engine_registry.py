@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Shared Scoring Engine Registry
+"""
+
+import os
+import subprocess
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.engine_registry import (
+    load_yaml_config, get_zoning_engine, get_block_group_stats, get_batch_processor, clear_registry
+)
+from scoring.block_group_stats import BlockGroupStatsTable
+from scoring.multi_template_scorer import MultiTemplateScorer
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+
+class TestEngineRegistry(unittest.TestCase):
+    """Test config caching and engine sharing"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, 'zoning.yml')
+        with open(self.config_path, 'w') as f:
+            f.write("score_caps:\n  retail:\n    C2: 9.0\ndefault_unknown:\n"
+                    "  score_cap: 5.0\n  plausibility_floor: 1.0\n  compatible: false\n")
+    
+    def tearDown(self):
+        clear_registry()
+    
+    def test_config_cached_until_modified(self):
+        """YAML is parsed once and re-parsed after the file changes"""
+        first = load_yaml_config(self.config_path)
+        self.assertIs(load_yaml_config(self.config_path), first)
+        
+        with open(self.config_path, 'w') as f:
+            f.write("score_caps:\n  retail:\n    C2: 7.0\n")
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = load_yaml_config(self.config_path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded['score_caps']['retail']['C2'], 7.0)
+    
+    def test_engines_shared_across_scorers(self):
+        """Scorers share engines instead of constructing their own"""
+        a, b = MultiTemplateScorer(), MultiTemplateScorer()
+        self.assertIs(a.zoning_engine, b.zoning_engine)
+        self.assertIs(a.multi_engine, b.multi_engine)
+        self.assertIs(a.batch_processor.zoning_engine, a.zoning_engine)
+        self.assertIs(a.confidence_engine.geo_calibrator, a.geo_calibrator)
+    
+    def test_engine_per_config_path(self):
+        """Distinct config files get distinct engines"""
+        custom = get_zoning_engine(self.config_path)
+        self.assertIs(get_zoning_engine(self.config_path), custom)
+        self.assertIsNot(custom, get_zoning_engine())
+        self.assertEqual(custom.get_score_cap('retail', 'C2'), 9.0)
+    
+    def test_stats_reloaded_after_rebuild(self):
+        """A rebuilt statistics table is picked up by the shared stats and batch processor"""
+        db_path = os.path.join(self.temp_dir, 'stats.db')
+        table = BlockGroupStatsTable()
+        table.add_parcel({'census_geoid': '2011.00', 'median_income': 50000.0})
+        table.save(db_path, full=True)
+        
+        first = get_block_group_stats(db_path)
+        processor = get_batch_processor(stats_db_path=db_path)
+        self.assertIs(get_block_group_stats(db_path), first)
+        self.assertIs(processor.stats_table, first)
+        
+        table.add_parcel({'census_geoid': '1380.00', 'median_income': 70000.0})
+        table.save(db_path, full=True)
+        stat = os.stat(db_path)
+        os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = get_block_group_stats(db_path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(len(reloaded), 2)
+        self.assertIs(get_batch_processor(stats_db_path=db_path).stats_table, reloaded)
+    
+    def test_scorer_import_defers_pandas(self):
+        """Building a scorer does not import pandas or numpy"""
+        code = ("import sys; from scoring.multi_template_scorer import MultiTemplateScorer; "
+                "MultiTemplateScorer(); print('pandas' in sys.modules or 'numpy' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(output, 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
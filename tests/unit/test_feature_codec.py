@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Binary Feature Vector Codec
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from db.database_manager import DealGenieDatabase
+from features.csv_feature_matrix import CSVFeatureMatrix
+from features.feature_codec import encode_features, decode_features, is_legacy_encoding
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+
+
+def sample_features() -> dict:
+    features = CSVFeatureMatrix.__new__(CSVFeatureMatrix)._get_default_features('5432-001-002')
+    features.update({
+        'lot_size_sqft': 7421.5, 'year_built': 1962, 'historic_preservation': True,
+        'council_district': 'CD 13', 'neighborhood_council': 'Silver Lake – Echo Park',
+    })
+    return features
+
+
+class TestFeatureCodec(unittest.TestCase):
+    """Test that encoding is lossless and smaller than JSON"""
+
+    def test_round_trip_preserves_values_and_types(self):
+        features = sample_features()
+        decoded = decode_features(encode_features(features))
+        self.assertEqual(decoded, features)
+        for name, value in features.items():
+            self.assertIs(type(decoded[name]), type(value), name)
+
+    def test_unusual_values(self):
+        """Unknown keys, None, large ints, nested values and NUL characters survive"""
+        features = {
+            'custom_metric': 0.25, 'zoning': None, 'assessed_value': 2 ** 40,
+            'huge': 10 ** 30, 'utility_deficiencies': ['sewer', 'water'],
+            'overlays': {'hpoz': True, 'toc_tier': 3}, 'site_address': 'a\0b',
+            'ünïcode': '東京', 'empty': '', 'negative': -7,
+        }
+        self.assertEqual(decode_features(encode_features(features)), features)
+        self.assertEqual(decode_features(encode_features({})), {})
+
+    def test_smaller_than_json(self):
+        features = sample_features()
+        self.assertLess(len(encode_features(features)), len(json.dumps(features)) * 0.6)
+
+    def test_legacy_json_and_corrupt_records(self):
+        features = sample_features()
+        self.assertTrue(is_legacy_encoding(json.dumps(features)))
+        self.assertFalse(is_legacy_encoding(encode_features(features)))
+        self.assertEqual(decode_features(json.dumps(features)), features)
+        with self.assertRaises(ValueError):
+            decode_features(encode_features(features)[:20])
+        with self.assertRaises(ValueError):
+            decode_features(b'DG\x09' + encode_features(features)[3:])
+
+
+class TestFeatureCacheEncoding(unittest.TestCase):
+    """Test the feature cache stores binary vectors and migrates JSON rows on read"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+        self.db = DealGenieDatabase(self.db_path)
+        self.db.store_parcel('5432-001-002', {'zoning': 'R3'})
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def stored_vector(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT feature_vector FROM feature_cache").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_cache_stores_binary(self):
+        features = sample_features()
+        self.assertTrue(self.db.cache_features('5432-001-002', 'multifamily', features))
+        self.assertIsInstance(self.stored_vector(), bytes)
+        self.assertEqual(self.db.get_cached_features('5432-001-002', 'multifamily'), features)
+
+    def test_legacy_json_rows_migrate_lazily(self):
+        features = sample_features()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            INSERT INTO feature_cache (apn, template, feature_vector, expires_at)
+            VALUES ('5432-001-002', 'multifamily', ?, datetime('now', '+1 day'))
+        ''', (json.dumps(features),))
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self.db.get_cached_features('5432-001-002', 'multifamily'), features)
+        self.assertIsInstance(self.stored_vector(), bytes)
+        self.assertEqual(self.db.get_cached_features('5432-001-002', 'multifamily'), features)
+
+
+if __name__ == '__main__':
+    unittest.main()
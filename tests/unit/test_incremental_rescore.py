@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Incremental Rescoring Job
+"""
+
+import csv
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from cli import incremental_rescore
+from cli.incremental_rescore import incremental_rescore as run_rescore, frame_feature_hashes
+from scoring.engine import calculate_score
+from features.batch_features import get_feature_matrix_batch
+from scoring.block_group_stats import BlockGroupStatsTable, build_block_group_stats
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+TEMPLATES = ['multifamily', 'retail']
+
+
+class TestIncrementalRescore(unittest.TestCase):
+    """Test change detection and bulk score writes"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+        
+        self.frame = pd.DataFrame([{
+            'apn': f'INC-{i:04d}', 'zoning': ['R3', 'C2', 'M1'][i % 3],
+            'lot_size_sqft': 5000.0 + i * 250, 'transit_score': 40.0 + i,
+            'median_income': 60000.0 + i * 1000, 'price_per_sqft': 450.0, 'found': True
+        } for i in range(40)])
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def run_job(self, frame, **kwargs):
+        return run_rescore(self.db_path, TEMPLATES, frames=[frame.iloc[:25], frame.iloc[25:]], **kwargs)
+    
+    def score_count(self) -> int:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM parcel_scores").fetchone()[0]
+        finally:
+            conn.close()
+    
+    def test_feature_hash_ignores_column_order(self):
+        """Row hashes depend on values, not column order"""
+        reordered = self.frame[list(reversed(self.frame.columns))]
+        self.assertEqual(list(frame_feature_hashes(self.frame)), list(frame_feature_hashes(reordered)))
+        changed = self.frame.copy()
+        changed.loc[3, 'lot_size_sqft'] += 1
+        diff = frame_feature_hashes(self.frame) != frame_feature_hashes(changed)
+        self.assertEqual(list(diff.nonzero()[0]), [3])
+    
+    def test_feature_hash_of_batch_frame(self):
+        """Frames from get_feature_matrix_batch (list-valued columns included) hash stably"""
+        csv_path = os.path.join(self.temp_dir, 'parcels.csv')
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['apn', 'site_address', 'zoning_code', 'lot_parcel_area', 'zip_code'])
+            writer.writerow(['4306026007', '123 MAIN ST', 'R3-1', '7500', '90035'])
+            writer.writerow(['5306050014', '45 BROADWAY', 'C2-1', '12000', '90028'])
+        
+        frame = get_feature_matrix_batch(['4306026007', '5306050014'], csv_path=csv_path)
+        self.assertIn('utility_deficiencies', frame.columns)
+        hashes = frame_feature_hashes(frame)
+        self.assertEqual(len(set(hashes)), 2)
+        
+        frame.at[1, 'utility_deficiencies'] = ['sewer']
+        changed = frame_feature_hashes(frame)
+        self.assertEqual(list((hashes != changed).nonzero()[0]), [1])
+        
+        stats = run_rescore(self.db_path, TEMPLATES, frames=[frame])
+        self.assertEqual(stats['rescored'], 2)
+    
+    def test_rescored_parcels_are_stored(self):
+        """Rescored parcels get parcels rows, so their scores reach the leaderboards"""
+        self.run_job(self.frame)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            parcels = conn.execute("SELECT COUNT(*) FROM parcels WHERE apn LIKE 'INC-%'").fetchone()[0]
+            zoning = conn.execute("SELECT zoning FROM parcels WHERE apn = 'INC-0001'").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(parcels, 40)
+        self.assertEqual(zoning, 'C2')
+    
+    def test_only_changed_parcels_rescored(self):
+        """First run scores everything, an unchanged rerun nothing, a delta only its parcels"""
+        stats = self.run_job(self.frame)
+        self.assertEqual(stats['rescored'], 40)
+        self.assertEqual(self.score_count(), 40 * len(TEMPLATES))
+        
+        self.assertEqual(self.run_job(self.frame)['rescored'], 0)
+        
+        delta = self.frame.copy()
+        delta.loc[[5, 30], 'zoning'] = 'C4'
+        stats = self.run_job(delta)
+        self.assertEqual((stats['stale'], stats['rescored'], stats['rows_written']), (2, 2, 4))
+        
+        conn = sqlite3.connect(self.db_path)
+        score = conn.execute(
+            "SELECT overall_score FROM parcel_scores WHERE apn = 'INC-0005' AND template = 'retail' "
+            "ORDER BY id DESC LIMIT 1"
+        ).fetchone()[0]
+        conn.close()
+        features = delta.drop(columns=['found']).iloc[5].to_dict()
+        self.assertEqual(score, calculate_score(features, 'retail')['score'])
+    
+    def test_config_change_rescores_everything(self):
+        """A new scoring config fingerprint marks every parcel stale"""
+        self.run_job(self.frame)
+        with mock.patch.object(incremental_rescore, 'scoring_config_fingerprint', return_value='edited'):
+            stats = self.run_job(self.frame)
+        self.assertTrue(stats['config_changed'])
+        self.assertEqual(stats['rescored'], 40)
+    
+    def test_removed_parcels_and_dry_run(self):
+        """Dry runs write nothing; parcels missing from the source drop their state"""
+        stats = self.run_job(self.frame, dry_run=True)
+        self.assertEqual((stats['stale'], stats['rescored']), (40, 0))
+        self.assertEqual(self.score_count(), 0)
+        
+        self.run_job(self.frame)
+        stats = run_rescore(self.db_path, TEMPLATES, frames=[self.frame.iloc[:30]])
+        self.assertEqual((stats['rescored'], stats['removed']), (0, 10))
+    
+    def test_zscore_stats_follow_changes(self):
+        """Changed and removed parcels update the stored statistics like a rebuild would"""
+        frame = self.frame.assign(census_geoid=[f"20{i % 3 + 1:02d}.00000000" for i in range(40)])
+        self.run_job(frame)  # Records contributions; no statistics built yet
+        build_block_group_stats([frame]).save(self.db_path, full=True)
+        
+        delta = frame.copy()
+        delta.loc[3, 'median_income'] = 250000.0
+        delta.loc[4, 'census_geoid'] = '2099.00000000'
+        delta = delta.drop(index=[10, 11]).reset_index(drop=True)
+        stats = run_rescore(self.db_path, TEMPLATES, frames=[delta])
+        self.assertEqual((stats['rescored'], stats['removed'], stats['stats_updated']), (2, 2, 4))
+        
+        stored = BlockGroupStatsTable.load(self.db_path)
+        expected = build_block_group_stats([delta])
+        self.assertEqual(set(stored._accumulators), set(expected._accumulators))
+        for key, accumulator in expected._accumulators.items():
+            self.assertTrue(np.allclose(stored._accumulators[key], accumulator), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
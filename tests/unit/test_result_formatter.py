@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Lazy Result Formatting
+"""
+
+import json
+import pickle
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.result_formatter import ResultFormatter, FormattedResult, PAYLOAD_KEYS
+
+
+def template_result(template, score, viable=True):
+    return {
+        'template': template, 'viable': viable, 'strong': score >= 7.0,
+        'raw_score': score + 0.4, 'constrained_score': score,
+        'constraints_applied': {'constraints_applied': [], 'summary': 'No constraints applied'},
+        'raw_result': {'component_scores': {'transit': 8.2, 'zoning': 6.0}, 'penalties': {'flood': 0.8}},
+    }
+
+
+def scoring_result(parcel_id='5432-001-002', analysis_type='clear_ranking'):
+    return {
+        'parcel_id': parcel_id, 'zoning': 'C2-1', 'multi_template_triggered': True,
+        'processing_timestamp': '2026-01-01T00:00:00',
+        'viable_templates_count': 3, 'scored_templates_count': 3,
+        'template_results': {
+            'retail': template_result('retail', 7.46),
+            'multifamily': template_result('multifamily', 6.14),
+            'industrial': template_result('industrial', 2.0, viable=False),
+        },
+        'template_confidences': {'retail': {'confidence': 0.8123, 'analysis': {'confidence_level': 'high'}}},
+        'recommendations': {
+            'analysis_type': analysis_type,
+            'primary': {'template': 'retail', 'score': 7.46, 'confidence': 0.81, 'strong': True, 'gap_to_next': 1.32},
+            'secondary': {'template': 'multifamily', 'score': 6.14, 'gap_from_primary': 1.32},
+        },
+    }
+
+
+class TestFormattedResult(unittest.TestCase):
+    """Test that lazy payloads match eager formatting and build sections on demand"""
+
+    def setUp(self):
+        self.formatter = ResultFormatter()
+
+    def test_sections_built_on_access(self):
+        with mock.patch.object(self.formatter, '_build_alternatives_list',
+                               wraps=self.formatter._build_alternatives_list) as alternatives, \
+             mock.patch.object(self.formatter, '_extract_risk_factors',
+                               wraps=self.formatter._extract_risk_factors) as risk_factors:
+            payload = self.formatter.format_multi_template_result(scoring_result())
+            self.assertIsInstance(payload, FormattedResult)
+            self.assertEqual(payload['meta']['templates_scored'], 3)
+            self.assertIn('alternatives', payload)
+            self.assertEqual(len(payload), len(PAYLOAD_KEYS))
+            alternatives.assert_not_called()
+
+            self.assertEqual(payload['viable_uses'][0]['template'], 'retail')
+            self.assertFalse(payload.is_resolved)
+            risk_factors.assert_not_called()
+
+            self.assertEqual(payload['primary_recommendation']['risk_factors'], ['Flood: -0.8 points'])
+            self.assertEqual(payload.get('alternatives')[0]['level'], 'secondary')
+            alternatives.assert_called_once()
+
+    def test_serialization_formats_everything_in_order(self):
+        payload = self.formatter.format_multi_template_result(scoring_result())
+        payload['viable_uses']  # Out-of-order access still serializes in payload order
+        decoded = json.loads(json.dumps(payload))
+        self.assertEqual(list(decoded), list(PAYLOAD_KEYS))
+        self.assertEqual(decoded, payload)
+        self.assertEqual(pickle.loads(pickle.dumps(payload)), decoded)
+        self.assertIs(type(payload.to_dict()), dict)
+
+    def test_no_primary_for_ties(self):
+        payload = self.formatter.format_multi_template_result(scoring_result(analysis_type='statistical_tie'))
+        self.assertIsNone(payload['primary_recommendation'])
+
+    def test_section_failure_becomes_error_payload(self):
+        result = scoring_result()
+        del result['template_results']['retail']['constrained_score']
+        payload = self.formatter.format_multi_template_result(result)
+        self.assertEqual(payload['parcel_id'], '5432-001-002')
+        self.assertEqual(payload['viable_uses'], [])
+        self.assertEqual(payload['scoring_method'], 'error')
+        self.assertIn('error', payload)
+
+    def test_scores_only_batch(self):
+        results = [scoring_result(f'P{i}') for i in range(3)] + [None]
+        with mock.patch.object(self.formatter, '_build_viable_uses_array') as viable_uses:
+            batch = self.formatter.format_batch_results(results, scores_only=True)
+            viable_uses.assert_not_called()
+
+        full = self.formatter.format_batch_results(results)
+        for key in ['total_parcels', 'successful_scores', 'multi_template_triggered', 'average_viable_templates']:
+            self.assertEqual(batch['batch_stats'][key], full['batch_stats'][key])
+        entry = batch['results'][0]
+        self.assertEqual(entry['scores'], {'retail': 7.5, 'multifamily': 6.1})
+        self.assertEqual((entry['primary_template'], entry['primary_score']), ('retail', 7.5))
+        self.assertEqual(entry['top_score'], full['results'][0]['viable_uses'][0]['score'])
+        self.assertIn('error', batch['results'][3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Streaming Result Sinks
+"""
+
+import csv
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.result_sinks import (
+    open_result_sink, skip_completed, CSVResultSink, JSONLResultSink, HAS_PYARROW
+)
+from scoring.result_formatter import ResultFormatter
+from cli.batch_score import ScoreDatabaseWriter, build_result_row
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+
+
+def make_rows(start, stop):
+    return [{'apn': f'APN{i:04d}', 'template': 'retail', 'score': i / 10} for i in range(start, stop)]
+
+
+class TestResultSinks(unittest.TestCase):
+    """Test buffered writing, checkpoints and resume"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _crash_after(self, path, flushed_rows, unflushed_rows):
+        """Write rows, then abort with some still buffered"""
+        try:
+            with open_result_sink(path, flush_every=10, flush_interval=None) as sink:
+                sink.write_many(flushed_rows)
+                sink.write_many(unflushed_rows)
+                raise RuntimeError("simulated crash")
+        except RuntimeError:
+            pass
+    
+    def test_failed_score_store_keeps_checkpoint(self):
+        """A failed score write raises, keeps its buffer and never advances the sink checkpoint"""
+        db_path = os.path.join(self.temp_dir, 'scores.db')
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+        
+        path = os.path.join(self.temp_dir, 'out.csv')
+        score = {'score': 7.0, 'component_scores': {'zoning': 8.0, 'lot_size': 6.0, 'transit': 5.0,
+                                                     'demographics': 7.0, 'market': 6.0}}
+        row = build_result_row({'apn': 'NOT-IN-PARCELS'}, 'retail', score)
+        
+        writer = ScoreDatabaseWriter(open_result_sink(path, flush_every=10, flush_interval=None),
+                                     db_path, flush_every=10)
+        with self.assertRaises(sqlite3.IntegrityError):
+            with writer:
+                writer.write(row)
+        
+        self.assertEqual(writer.rows_stored, 0)
+        self.assertEqual(len(writer.buffer), 1)
+        self.assertEqual(writer.rows_flushed, 0)
+        sink = open_result_sink(path, resume=True)
+        self.assertIsNone(sink.last_flushed_key)
+        sink.close()
+    
+    def test_buffer_is_bounded(self):
+        """Rows are flushed once flush_every is reached"""
+        path = os.path.join(self.temp_dir, 'out.csv')
+        sink = CSVResultSink(path, flush_every=10, flush_interval=None)
+        sink.write_many(make_rows(0, 9))
+        self.assertEqual(sink.rows_flushed, 0)
+        sink.write(make_rows(9, 10)[0])
+        self.assertEqual(sink.rows_flushed, 10)
+        self.assertEqual(sink.buffer, [])
+        self.assertEqual(sink.last_flushed_key, 'APN0009')
+        sink.close()
+    
+    def test_csv_resume_after_crash(self):
+        """Resume truncates unflushed output and continues after the last flushed APN"""
+        path = os.path.join(self.temp_dir, 'out.csv')
+        self._crash_after(path, make_rows(0, 10), make_rows(10, 15))
+        
+        sink = open_result_sink(path, flush_every=10, resume=True)
+        self.assertEqual(sink.last_flushed_key, 'APN0009')
+        remaining = list(skip_completed(make_rows(0, 25), sink.last_flushed_key, key=lambda r: r['apn']))
+        self.assertEqual(remaining[0]['apn'], 'APN0010')
+        with sink:
+            sink.write_many(remaining)
+        
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([r['apn'] for r in rows], [f'APN{i:04d}' for i in range(25)])
+    
+    def test_jsonl_roundtrip(self):
+        """JSONL sink writes nested payloads one per line"""
+        path = os.path.join(self.temp_dir, 'out.jsonl')
+        with open_result_sink(path, flush_every=3) as sink:
+            self.assertIsInstance(sink, JSONLResultSink)
+            for row in make_rows(0, 7):
+                row['meta'] = {'nested': [1, 2]}
+                sink.write(row)
+        
+        with open(path) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[6]['meta'], {'nested': [1, 2]})
+    
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_resume_after_crash(self):
+        """Parquet dataset keeps only checkpointed row groups on resume"""
+        import pandas as pd
+        
+        path = os.path.join(self.temp_dir, 'out.parquet')
+        self._crash_after(path, make_rows(0, 10), make_rows(10, 15))
+        
+        with open_result_sink(path, flush_every=10, resume=True) as sink:
+            remaining = skip_completed(make_rows(0, 30), sink.last_flushed_key, key=lambda r: r['apn'])
+            sink.write_many(remaining)
+        
+        frame = pd.read_parquet(path)
+        self.assertEqual(sorted(frame['apn']), [f'APN{i:04d}' for i in range(30)])
+    
+    def test_formatter_streaming_stats(self):
+        """Streaming formatter stats equal the materialized batch stats"""
+        results = [{'parcel_id': f'P{i}', 'zoning': 'C2', 'template_results': {}} for i in range(4)]
+        expected = ResultFormatter().format_batch_results(results)
+        
+        path = os.path.join(self.temp_dir, 'formatted.jsonl')
+        with open_result_sink(path, key_field='parcel_id') as sink:
+            stats = ResultFormatter().stream_batch_results(iter(results), sink)
+        
+        for key in ['total_parcels', 'successful_scores', 'multi_template_triggered', 'average_viable_templates']:
+            self.assertEqual(stats[key], expected['batch_stats'][key])
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Score Result Cache
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring import score_cache
+from scoring.score_cache import ScoreCache, feature_fingerprint, scoring_config_fingerprint
+from scoring.engine import calculate_score
+from scoring.multi_template_scorer import score_parcel_multi_template
+from db.database_manager import DealGenieDatabase
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+
+
+class TestScoreCache(unittest.TestCase):
+    """Test cache keys, tiers and invalidation"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'cache.db')
+        self.features = {'apn': '5555-001-001', 'zoning': 'C2', 'lot_size_sqft': 12000,
+                         'transit_score': 70, 'median_income': 80000}
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_feature_fingerprint_is_order_independent(self):
+        """Fingerprint ignores key order but not values"""
+        reordered = dict(reversed(list(self.features.items())))
+        self.assertEqual(feature_fingerprint(self.features), feature_fingerprint(reordered))
+        self.assertNotEqual(feature_fingerprint(self.features),
+                            feature_fingerprint(dict(self.features, lot_size_sqft=12001)))
+    
+    def test_memory_and_persistent_tiers(self):
+        """Second lookup hits memory; a new process hits SQLite"""
+        cache = ScoreCache(self.db_path)
+        result, hit = cache.calculate_score(self.features, 'retail')
+        self.assertFalse(hit)
+        cached, hit = cache.calculate_score(self.features, 'retail')
+        self.assertTrue(hit)
+        self.assertEqual(cached['score'], result['score'])
+        self.assertEqual(cache.stats['memory_hits'], 1)
+        cache.close()
+        
+        restarted = ScoreCache(self.db_path)
+        cached, hit = restarted.calculate_score(self.features, 'retail')
+        self.assertTrue(hit)
+        self.assertEqual(restarted.stats['persistent_hits'], 1)
+        self.assertEqual(cached, calculate_score(self.features, 'retail') | {'timestamp': cached['timestamp']})
+        restarted.close()
+    
+    def test_changed_features_miss(self):
+        """Any feature change is a miss"""
+        cache = ScoreCache(None)
+        cache.calculate_score(self.features, 'retail')
+        _, hit = cache.calculate_score(dict(self.features, transit_score=20), 'retail')
+        self.assertFalse(hit)
+    
+    def test_config_change_invalidates(self):
+        """Editing a scoring config file invalidates every entry"""
+        config_file = Path(self.temp_dir) / 'weights.yml'
+        config_file.write_text("a: 1\n")
+        
+        with mock.patch.object(score_cache, 'SCORING_CONFIG_FILES', [config_file]):
+            cache = ScoreCache(self.db_path)
+            cache.calculate_score(self.features, 'office')
+            _, hit = cache.calculate_score(self.features, 'office')
+            self.assertTrue(hit)
+            
+            before = scoring_config_fingerprint()
+            config_file.write_text("a: 2\n")
+            self.assertNotEqual(scoring_config_fingerprint(), before)
+            
+            _, hit = cache.calculate_score(self.features, 'office')
+            self.assertFalse(hit)
+            cache.close()
+    
+    def test_added_config_file_invalidates(self):
+        """Config files are listed per lookup, so a new constraints YAML changes the fingerprint"""
+        constraints_dir = Path(self.temp_dir) / 'constraints'
+        constraints_dir.mkdir()
+        (constraints_dir / 'base.yml').write_text("a: 1\n")
+        
+        with mock.patch.object(score_cache, 'SCORING_CONFIG_GLOBS', [(constraints_dir, '*.yml')]):
+            before = scoring_config_fingerprint()
+            (constraints_dir / 'added.yml').write_text("b: 2\n")
+            self.assertNotEqual(scoring_config_fingerprint(), before)
+    
+    def test_hits_are_restamped(self):
+        """Cached results report when they were served, not when first scored"""
+        cache = ScoreCache(self.db_path)
+        stale = '2000-01-01T00:00:00'
+        result = {'score': 7.0, 'timestamp': stale, 'templates': [{'raw_result': {'timestamp': stale}}]}
+        cache.put(self.features['apn'], 'retail', self.features, result)
+        cache.close()
+        
+        restarted = ScoreCache(self.db_path)
+        for _ in range(2):  # Persistent hit, then memory hit
+            cached = restarted.get(self.features['apn'], 'retail', self.features)
+            self.assertEqual(cached['score'], 7.0)
+            self.assertNotEqual(cached['timestamp'], stale)
+            self.assertNotEqual(cached['templates'][0]['raw_result']['timestamp'], stale)
+        self.assertEqual((restarted.stats['persistent_hits'], restarted.stats['memory_hits']), (1, 1))
+        restarted.close()
+    
+    def test_multi_template_convenience_uses_cache(self):
+        """score_parcel_multi_template serves unchanged parcels from a given cache"""
+        cache = ScoreCache(None)
+        first = score_parcel_multi_template(self.features, score_cache=cache)
+        second = score_parcel_multi_template(self.features, score_cache=cache)
+        self.assertEqual(cache.stats['memory_hits'], 1)
+        self.assertEqual(first['parcel_id'], second['parcel_id'])
+    
+    def test_lru_bound(self):
+        """In-process tier is bounded"""
+        cache = ScoreCache(None, max_entries=3)
+        for i in range(5):
+            cache.calculate_score(dict(self.features, apn=f'APN{i}'), 'retail')
+        self.assertEqual(len(cache._memory), 3)
+    
+    def test_database_records_cache_hits(self):
+        """DealGenieDatabase.score_parcel writes hit/miss to feature_cache_hit"""
+        db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.execute("INSERT INTO parcels (apn) VALUES (?)", (self.features['apn'],))
+        conn.commit()
+        conn.close()
+        
+        db = DealGenieDatabase(db_path)
+        db.score_parcel(self.features['apn'], 'retail', self.features)
+        db.score_parcel(self.features['apn'], 'retail', self.features)
+        
+        stats = db.get_cache_hit_statistics()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Materialized Score Leaderboards
+"""
+
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from db.database_manager import DealGenieDatabase
+from db.score_leaderboard import ScoreLeaderboard, zoning_category
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / 'db' / 'sqlite_schema.sql'
+ZONES = ['R3-1', 'C2-1VL', 'M1', 'R1-1', 'C4', 'MR1']
+DISTRICTS = ['CD 1', 'CD 13', 'CD 14']
+ZIPS = ['90012', '90028', '90065']
+
+
+class TestScoreLeaderboard(unittest.TestCase):
+    """Test that leaderboard reads always match a full scan of the latest scores"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'dealgenie.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+
+        self.db = DealGenieDatabase(self.db_path)
+        self.db.leaderboard = ScoreLeaderboard(capacity=5)  # Small boards exercise trimming
+        for i in range(30):
+            self.db.store_parcel(f'LB-{i:03d}', {
+                'site_address': f'{i} Main St', 'zoning': ZONES[i % len(ZONES)],
+                'site_zip': ZIPS[i % len(ZIPS)], 'council_district': DISTRICTS[i % len(DISTRICTS)],
+                'lot_size_sqft': 5000 + i,
+            })
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def store_random_scores(self, rng: random.Random, count: int):
+        for _ in range(count):
+            apn = f'LB-{rng.randrange(30):03d}'
+            template = rng.choice(['multifamily', 'retail'])
+            self.db.store_score(apn, template, {'score': round(rng.uniform(0, 10), 6)})
+
+    def expected(self, template='*', dimension='all', value='*', limit=50, min_score=None):
+        """Scan-and-sort reference over the latest score per (apn, template)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute('''
+                SELECT ps.apn, ps.template, ps.overall_score, zc.category, p.zip_code, p.council_district
+                FROM parcel_scores ps JOIN parcels p ON p.apn = ps.apn
+                JOIN zoning_codes zc ON zc.code = p.zoning
+                WHERE ps.id IN (SELECT MAX(id) FROM parcel_scores GROUP BY apn, template)
+            ''').fetchall()
+        finally:
+            conn.close()
+
+        result = []
+        for apn, row_template, score, category, zip_code, council_district in rows:
+            values = {'zoning_category': category, 'zip_code': zip_code,
+                      'council_district': council_district}
+            if template != '*' and row_template != template:
+                continue
+            if dimension != 'all' and values[dimension] != value:
+                continue
+            if min_score is not None and score < min_score:
+                continue
+            result.append((apn, row_template, score))
+        return sorted(result, key=lambda entry: -entry[2])[:limit]
+
+    def actual(self, **kwargs):
+        return [(row['apn'], row['template'], row['overall_score'])
+                for row in self.db.get_top_opportunities(**kwargs)]
+
+    def test_matches_full_scan_across_updates(self):
+        """Boards stay exact while scores are inserted, raised and lowered"""
+        rng = random.Random(7)
+        for round_number in range(4):
+            self.store_random_scores(rng, 40)
+            for limit in (3, 5, 8):
+                self.assertEqual(self.actual(limit=limit), self.expected(limit=limit))
+                self.assertEqual(self.actual(template='retail', council_district='CD 13', limit=limit),
+                                 self.expected('retail', 'council_district', 'CD 13', limit))
+                self.assertEqual(self.actual(template='multifamily', zip_code='90028', limit=limit),
+                                 self.expected('multifamily', 'zip_code', '90028', limit))
+                self.assertEqual(self.actual(zoning_category='commercial', limit=limit, min_score=4.0),
+                                 self.expected('*', 'zoning_category', 'commercial', limit, 4.0))
+
+    def test_parcel_changes_move_entries(self):
+        """Zoning/ZIP/district changes move entries; scores stored before their parcel are backfilled"""
+        rng = random.Random(5)
+        self.store_random_scores(rng, 60)
+        for i in range(0, 30, 4):
+            self.db.store_parcel(f'LB-{i:03d}', {
+                'site_address': f'{i} Main St', 'zoning': 'M1', 'site_zip': '90065',
+                'council_district': 'CD 14', 'lot_size_sqft': 5000 + i,
+            })
+
+        # Score rows written without a parcels row (no foreign key enforcement)
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("INSERT INTO parcel_scores (apn, template, overall_score) VALUES (?, ?, ?)",
+                         [(f'NEW-{i}', 'retail', 9.5 + i / 100) for i in range(3)])
+        conn.commit()
+        conn.close()
+        self.db.store_parcels_bulk((f'NEW-{i}', {
+            'site_address': f'{i} New St', 'zoning': 'C4', 'site_zip': '90012', 'council_district': 'CD 1',
+        }) for i in range(3))
+
+        for limit in (3, 5):
+            for template, dimension, value in (('*', 'all', '*'), ('retail', 'zip_code', '90012'),
+                                               ('*', 'council_district', 'CD 14'),
+                                               ('multifamily', 'zip_code', '90028'),
+                                               ('*', 'zoning_category', 'industrial')):
+                kwargs = {} if dimension == 'all' else {dimension: value}
+                self.assertEqual(self.actual(template=template, limit=limit, **kwargs),
+                                 self.expected(template, dimension, value, limit))
+
+    def test_boards_are_bounded(self):
+        """No board holds more than its capacity"""
+        self.store_random_scores(random.Random(3), 120)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            largest = conn.execute('''
+                SELECT MAX(n) FROM (SELECT COUNT(*) AS n FROM score_leaderboard
+                                    GROUP BY board_template, dimension, dimension_value)
+            ''').fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(largest, 5)
+
+    def test_rebuild_and_high_value_opportunities(self):
+        """A full rebuild reproduces the boards; legacy query reads the county-wide board"""
+        self.store_random_scores(random.Random(11), 60)
+        self.assertTrue(self.db.rebuild_leaderboards())
+        rows = self.db.get_high_value_opportunities(min_score=7.0, limit=4)
+        self.assertEqual([(row['apn'], row['template'], row['overall_score']) for row in rows],
+                         self.expected(limit=4, min_score=7.0))
+        self.assertIn('explanation', rows[0])
+        self.assertEqual(self.actual(limit=20), self.expected(limit=20))
+
+    def test_single_dimension_filter(self):
+        with self.assertRaises(ValueError):
+            self.db.get_top_opportunities(zip_code='90012', council_district='CD 1')
+
+    def test_zoning_category_fallback(self):
+        """Codes missing from zoning_codes map onto its category names"""
+        self.assertEqual(zoning_category('[Q]C4-2D'), 'commercial')
+        self.assertEqual(zoning_category('RD1.5-1'), 'residential')
+        self.assertEqual(zoning_category('M2-1'), 'industrial')
+        self.assertEqual(zoning_category('RAS4-1'), 'mixed')
+        self.assertEqual(zoning_category('LAX'), 'other')
+        self.assertIsNone(zoning_category(''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Single-Pass Multi-Template Scoring
+
+Checks that calculate_template_scores and MultiTemplateScorer.score_templates
+return exactly what per-template scoring returns.
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.engine import calculate_score, calculate_template_scores
+from scoring.multi_template_scorer import MultiTemplateScorer
+
+TEMPLATES = ['multifamily', 'commercial', 'residential', 'industrial', 'retail', 'mixed_use', 'office', 'custom']
+
+
+def _without_timestamp(result):
+    return {k: v for k, v in result.items() if k != 'timestamp'}
+
+
+class TestSinglePassScoring(unittest.TestCase):
+    """Test single-pass scoring parity"""
+    
+    def setUp(self):
+        rng = random.Random(42)
+        self.parcels = []
+        for i in range(60):
+            self.parcels.append({
+                'apn': f'SP{i:03d}',
+                'zoning': rng.choice(['R1', 'R3', 'RAS4', 'C2', 'CM', 'M2', 'LAX', 'A1']),
+                'lot_size_sqft': rng.choice([3000, 7500, 12000, 25000]),
+                'transit_score': rng.uniform(10, 100),
+                'median_income': rng.choice([28000, 55000, 95000, 150000]),
+                'population_density': rng.choice([3000, 9000, 15000]),
+                'crime_factor': rng.choice([0.4, 1.0, 1.6, 2.2]),
+                'price_per_sqft': rng.choice([300, 550, 900]),
+                'air_quality_index': rng.choice([50, 130]),
+                'flood_risk': rng.random() < 0.3,
+            })
+        self.parcels.append({'apn': 'BAD', 'zoning': None, 'lot_size_sqft': 5000})
+    
+    def test_engine_template_scores_match(self):
+        """calculate_template_scores equals calculate_score per template"""
+        for parcel in self.parcels:
+            results = calculate_template_scores(parcel, TEMPLATES)
+            self.assertEqual(list(results), TEMPLATES)
+            for template in TEMPLATES:
+                self.assertEqual(_without_timestamp(results[template]),
+                                 _without_timestamp(calculate_score(parcel, template)))
+    
+    def test_industrial_penalties_are_separate(self):
+        """Pollution penalty is excluded for industrial only"""
+        parcel = {'zoning': 'M2', 'air_quality_index': 160}
+        results = calculate_template_scores(parcel, ['industrial', 'retail'])
+        self.assertNotIn('pollution', results['industrial']['penalties'])
+        self.assertIn('pollution', results['retail']['penalties'])
+    
+    def test_scorer_matches_single_template(self):
+        """MultiTemplateScorer.score_templates equals score_single_template"""
+        scorer = MultiTemplateScorer()
+        for parcel in self.parcels[:20]:
+            batch = scorer.score_templates(parcel, TEMPLATES[:-1])
+            for template in TEMPLATES[:-1]:
+                single = scorer.score_single_template(parcel, template)
+                for result in (single, batch[template]):
+                    result['raw_result'] = _without_timestamp(result['raw_result'])
+                self.assertEqual(batch[template], single)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Precompiled Zoning Classification Table
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scoring.zoning_lookup import (
+    ZoningLookupTable, get_zoning_table, zoning_rule_score, development_zoning_bonus, RULE_TEMPLATES
+)
+from scoring.zoning_engine import ZoningConstraintsEngine, default_constraints_path
+from scoring.engine_registry import get_zoning_engine, clear_registry
+from scoring.engine import calculate_zoning_score
+from features.csv_feature_matrix import CSVFeatureMatrix
+
+
+class TestZoningLookupTable(unittest.TestCase):
+    """Test zoning table compilation and lookups"""
+    
+    def setUp(self):
+        self.table = get_zoning_table()
+        self.codes = ['R1-1', 'R2', 'RD1.5', 'R3', 'R4P', 'R5', 'RAS3', 'RAS4', 'RE40', 'C1', 'C1.5',
+                      'C2-1VL', 'C4', 'CM', 'CR', 'P', 'LAX', 'M1', 'M2', 'MR1', 'A1', 'OS', 'UNKNOWN']
+    
+    def test_zoning_scores_match_rules(self):
+        """Table scores equal the rule chain for every template, including unknown templates"""
+        for code in self.codes:
+            for template in RULE_TEMPLATES + ['custom_template']:
+                self.assertEqual(self.table.zoning_score(code, template), zoning_rule_score(code, template))
+                self.assertEqual(calculate_zoning_score(code, template), zoning_rule_score(code, template))
+    
+    def test_profiles_are_memoized(self):
+        """Each code is compiled once and reused"""
+        first = self.table.profile('C2-1VL-CDO')
+        self.assertIs(self.table.profile('C2-1VL-CDO'), first)
+    
+    def test_yaml_codes_precompiled(self):
+        """Codes from the constraints YAML are compiled at construction"""
+        table = ZoningLookupTable({'retail': {'C2': 10.0}}, {'retail': 4.0}, {'office': {'LAX': True}})
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.score_cap('retail', 'C2'), 10.0)
+        self.assertEqual(table.score_cap('office', 'C2'), 5.0)
+        self.assertTrue(table.is_compatible('office', 'LAX'))
+        self.assertFalse(table.is_compatible('retail', 'LAX'))
+        self.assertEqual(table.plausibility_floor('retail'), 4.0)
+        self.assertEqual(table.plausibility_floor('office'), 1.0)
+    
+    def test_constraints_engine_uses_table(self):
+        """ZoningConstraintsEngine answers match its raw YAML configuration"""
+        engine = ZoningConstraintsEngine()
+        default = engine.default_unknown
+        for template in RULE_TEMPLATES:
+            for code in self.codes:
+                self.assertEqual(engine.get_score_cap(template, code),
+                                 engine.score_caps.get(template, {}).get(code, default['score_cap']))
+                self.assertEqual(engine.is_compatible(template, code),
+                                 engine.compatibility_matrix.get(template, {}).get(code, default['compatible']))
+    
+    def test_table_follows_constraints_edits(self):
+        """An edited constraints YAML reaches get_zoning_table as well as the shared engine"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.addCleanup(clear_registry)
+        config_path = os.path.join(temp_dir, 'zoning.yml')
+        shutil.copy(default_constraints_path(), config_path)
+        
+        with mock.patch('scoring.zoning_engine.default_constraints_path', return_value=config_path):
+            first = get_zoning_table()
+            self.assertIs(get_zoning_table(), first)
+            
+            with open(config_path, 'w') as f:
+                f.write("score_caps:\n  retail:\n    C2: 1.5\ndefault_unknown:\n"
+                        "  score_cap: 5.0\n  plausibility_floor: 1.0\n  compatible: false\n")
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            reloaded = get_zoning_table()
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(reloaded.score_cap('retail', 'C2'), 1.5)
+            self.assertEqual(get_zoning_engine().get_score_cap('retail', 'C2'), 1.5)
+    
+    def test_development_potential_bonus(self):
+        """Development potential uses the table's zoning bonus"""
+        self.assertEqual(development_zoning_bonus('c2-1vl'), 2.0)
+        self.assertEqual(development_zoning_bonus('RAS3'), 1.5)
+        self.assertEqual(development_zoning_bonus('R2'), 0.5)
+        self.assertEqual(development_zoning_bonus('M1'), 0.0)
+        
+        matrix = CSVFeatureMatrix.__new__(CSVFeatureMatrix)
+        features = {'zoning': 'r4', 'lot_size_sqft': 12000, 'transit_score': 60}
+        self.assertEqual(matrix._calculate_development_potential(features), 8.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
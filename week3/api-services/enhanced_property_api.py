@@ -5,11 +5,16 @@ Enhanced Property API - Returns comprehensive Week 1-2 intelligence data
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import sqlite3
 import json
+import sys
 import time
+from pathlib import Path
 from typing import Dict, Any
 
+# Repository root, for the shared connection manager
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from db.connection_manager import AsyncSQLiteConnectionManager
+
 app = FastAPI(title="DealGenie Enhanced Property API", version="2.0.0")
 
 # CORS middleware for web frontend
@@ -24,6 +29,13 @@ app.add_middleware(
 # Database configuration
 DB_PATH = "scraper/zimas_unified.db"
 
+# Read-only connections cached on worker threads, so requests neither reconnect nor block the event loop
+property_db = AsyncSQLiteConnectionManager(DB_PATH)
+
+@app.on_event("shutdown")
+async def close_property_db():
+    property_db.close()
+
 def get_comprehensive_intelligence(apn: str) -> Dict[str, Any]:
     """Get comprehensive Week 1-2 intelligence for a property"""
     
@@ -234,9 +246,6 @@ async def get_comprehensive_analysis(apn: str):
     
     try:
         # Get basic property data from database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         query = """
         SELECT 
             apn,
@@ -247,9 +256,7 @@ async def get_comprehensive_analysis(apn: str):
         WHERE apn = ?
         """
         
-        cursor.execute(query, (apn,))
-        result = cursor.fetchone()
-        conn.close()
+        result = await property_db.fetchone(query, (apn,))
         
         query_time = (time.time() - start_time) * 1000
         
@@ -352,9 +359,6 @@ async def get_property_score(apn: str):
     start_time = time.time()
     
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         query = """
         SELECT 
             apn,
@@ -365,9 +369,7 @@ async def get_property_score(apn: str):
         WHERE apn = ?
         """
         
-        cursor.execute(query, (apn,))
-        result = cursor.fetchone()
-        conn.close()
+        result = await property_db.fetchone(query, (apn,))
         
         query_time = (time.time() - start_time) * 1000
         
@@ -415,11 +417,7 @@ async def get_property_score(apn: str):
 async def health_check():
     """Health check endpoint"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM unified_property_data LIMIT 1")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = (await property_db.fetchone("SELECT COUNT(*) FROM unified_property_data LIMIT 1"))[0]
         
         return {
             "status": "healthy",
@@ -6,9 +6,15 @@ Property Search API - Geographic and filtered property search using search_idx_p
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 import sqlite3
+import sys
 import time
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+# Repository root, for the shared connection manager
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from db.connection_manager import AsyncSQLiteConnectionManager
+
 app = FastAPI(title="DealGenie Property Search API", version="1.0.0")
 
 # CORS middleware
@@ -22,6 +28,13 @@ app.add_middleware(
 
 SEARCH_DB = "search_idx_parcel.db"
 
+# Read-only connections cached on worker threads, so requests neither reconnect nor block the event loop
+search_db = AsyncSQLiteConnectionManager(SEARCH_DB)
+
+@app.on_event("shutdown")
+async def close_search_db():
+    search_db.close()
+
 @app.get("/")
 async def root():
     return {
@@ -50,9 +63,6 @@ async def search_geographic(
     start_time = time.time()
     
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        
         # Build query
         query = """
         SELECT apn, site_address, latitude, longitude, crime_score, crime_tier, 
@@ -75,9 +85,7 @@ async def search_geographic(
         
         query += f" LIMIT {limit}"
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        results = await search_db.fetchall(query, params)
         
         query_time = (time.time() - start_time) * 1000
         
@@ -122,9 +130,6 @@ async def search_address(
     start_time = time.time()
     
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        
         search_pattern = f"%{address.upper()}%"
         
         query = """
@@ -145,9 +150,7 @@ async def search_address(
         exact_match = address.upper()
         starts_with = f"{address.upper()}%"
         
-        cursor.execute(query, [search_pattern, exact_match, starts_with, limit])
-        results = cursor.fetchall()
-        conn.close()
+        results = await search_db.fetchall(query, [search_pattern, exact_match, starts_with, limit])
         
         query_time = (time.time() - start_time) * 1000
         
@@ -184,9 +187,6 @@ async def search_by_crime(
     start_time = time.time()
     
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        
         query = """
         SELECT apn, site_address, latitude, longitude, crime_score, crime_tier,
                property_type, zoning_code
@@ -202,9 +202,7 @@ async def search_by_crime(
         query += " ORDER BY crime_score ASC LIMIT ?"
         params.append(limit)
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        results = await search_db.fetchall(query, params)
         
         query_time = (time.time() - start_time) * 1000
         
@@ -246,9 +244,6 @@ async def search_proximity(
     start_time = time.time()
     
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        
         query = """
         SELECT apn, site_address, latitude, longitude, crime_score, crime_tier,
                property_type, zoning_code,
@@ -268,9 +263,7 @@ async def search_proximity(
         query += " ORDER BY distance ASC LIMIT ?"
         params.append(limit)
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        results = await search_db.fetchall(query, params)
         
         query_time = (time.time() - start_time) * 1000
         
@@ -306,44 +299,48 @@ async def search_proximity(
 async def get_statistics():
     """Get search database statistics"""
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        
-        # Basic counts
-        cursor.execute("SELECT COUNT(*) FROM search_idx_parcel")
-        total_properties = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM search_idx_parcel WHERE latitude IS NOT NULL AND longitude IS NOT NULL")
-        geo_properties = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM search_idx_parcel WHERE site_address IS NOT NULL")
-        address_properties = cursor.fetchone()[0]
-        
-        # Crime statistics
-        cursor.execute("SELECT AVG(crime_score), MIN(crime_score), MAX(crime_score) FROM search_idx_parcel")
-        avg_crime, min_crime, max_crime = cursor.fetchone()
-        
-        # Crime tier distribution
-        cursor.execute("""
-        SELECT crime_tier, COUNT(*) 
-        FROM search_idx_parcel 
-        GROUP BY crime_tier 
-        ORDER BY COUNT(*) DESC
-        """)
-        crime_tiers = dict(cursor.fetchall())
-        
-        # Property type distribution (top 10)
-        cursor.execute("""
-        SELECT property_type, COUNT(*) 
-        FROM search_idx_parcel 
-        WHERE property_type IS NOT NULL
-        GROUP BY property_type 
-        ORDER BY COUNT(*) DESC 
-        LIMIT 10
-        """)
-        property_types = dict(cursor.fetchall())
-        
-        conn.close()
+        def collect(conn: sqlite3.Connection) -> tuple:
+            cursor = conn.cursor()
+            
+            # Basic counts
+            cursor.execute("SELECT COUNT(*) FROM search_idx_parcel")
+            total_properties = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM search_idx_parcel WHERE latitude IS NOT NULL AND longitude IS NOT NULL")
+            geo_properties = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM search_idx_parcel WHERE site_address IS NOT NULL")
+            address_properties = cursor.fetchone()[0]
+            
+            # Crime statistics
+            cursor.execute("SELECT AVG(crime_score), MIN(crime_score), MAX(crime_score) FROM search_idx_parcel")
+            avg_crime, min_crime, max_crime = cursor.fetchone()
+            
+            # Crime tier distribution
+            cursor.execute("""
+            SELECT crime_tier, COUNT(*) 
+            FROM search_idx_parcel 
+            GROUP BY crime_tier 
+            ORDER BY COUNT(*) DESC
+            """)
+            crime_tiers = dict(cursor.fetchall())
+            
+            # Property type distribution (top 10)
+            cursor.execute("""
+            SELECT property_type, COUNT(*) 
+            FROM search_idx_parcel 
+            WHERE property_type IS NOT NULL
+            GROUP BY property_type 
+            ORDER BY COUNT(*) DESC 
+            LIMIT 10
+            """)
+            property_types = dict(cursor.fetchall())
+            
+            return (total_properties, geo_properties, address_properties,
+                    avg_crime, min_crime, max_crime, crime_tiers, property_types)
+        
+        (total_properties, geo_properties, address_properties,
+         avg_crime, min_crime, max_crime, crime_tiers, property_types) = await search_db.run(collect)
         
         return {
             "total_properties": total_properties,
@@ -369,11 +366,7 @@ async def get_statistics():
 async def health_check():
     """Health check endpoint"""
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM search_idx_parcel LIMIT 1")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = (await search_db.fetchone("SELECT COUNT(*) FROM search_idx_parcel LIMIT 1"))[0]
         
         return {
             "status": "healthy",
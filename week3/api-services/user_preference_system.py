@@ -21,6 +21,10 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from data_source_attribution import DataSourceLinkGenerator
 
+# Repository root, for the shared connection manager
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from db.connection_manager import get_connection_manager
+
 app = FastAPI(
     title="User-Customizable Property Search System", 
     version="4.0.0",
@@ -154,11 +158,9 @@ PREFERENCE_PROFILES = {
 }
 
 def get_db_connection():
-    """Get database connection"""
+    """Get this thread's cached read-only connection (close() releases it for reuse)"""
     try:
-        conn = sqlite3.connect(SEARCH_DB)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection_manager(SEARCH_DB, read_only=True, row_factory=sqlite3.Row).connection()
     except sqlite3.Error as e:
         raise HTTPException(status_code=500, detail=f"Database connection error: {str(e)}")
 